@@ -0,0 +1,428 @@
+"""
+Transported 연관성 측정 모듈
+
+컬럼형 데이터에 대해 통계적 연관성 지표를 NumPy 벡터 연산으로 계산합니다.
+
+- 수치형 컬럼: 점이연 상관계수(point-biserial correlation)
+- 불리언/범주형 컬럼: 카이제곱 통계량과 크라메르 V(Cramér's V)
+- 모든 컬럼: 상호정보량(mutual information, 수치형은 분위수 구간화 후 계산)
+
+부트스트랩 신뢰구간은 재표본 추출을 여러 프로세스로 나누어 계산합니다.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from columnar import ColumnarTable, parse_categorical_column
+
+DEFAULT_BINS = 10
+DEFAULT_RESAMPLES = 1000
+
+# 부트스트랩 한 묶음에서 만들 최대 셀 빈도 개수 (메모리 사용량 제한)
+BOOTSTRAP_BLOCK_ELEMENTS = 2_000_000
+
+
+def contingency_table(codes: np.ndarray, n_categories: int,
+                      target: np.ndarray) -> np.ndarray:
+    """
+    범주 코드와 Transported 값의 분할표를 만듭니다.
+
+    Args:
+        codes: 범주 코드 배열 (-1=결측)
+        n_categories: 범주 개수
+        target: Transported 3상태 배열 (1=True, 0=False, -1=결측)
+
+    Returns:
+        (범주 수 × 2) 빈도 배열. 0열은 False, 1열은 True입니다.
+    """
+    valid = (codes >= 0) & (target >= 0)
+    keys = codes[valid].astype(np.intp) * 2 + target[valid]
+    return np.bincount(keys, minlength=n_categories * 2).reshape(n_categories, 2)
+
+
+def chi_square(table: np.ndarray) -> np.ndarray:
+    """
+    분할표의 카이제곱 통계량을 계산합니다.
+
+    마지막 두 축을 분할표로 보고 앞쪽 축들은 일괄 처리하므로
+    (재표본 수 × 행 × 열) 배열도 한 번에 계산할 수 있습니다.
+
+    Args:
+        table: (..., 행, 열) 빈도 배열
+
+    Returns:
+        (...) 카이제곱 통계량 배열
+    """
+    table = np.asarray(table, dtype=np.float64)
+    total = table.sum(axis=(-2, -1), keepdims=True)
+    expected = table.sum(axis=-1, keepdims=True) * table.sum(axis=-2, keepdims=True)
+    # 빈도가 하나도 없는 분할표는 기대빈도를 0으로 두어 통계량이 0이 되게 함
+    expected = np.divide(expected, total, out=np.zeros_like(expected), where=total > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(expected > 0, (table - expected) ** 2 / expected, 0.0)
+    return terms.sum(axis=(-2, -1))
+
+
+def cramers_v(table: np.ndarray) -> np.ndarray:
+    """
+    분할표의 크라메르 V를 계산합니다. 빈도가 0인 행/열은 차원에서 제외됩니다.
+
+    Args:
+        table: (..., 행, 열) 빈도 배열
+
+    Returns:
+        (...) 0~1 사이의 크라메르 V 배열
+    """
+    table = np.asarray(table, dtype=np.float64)
+    total = table.sum(axis=(-2, -1))
+    rows = (table.sum(axis=-1) > 0).sum(axis=-1)
+    cols = (table.sum(axis=-2) > 0).sum(axis=-1)
+    degrees = np.minimum(rows, cols) - 1
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = np.sqrt(chi_square(table) / (total * degrees))
+    return np.where(degrees > 0, value, 0.0)
+
+
+def mutual_information(table: np.ndarray) -> np.ndarray:
+    """
+    분할표로부터 상호정보량(단위: bit)을 계산합니다.
+
+    Args:
+        table: (..., 행, 열) 빈도 배열
+
+    Returns:
+        (...) 상호정보량 배열
+    """
+    table = np.asarray(table, dtype=np.float64)
+    total = table.sum(axis=(-2, -1), keepdims=True)
+    # 빈도가 하나도 없는 분할표는 결합확률을 0으로 두어 상호정보량이 0이 되게 함
+    joint = np.divide(table, total, out=np.zeros_like(table), where=total > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        marginal = joint.sum(axis=-1, keepdims=True) * joint.sum(axis=-2, keepdims=True)
+        terms = np.where(joint > 0, joint * np.log2(joint / marginal), 0.0)
+    return terms.sum(axis=(-2, -1))
+
+
+def _compress(values: np.ndarray,
+              target: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (값, 타깃) 쌍을 고유한 셀과 빈도로 압축합니다.
+
+    점이연 상관계수는 (값, 타깃) 쌍의 경험분포에만 의존하므로, 나이처럼
+    고유값이 적은 컬럼은 행 수와 무관하게 작은 셀 배열로 계산할 수 있습니다.
+
+    Args:
+        values: 결측치가 없는 수치 배열
+        target: 0/1 배열
+
+    Returns:
+        (셀 값, 셀 타깃, 셀 빈도) 튜플
+    """
+    cell_values = []
+    cell_target = []
+    cell_counts = []
+    for label in (0, 1):
+        unique, counts = np.unique(values[target == label], return_counts=True)
+        cell_values.append(unique)
+        cell_target.append(np.full(len(unique), label, dtype=np.float64))
+        cell_counts.append(counts)
+    return (np.concatenate(cell_values), np.concatenate(cell_target),
+            np.concatenate(cell_counts).astype(np.float64))
+
+
+def _point_biserial(values: np.ndarray, target: np.ndarray,
+                    weights: np.ndarray) -> np.ndarray:
+    """
+    셀별 빈도(가중치)로부터 점이연 상관계수를 계산합니다.
+
+    가중치의 앞쪽 축들은 일괄 처리되므로 (재표본 수 × 셀 수) 빈도 배열을
+    넘기면 재표본별 상관계수를 행렬 곱 몇 번으로 구할 수 있습니다.
+
+    Args:
+        values: (셀 수,) 셀 값 배열
+        target: (셀 수,) 셀 타깃 배열 (0/1)
+        weights: (..., 셀 수) 셀 빈도 배열
+
+    Returns:
+        (...) 상관계수 배열
+    """
+    # 분산 계산 시 정밀도 손실을 줄이기 위해 평균 근처로 이동
+    centered = values - values.mean() if values.size else values
+    n = weights.sum(axis=-1)
+    n_true = weights @ target
+    n_false = n - n_true
+    total_sum = weights @ centered
+    true_sum = weights @ (centered * target)
+    square_sum = weights @ (centered * centered)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total_sum / n
+        std = np.sqrt(np.maximum(square_sum / n - mean * mean, 0.0))
+        true_mean = true_sum / n_true
+        false_mean = (total_sum - true_sum) / n_false
+        r = (true_mean - false_mean) / std * np.sqrt(n_true * n_false) / n
+    return np.where((std > 0) & (n_true > 0) & (n_false > 0), r, 0.0)
+
+
+def point_biserial(values: np.ndarray, target: np.ndarray) -> float:
+    """
+    수치형 컬럼과 Transported 사이의 점이연 상관계수를 계산합니다.
+
+    Args:
+        values: float64 배열 (결측치는 NaN)
+        target: Transported 3상태 배열
+
+    Returns:
+        -1~1 사이의 상관계수
+    """
+    valid = ~np.isnan(values) & (target >= 0)
+    return float(_point_biserial(values[valid], target[valid].astype(np.float64),
+                                 np.ones(int(valid.sum()))))
+
+
+def discretize(values: np.ndarray, n_bins: int = DEFAULT_BINS) -> Tuple[np.ndarray, int]:
+    """
+    수치형 배열을 분위수 기준 구간 코드로 변환합니다.
+
+    값이 몰려 있어 분위수 경계가 겹치면 구간 개수가 줄어듭니다.
+
+    Args:
+        values: float64 배열 (결측치는 NaN)
+        n_bins: 최대 구간 개수
+
+    Returns:
+        (구간 코드 배열, 구간 개수) 튜플. 결측치의 코드는 -1입니다.
+    """
+    present = ~np.isnan(values)
+    if not present.any():
+        return np.full(len(values), -1, dtype=np.intp), 0
+
+    edges = np.unique(np.quantile(values[present], np.linspace(0, 1, n_bins + 1)))
+    inner = edges[1:-1]
+    codes = np.searchsorted(inner, values, side='right').astype(np.intp)
+    codes[~present] = -1
+    return codes, len(inner) + 1
+
+
+def column_table(data: ColumnarTable, column_name: str,
+                 n_bins: int = DEFAULT_BINS) -> np.ndarray:
+    """
+    컬럼과 Transported의 분할표를 만듭니다. 수치형 컬럼은 구간화 후 집계합니다.
+
+    Args:
+        data: 데이터 테이블
+        column_name: 컬럼 이름
+        n_bins: 수치형 컬럼의 최대 구간 개수
+
+    Returns:
+        (범주 수 × 2) 빈도 배열
+    """
+    values = data[column_name]
+    kind = data.kind(column_name)
+
+    if kind == 'numeric':
+        codes, n_categories = discretize(values, n_bins)
+    elif kind == 'bool':
+        codes, n_categories = values, 2
+    elif kind == 'categorical':
+        codes, n_categories = values, len(data.categories[column_name])
+    else:
+        codes, labels = parse_categorical_column(values)
+        n_categories = len(labels)
+
+    return contingency_table(codes, n_categories, data['Transported'])
+
+
+def _resolve_measure(data: ColumnarTable, column_name: str, measure: str) -> str:
+    """
+    'auto' 지표를 컬럼 타입에 맞는 실제 지표 이름으로 바꿉니다.
+
+    Args:
+        data: 데이터 테이블
+        column_name: 컬럼 이름
+        measure: 'auto', 'point_biserial', 'cramers_v', 'mutual_info' 중 하나
+
+    Returns:
+        실제 지표 이름
+    """
+    if measure not in ('auto', 'point_biserial', 'cramers_v', 'mutual_info'):
+        raise ValueError(f'지원하지 않는 지표입니다: {measure}')
+    if measure == 'auto':
+        return 'point_biserial' if data.kind(column_name) == 'numeric' else 'cramers_v'
+    if measure == 'point_biserial' and data.kind(column_name) != 'numeric':
+        raise ValueError(f'점이연 상관계수는 수치형 컬럼에만 사용할 수 있습니다: {column_name}')
+    return measure
+
+
+def association(data: ColumnarTable, column_name: str, measure: str = 'auto',
+                n_bins: int = DEFAULT_BINS) -> float:
+    """
+    컬럼과 Transported 사이의 연관성 지표를 계산합니다.
+
+    'auto'는 수치형 컬럼에 점이연 상관계수의 절댓값을, 그 외 컬럼에
+    크라메르 V를 사용합니다. 이진 타깃에서 두 값은 모두 0~1 범위의
+    상관 크기이므로 서로 비교할 수 있습니다.
+
+    Args:
+        data: 데이터 테이블
+        column_name: 컬럼 이름
+        measure: 'auto', 'point_biserial', 'cramers_v', 'mutual_info' 중 하나
+        n_bins: 수치형 컬럼을 분할표로 만들 때의 최대 구간 개수
+
+    Returns:
+        연관성 값
+    """
+    measure = _resolve_measure(data, column_name, measure)
+    if measure == 'point_biserial':
+        return abs(point_biserial(data[column_name], data['Transported']))
+
+    table = column_table(data, column_name, n_bins)
+    if measure == 'cramers_v':
+        return float(cramers_v(table))
+    return float(mutual_information(table))
+
+
+def association_summary(data: ColumnarTable, column_name: str,
+                        n_bins: int = DEFAULT_BINS) -> Dict[str, float]:
+    """
+    컬럼의 모든 연관성 지표를 한 번에 계산합니다.
+
+    Args:
+        data: 데이터 테이블
+        column_name: 컬럼 이름
+        n_bins: 수치형 컬럼의 최대 구간 개수
+
+    Returns:
+        지표 이름별 값 딕셔너리 (수치형 컬럼에만 point_biserial 포함)
+    """
+    table = column_table(data, column_name, n_bins)
+    summary = {
+        'chi_square': float(chi_square(table)),
+        'cramers_v': float(cramers_v(table)),
+        'mutual_info': float(mutual_information(table)),
+    }
+    if data.kind(column_name) == 'numeric':
+        summary['point_biserial'] = point_biserial(data[column_name], data['Transported'])
+    return summary
+
+
+def rank_associations(data: ColumnarTable, columns: Sequence[str],
+                      measure: str = 'auto',
+                      n_bins: int = DEFAULT_BINS) -> List[Tuple[str, float]]:
+    """
+    후보 컬럼들을 연관성 지표 기준으로 정렬합니다.
+
+    Args:
+        data: 데이터 테이블
+        columns: 후보 컬럼 이름 리스트
+        measure: association 함수의 지표 이름
+        n_bins: 수치형 컬럼의 최대 구간 개수
+
+    Returns:
+        (컬럼 이름, 연관성 값) 튜플 리스트 (값 내림차순)
+    """
+    scores = [(name, association(data, name, measure, n_bins))
+              for name in columns if name in data]
+    return sorted(scores, key=lambda item: item[1], reverse=True)
+
+
+def _bootstrap_worker(task: Tuple) -> np.ndarray:
+    """
+    부트스트랩 재표본 통계량을 계산합니다. 프로세스 풀에서 실행됩니다.
+
+    행 단위 복원 추출은 셀(분할표 칸 또는 고유한 (값, 타깃) 쌍)에 대한
+    다항분포 추출과 같으므로, 행을 직접 뽑지 않고 셀 빈도를 추출합니다.
+
+    Args:
+        task: (지표 이름, 데이터, 재표본 수, 시드 시퀀스) 튜플.
+              데이터는 분할표 지표면 분할표, 점이연 상관계수면
+              (셀 값, 셀 타깃, 셀 빈도) 튜플입니다.
+
+    Returns:
+        재표본별 통계량 배열
+    """
+    measure, payload, n_resamples, seed = task
+    rng = np.random.default_rng(seed)
+
+    if measure == 'point_biserial':
+        cell_values, cell_target, cell_counts = payload
+        total = int(cell_counts.sum())
+        probabilities = cell_counts / total
+        block = max(1, BOOTSTRAP_BLOCK_ELEMENTS // max(len(cell_counts), 1))
+        results = []
+        for start in range(0, n_resamples, block):
+            size = min(block, n_resamples - start)
+            weights = rng.multinomial(total, probabilities, size=size).astype(np.float64)
+            results.append(np.abs(_point_biserial(cell_values, cell_target, weights)))
+        return np.concatenate(results) if results else np.empty(0)
+
+    table = payload
+    total = int(table.sum())
+    samples = rng.multinomial(total, table.ravel() / total, size=n_resamples)
+    samples = samples.reshape(n_resamples, *table.shape)
+    if measure == 'cramers_v':
+        return cramers_v(samples)
+    return mutual_information(samples)
+
+
+def bootstrap_interval(data: ColumnarTable, column_name: str, measure: str = 'auto',
+                       n_resamples: int = DEFAULT_RESAMPLES, confidence: float = 0.95,
+                       workers: Optional[int] = None, seed: Optional[int] = None,
+                       n_bins: int = DEFAULT_BINS) -> Tuple[float, float]:
+    """
+    연관성 지표의 부트스트랩 백분위 신뢰구간을 계산합니다.
+
+    재표본 추출은 workers개의 프로세스에 나누어 실행되며, 행을 다시 뽑는 대신
+    셀 빈도에 대한 다항분포 추출로 계산하므로 비용이 행 수가 아닌 셀 수에 비례합니다.
+
+    Args:
+        data: 데이터 테이블
+        column_name: 컬럼 이름
+        measure: association 함수의 지표 이름
+        n_resamples: 재표본 개수
+        confidence: 신뢰수준 (0~1)
+        workers: 프로세스 개수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+        seed: 난수 시드
+
+    Returns:
+        (하한, 상한) 튜플 (값과 Transported가 모두 있는 행이 없으면 (nan, nan))
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f'신뢰수준은 0과 1 사이여야 합니다: {confidence}')
+    if n_resamples <= 0:
+        raise ValueError(f'재표본 개수는 양수여야 합니다: {n_resamples}')
+
+    measure = _resolve_measure(data, column_name, measure)
+    if measure == 'point_biserial':
+        values = data[column_name]
+        target = data['Transported']
+        valid = ~np.isnan(values) & (target >= 0)
+        payload = _compress(values[valid], target[valid])
+    else:
+        payload = column_table(data, column_name, n_bins)
+
+    # 관측치가 없으면 다항분포 확률이 0/0이 되어 재표본을 뽑을 수 없음
+    observed = payload[2].sum() if measure == 'point_biserial' else payload.sum()
+    if observed == 0:
+        return float('nan'), float('nan')
+
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, n_resamples))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    counts = [len(part) for part in np.array_split(np.arange(n_resamples), workers)]
+    tasks = [(measure, payload, count, child) for count, child in zip(counts, seeds)]
+
+    if workers == 1:
+        results = [_bootstrap_worker(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_bootstrap_worker, tasks))
+
+    statistics = np.concatenate(results)
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(statistics, [tail, 100 - tail])
+    return float(low), float(high)
@@ -0,0 +1,144 @@
+"""
+Spaceship Titanic 분석 벤치마크 스크립트
+
+train.csv 규모와 100배 복제한 합성 데이터에서 분석 함수들의 실행 시간을 측정합니다.
+"""
+
+import os
+import time
+from typing import Callable
+
+import numpy as np
+
+from association import bootstrap_interval, rank_associations
+from columnar import ColumnarTable
+from main import (calculate_correlation, count_age_group_tables, get_age_group,
+                  rank_correlated_columns, read_csv_file)
+
+REPLICA_FACTOR = 100
+REPEAT = 5
+
+
+def replicate_table(table: ColumnarTable, factor: int) -> ColumnarTable:
+    """
+    테이블의 모든 행을 factor배로 복제한 합성 테이블을 만듭니다.
+
+    Args:
+        table: 원본 테이블
+        factor: 복제 배수
+
+    Returns:
+        복제된 ColumnarTable 객체
+    """
+    columns = {name: np.tile(values, factor) for name, values in table.columns.items()}
+    return ColumnarTable(table.headers, columns, dict(table.categories),
+                         len(table) * factor)
+
+
+def measure(func: Callable[[], object], repeat: int = REPEAT) -> float:
+    """
+    함수를 여러 번 실행하여 가장 짧은 실행 시간(초)을 반환합니다.
+
+    Args:
+        func: 측정할 함수
+        repeat: 반복 횟수
+
+    Returns:
+        최소 실행 시간(초)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_relevance(table: ColumnarTable, label: str) -> None:
+    """
+    컬럼별 calculate_correlation 반복 호출과 일괄 순위 계산을 비교합니다.
+
+    Args:
+        table: 측정할 테이블
+        label: 출력용 데이터 이름
+    """
+    excluded_columns = {'PassengerId', 'Name', 'Transported', 'Cabin'}
+    target_columns = [h for h in table.headers if h not in excluded_columns]
+
+    per_column = measure(
+        lambda: [calculate_correlation(table, column) for column in target_columns])
+    single_scan = measure(lambda: rank_correlated_columns(table, table.headers))
+
+    print(f'[{label}] {len(table):,}행, 후보 컬럼 {len(target_columns)}개')
+    print(f'  컬럼별 calculate_correlation: {per_column * 1000:.2f} ms')
+    print(f'  일괄 rank_correlated_columns: {single_scan * 1000:.2f} ms '
+          f'({per_column / single_scan:.1f}배)')
+
+
+def benchmark_association(table: ColumnarTable, label: str) -> None:
+    """
+    연관성 지표 순위와 부트스트랩 신뢰구간 계산 시간을 측정합니다.
+
+    Args:
+        table: 측정할 테이블
+        label: 출력용 데이터 이름
+    """
+    excluded_columns = {'PassengerId', 'Name', 'Transported', 'Cabin'}
+    target_columns = [h for h in table.headers if h not in excluded_columns]
+
+    ranking = measure(lambda: rank_associations(table, target_columns), repeat=3)
+    mutual_info = measure(
+        lambda: rank_associations(table, target_columns, 'mutual_info'), repeat=3)
+    categorical_ci = measure(
+        lambda: bootstrap_interval(table, 'CryoSleep', n_resamples=1000, seed=0), repeat=1)
+    numeric_ci = measure(
+        lambda: bootstrap_interval(table, 'Age', n_resamples=200, seed=0), repeat=1)
+
+    print(f'[{label}] {len(table):,}행')
+    print(f'  rank_associations (auto): {ranking * 1000:.2f} ms')
+    print(f'  rank_associations (mutual_info): {mutual_info * 1000:.2f} ms')
+    print(f'  CryoSleep 부트스트랩 1000회: {categorical_ci * 1000:.2f} ms')
+    print(f'  Age 부트스트랩 200회: {numeric_ci * 1000:.2f} ms')
+
+
+def benchmark_age_tables(table: ColumnarTable, label: str) -> None:
+    """
+    행 단위 get_age_group 호출과 벡터화된 연령대 빈도표 계산을 비교합니다.
+
+    Args:
+        table: 측정할 테이블
+        label: 출력용 데이터 이름
+    """
+    ages = table['Age'].tolist()
+    per_row = measure(lambda: [get_age_group(age) for age in ages if age == age], repeat=1)
+    vectorized = measure(lambda: count_age_group_tables(table))
+
+    print(f'[{label}] {len(table):,}행')
+    print(f'  행 단위 get_age_group: {per_row * 1000:.2f} ms')
+    print(f'  count_age_group_tables: {vectorized * 1000:.2f} ms '
+          f'({per_row / vectorized:.1f}배)')
+
+
+def main():
+    """메인 함수"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    train_path = os.path.join(base_dir, 'spaceship-titanic', 'train.csv')
+
+    _, train_data = read_csv_file(train_path)
+    replica = replicate_table(train_data, REPLICA_FACTOR)
+
+    print('관련성 계산 벤치마크')
+    benchmark_relevance(train_data, 'train.csv')
+    benchmark_relevance(replica, f'train.csv x{REPLICA_FACTOR}')
+
+    print('\n연령대 빈도표 벤치마크')
+    benchmark_age_tables(train_data, 'train.csv')
+    benchmark_age_tables(replica, f'train.csv x{REPLICA_FACTOR}')
+
+    print('\n연관성 지표 벤치마크')
+    benchmark_association(train_data, 'train.csv')
+    benchmark_association(replica, f'train.csv x{REPLICA_FACTOR}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+구간화 및 그룹별 빈도 집계 모듈
+
+수치 컬럼 전체를 구간 경계 배열과 np.searchsorted로 한 번에 구간 코드로
+바꾸고, 여러 코드 배열을 결합 키 하나로 묶어 np.bincount로 다차원 빈도표를
+만듭니다.
+"""
+
+from bisect import bisect_right
+from typing import Optional, Sequence
+
+import numpy as np
+
+MISSING_CODE = -1
+
+
+class BinDefinition:
+    """
+    구간 경계와 구간 이름의 정의입니다.
+
+    경계 [e0, e1, ..., ek]는 (-inf, e0), [e0, e1), ..., [ek, inf)의
+    k + 2개 구간을 만들며, labels는 구간마다 하나씩 있어야 합니다.
+    """
+
+    def __init__(self, edges: Sequence[float], labels: Sequence[str]):
+        edges = np.asarray(edges, dtype=np.float64)
+        if edges.ndim != 1 or np.any(np.diff(edges) <= 0):
+            raise ValueError('구간 경계는 오름차순이어야 합니다.')
+        if len(labels) != len(edges) + 1:
+            raise ValueError(f'구간 이름은 {len(edges) + 1}개여야 합니다: {len(labels)}개')
+
+        self.edges = edges
+        self.labels = list(labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def codes(self, values: np.ndarray) -> np.ndarray:
+        """
+        수치 배열 전체를 구간 코드 배열로 변환합니다.
+
+        Args:
+            values: float64 배열 (결측치는 NaN)
+
+        Returns:
+            int16 구간 코드 배열 (결측치는 -1)
+        """
+        codes = np.searchsorted(self.edges, values, side='right').astype(np.int16)
+        codes[np.isnan(values)] = MISSING_CODE
+        return codes
+
+    def label(self, value: Optional[float]) -> Optional[str]:
+        """
+        값 하나의 구간 이름을 반환합니다.
+
+        Args:
+            value: 수치 값
+
+        Returns:
+            구간 이름 또는 None
+        """
+        if value is None or value != value:
+            return None
+        return self.labels[bisect_right(self.edges.tolist(), value)]
+
+
+# 나이를 정수로 내린 뒤 10살 단위로 나누던 기존 규칙과 같은 구간
+AGE_BINS = BinDefinition(
+    edges=[10, 20, 30, 40, 50, 60, 70, 80],
+    labels=['10대 미만', '10대', '20대', '30대', '40대', '50대', '60대', '70대', '70대 이상'],
+)
+
+
+def grouped_counts(codes: Sequence[np.ndarray], sizes: Sequence[int],
+                   include_missing: bool = False) -> np.ndarray:
+    """
+    여러 코드 배열의 조합별 빈도를 하나의 bincount로 계산합니다.
+
+    각 코드 c(-1=결측)를 c + 1로 옮겨 혼합 진법 키로 결합하므로, 결측치가
+    있는 행도 마스킹 없이 별도의 칸에 모입니다.
+
+    Args:
+        codes: 같은 길이의 코드 배열 리스트
+        sizes: 각 코드의 범주 개수
+        include_missing: True면 각 축의 0번 칸에 결측치 빈도를 남김
+
+    Returns:
+        축마다 범주 수(include_missing이면 범주 수 + 1)인 int64 빈도 배열
+    """
+    if len(codes) != len(sizes):
+        raise ValueError('코드 배열과 범주 개수의 길이가 다릅니다.')
+
+    shape = [size + 1 for size in sizes]
+    keys = np.zeros(len(codes[0]) if codes else 0, dtype=np.intp)
+    for code, width in zip(codes, shape):
+        keys *= width
+        keys += code
+        keys += 1
+
+    counts = np.bincount(keys, minlength=int(np.prod(shape))).reshape(shape)
+    if include_missing:
+        return counts
+    return counts[(slice(1, None),) * len(shape)]
+
+
+def table_to_dict(counts: np.ndarray, row_labels: Sequence[str],
+                  column_labels: Sequence[str]) -> dict:
+    """
+    2차원 빈도표를 중첩 딕셔너리로 변환합니다. 빈도가 0인 행은 제외됩니다.
+
+    Args:
+        counts: (행 × 열) 빈도 배열
+        row_labels: 행 이름 리스트
+        column_labels: 열 이름 리스트
+
+    Returns:
+        {행 이름: {열 이름: 빈도}} 딕셔너리
+    """
+    result = {}
+    for label, row in zip(row_labels, counts.tolist()):
+        if any(row):
+            result[label] = dict(zip(column_labels, row))
+    return result
+
+
+def nonzero_table_to_dict(counts: np.ndarray, row_labels: Sequence[str],
+                          column_labels: Sequence[str]) -> dict:
+    """
+    2차원 빈도표를 빈도가 0인 칸을 뺀 중첩 딕셔너리로 변환합니다.
+
+    Args:
+        counts: (행 × 열) 빈도 배열
+        row_labels: 행 이름 리스트
+        column_labels: 열 이름 리스트
+
+    Returns:
+        {행 이름: {열 이름: 빈도}} 딕셔너리
+    """
+    result = {}
+    for label, row in zip(row_labels, counts.tolist()):
+        cells = {column: count for column, count in zip(column_labels, row) if count}
+        if cells:
+            result[label] = cells
+    return result
+
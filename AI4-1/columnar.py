@@ -0,0 +1,441 @@
+"""
+Spaceship Titanic 컬럼형 데이터 로더
+
+CSV 파일의 각 컬럼을 한 번만 파싱하여 타입이 지정된 NumPy 배열로 보관합니다.
+분석 함수들은 문자열을 다시 변환하지 않고 이 배열을 그대로 사용합니다.
+"""
+
+import csv
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+# 컬럼별 저장 타입
+NUMERIC_COLUMNS = ('Age', 'RoomService', 'FoodCourt', 'ShoppingMall', 'Spa', 'VRDeck')
+BOOL_COLUMNS = ('CryoSleep', 'VIP', 'Transported')
+CATEGORICAL_COLUMNS = ('HomePlanet', 'Destination')
+
+# 불리언/범주형 컬럼의 결측 코드
+MISSING_CODE = -1
+
+
+def get_column_kind(column_name: str) -> str:
+    """
+    컬럼 이름에 해당하는 저장 타입을 반환합니다.
+
+    Args:
+        column_name: 컬럼 이름
+
+    Returns:
+        'numeric', 'bool', 'categorical', 'string' 중 하나
+    """
+    if column_name in NUMERIC_COLUMNS:
+        return 'numeric'
+    if column_name in BOOL_COLUMNS:
+        return 'bool'
+    if column_name in CATEGORICAL_COLUMNS:
+        return 'categorical'
+    return 'string'
+
+
+def parse_numeric_column(values: np.ndarray) -> np.ndarray:
+    """
+    문자열 배열을 float64 배열로 변환합니다. 빈 값과 변환 불가능한 값은 NaN이 됩니다.
+
+    Args:
+        values: 문자열 배열
+
+    Returns:
+        float64 배열
+    """
+    result = np.full(len(values), np.nan, dtype=np.float64)
+    mask = values != ''
+    if not mask.any():
+        return result
+
+    try:
+        result[mask] = values[mask].astype(np.float64)
+    except ValueError:
+        # 변환 불가능한 값이 섞여 있으면 값 단위로 변환
+        for index in np.flatnonzero(mask):
+            try:
+                result[index] = float(values[index])
+            except ValueError:
+                pass
+    return result
+
+
+def parse_bool_column(values: np.ndarray) -> np.ndarray:
+    """
+    문자열 배열을 int8 3상태 배열(1=True, 0=False, -1=결측)로 변환합니다.
+
+    Args:
+        values: 문자열 배열
+
+    Returns:
+        int8 배열
+    """
+    result = np.full(len(values), MISSING_CODE, dtype=np.int8)
+    if len(values) == 0:
+        return result
+
+    lowered = np.char.lower(values)
+    result[lowered == 'true'] = 1
+    result[lowered == 'false'] = 0
+    return result
+
+
+def parse_categorical_column(values: np.ndarray) -> Tuple[np.ndarray, List[str]]:
+    """
+    문자열 배열을 사전 인코딩된 int16 코드 배열로 변환합니다.
+
+    Args:
+        values: 문자열 배열
+
+    Returns:
+        (코드 배열, 범주 리스트) 튜플. 빈 값의 코드는 -1입니다.
+    """
+    labels, inverse = np.unique(values, return_inverse=True)
+    codes = inverse.astype(np.int16).reshape(-1)
+
+    # 빈 문자열은 정렬 시 항상 맨 앞에 오므로 코드를 한 칸씩 당겨 -1로 만듦
+    if labels.size and labels[0] == '':
+        codes -= 1
+        labels = labels[1:]
+    return codes, labels.tolist()
+
+
+class ColumnarTable:
+    """
+    컬럼별로 타입이 지정된 배열을 보관하는 테이블입니다.
+
+    - 수치형 컬럼: float64 배열 (결측치는 NaN)
+    - 불리언 컬럼: int8 배열 (1=True, 0=False, -1=결측)
+    - 범주형 컬럼: int16 코드 배열 (-1=결측) + categories의 범주 리스트
+    - 그 외 컬럼: 문자열 배열
+    """
+
+    def __init__(self, headers: Sequence[str], columns: Dict[str, np.ndarray],
+                 categories: Dict[str, List[str]], length: int):
+        self.headers = list(headers)
+        self.columns = columns
+        self.categories = categories
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, column_name):
+        return column_name in self.columns
+
+    def __getitem__(self, column_name):
+        return self.columns[column_name]
+
+    def kind(self, column_name: str) -> str:
+        """컬럼의 저장 타입을 반환합니다."""
+        return get_column_kind(column_name)
+
+    def decode(self, column_name: str) -> np.ndarray:
+        """
+        범주형 컬럼의 코드를 원래 문자열로 복원합니다.
+
+        Args:
+            column_name: 범주형 컬럼 이름
+
+        Returns:
+            문자열 배열 (결측치는 빈 문자열)
+        """
+        labels = np.array(self.categories[column_name] + [''], dtype=str)
+        # 코드 -1은 마지막 원소인 빈 문자열을 가리킴
+        return labels[self.columns[column_name]]
+
+    def chunks(self, *column_names: str) -> Iterator[Tuple[np.ndarray, ...]]:
+        """
+        지정한 컬럼들의 배열 튜플을 반환합니다. ConcatView와 같은 방식으로
+        나누어 처리할 수 있도록 튜플 하나만 내보냅니다.
+
+        Args:
+            *column_names: 컬럼 이름들 (없는 컬럼은 가상의 결측치 배열)
+
+        Yields:
+            (컬럼 배열, ...) 튜플
+        """
+        yield tuple(self.columns[name] if name in self.columns
+                    else missing_column(name, self._length)
+                    for name in column_names)
+
+
+def build_columnar_table(headers: Sequence[str],
+                         raw_columns: Dict[str, np.ndarray]) -> ColumnarTable:
+    """
+    문자열 컬럼 배열들을 한 번씩 파싱하여 ColumnarTable을 만듭니다.
+
+    Args:
+        headers: 컬럼 이름 리스트
+        raw_columns: 컬럼 이름별 문자열 배열
+
+    Returns:
+        ColumnarTable 객체
+    """
+    columns = {}
+    categories = {}
+    length = 0
+
+    for name in headers:
+        values = raw_columns[name]
+        length = len(values)
+        kind = get_column_kind(name)
+
+        if kind == 'numeric':
+            columns[name] = parse_numeric_column(values)
+        elif kind == 'bool':
+            columns[name] = parse_bool_column(values)
+        elif kind == 'categorical':
+            columns[name], categories[name] = parse_categorical_column(values)
+        else:
+            columns[name] = values
+
+    return ColumnarTable(headers, columns, categories, length)
+
+
+def read_csv_columnar(file_path: str) -> ColumnarTable:
+    """
+    CSV 파일을 읽어서 컬럼별로 타입이 지정된 테이블을 반환합니다.
+
+    Args:
+        file_path: 읽을 CSV 파일의 경로
+
+    Returns:
+        ColumnarTable 객체
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        headers = next(reader, [])
+        rows = [row for row in reader if row]
+
+    # 행 단위 리스트를 컬럼 단위 튜플로 전치
+    transposed = list(zip(*rows)) if rows else [() for _ in headers]
+    raw_columns = {
+        name: np.array(values, dtype=str)
+        for name, values in zip(headers, transposed)
+    }
+    return build_columnar_table(headers, raw_columns)
+
+
+def missing_column(column_name: str, length: int) -> np.ndarray:
+    """
+    존재하지 않는 컬럼을 대신할 가상의 결측치 배열을 만듭니다.
+
+    스칼라 하나를 길이만큼 브로드캐스트한 읽기 전용 뷰이므로 길이와 무관하게
+    추가 메모리를 쓰지 않습니다.
+
+    Args:
+        column_name: 컬럼 이름
+        length: 배열 길이
+
+    Returns:
+        컬럼 타입에 맞는 결측치 배열 (읽기 전용)
+    """
+    kind = get_column_kind(column_name)
+    if kind == 'numeric':
+        fill = np.array(np.nan, dtype=np.float64)
+    elif kind == 'bool':
+        fill = np.array(MISSING_CODE, dtype=np.int8)
+    elif kind == 'categorical':
+        fill = np.array(MISSING_CODE, dtype=np.int16)
+    else:
+        fill = np.array('', dtype=str)
+    return np.broadcast_to(fill, (length,))
+
+
+def _recode_mapping(source: List[str], target_index: Dict[str, int]) -> np.ndarray:
+    """
+    원래 범주 코드를 다른 범주 리스트 기준의 코드로 바꾸는 대응 배열을 만듭니다.
+
+    Args:
+        source: 원래 범주 리스트
+        target_index: 새 범주별 코드 딕셔너리
+
+    Returns:
+        원래 코드로 인덱싱하면 새 코드가 나오는 int16 배열
+        (마지막 원소가 -1이므로 결측 코드 -1은 그대로 유지)
+    """
+    return np.array([target_index[label] for label in source] + [MISSING_CODE],
+                    dtype=np.int16)
+
+
+class ConcatView:
+    """
+    여러 테이블을 복사하지 않고 세로로 이어 붙인 것처럼 보여주는 뷰입니다.
+
+    병합 시에는 원본 테이블의 참조와 행 오프셋만 보관하므로 시간과 메모리가
+    행 수와 무관하며, 원본 테이블은 변경되지 않습니다. 한쪽 테이블에만 있는
+    컬럼(test 데이터의 Transported 등)은 다른 쪽에서 가상의 결측치 컬럼으로
+    보입니다.
+
+    - chunks(): 원본별 배열을 차례로 돌려주므로 빈도 집계처럼 나누어 계산할
+      수 있는 작업은 전체 컬럼을 만들지 않고 처리할 수 있습니다.
+    - view[컬럼 이름]: 필요할 때 해당 컬럼만 이어 붙여 만듭니다.
+    - locate()/row()/iter_rows(): 전체 행 번호를 원본 테이블의 행으로 대응시킵니다.
+    """
+
+    def __init__(self, sources: Sequence[ColumnarTable]):
+        self.sources = list(sources)
+        self.headers = []
+        for source in self.sources:
+            self.headers.extend(h for h in source.headers if h not in self.headers)
+
+        # 범주형 컬럼은 범주 리스트만 합치고, 코드는 읽을 때 변환
+        self.categories = {}
+        for name in self.headers:
+            if get_column_kind(name) == 'categorical':
+                labels = set()
+                for source in self.sources:
+                    labels.update(source.categories.get(name, []))
+                self.categories[name] = sorted(labels)
+
+        # 원본별 코드 대응 배열은 한 번만 만들어 두고 컬럼/행 조회 때 재사용
+        # (범주 리스트가 공통 리스트와 같은 원본은 변환이 필요 없으므로 제외)
+        self._mappings = []
+        for source in self.sources:
+            mappings = {}
+            for name, target_labels in self.categories.items():
+                source_labels = source.categories.get(name)
+                if source_labels is not None and source_labels != target_labels:
+                    index = {label: code for code, label in enumerate(target_labels)}
+                    mappings[name] = _recode_mapping(source_labels, index)
+            self._mappings.append(mappings)
+
+        self._offsets = [0]
+        for source in self.sources:
+            self._offsets.append(self._offsets[-1] + len(source))
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def __contains__(self, column_name):
+        return any(column_name in source for source in self.sources)
+
+    def __getitem__(self, column_name):
+        if column_name not in self:
+            raise KeyError(column_name)
+        arrays = [arrays[0] for arrays in self.chunks(column_name)]
+        return np.concatenate(arrays) if arrays else missing_column(column_name, 0)
+
+    def kind(self, column_name: str) -> str:
+        """컬럼의 저장 타입을 반환합니다."""
+        return get_column_kind(column_name)
+
+    def decode(self, column_name: str) -> np.ndarray:
+        """
+        범주형 컬럼의 코드를 원래 문자열로 복원합니다.
+
+        Args:
+            column_name: 범주형 컬럼 이름
+
+        Returns:
+            문자열 배열 (결측치는 빈 문자열)
+        """
+        labels = np.array(self.categories[column_name] + [''], dtype=str)
+        return labels[self[column_name]]
+
+    def _source_column(self, source_index: int, column_name: str) -> np.ndarray:
+        """
+        원본 테이블의 컬럼을 뷰 기준(공통 범주 코드, 가상 결측 컬럼)으로 반환합니다.
+
+        Args:
+            source_index: 원본 테이블 번호
+            column_name: 컬럼 이름
+
+        Returns:
+            원본 행 수 길이의 배열
+        """
+        source = self.sources[source_index]
+        if column_name not in source:
+            return missing_column(column_name, len(source))
+
+        values = source[column_name]
+        mapping = self._mappings[source_index].get(column_name)
+        return values if mapping is None else mapping[values]
+
+    def chunks(self, *column_names: str) -> Iterator[Tuple[np.ndarray, ...]]:
+        """
+        원본 테이블별로 지정한 컬럼들의 배열 튜플을 차례로 반환합니다.
+
+        Args:
+            *column_names: 컬럼 이름들
+
+        Yields:
+            원본 테이블 하나에 대한 (컬럼 배열, ...) 튜플
+        """
+        for source_index in range(len(self.sources)):
+            yield tuple(self._source_column(source_index, name) for name in column_names)
+
+    def locate(self, index: int) -> Tuple[int, int]:
+        """
+        전체 행 번호를 (원본 테이블 번호, 원본 행 번호)로 변환합니다.
+
+        Args:
+            index: 전체 행 번호 (음수는 뒤에서부터)
+
+        Returns:
+            (원본 테이블 번호, 원본 행 번호) 튜플
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        source_index = bisect_right(self._offsets, index) - 1
+        return source_index, index - self._offsets[source_index]
+
+    def row(self, index: int) -> Dict[str, object]:
+        """
+        전체 행 번호에 해당하는 행을 컬럼 이름별 값 딕셔너리로 반환합니다.
+
+        Args:
+            index: 전체 행 번호
+
+        Returns:
+            {컬럼 이름: 값} 딕셔너리 (범주형 컬럼은 문자열, 결측 범주는 빈 문자열)
+        """
+        source_index, local_index = self.locate(index)
+        source = self.sources[source_index]
+        mappings = self._mappings[source_index]
+        row = {}
+        for name in self.headers:
+            # 컬럼 전체를 변환하지 않고 이 행의 값(범주는 코드 하나)만 읽음
+            if name in source:
+                value = source[name][local_index]
+            else:
+                value = missing_column(name, 1)[0]
+            if get_column_kind(name) == 'categorical':
+                if name in mappings:
+                    value = mappings[name][value]
+                value = self.categories[name][value] if value >= 0 else ''
+            row[name] = value.item() if isinstance(value, np.generic) else value
+        return row
+
+    def iter_rows(self) -> Iterator[Dict[str, object]]:
+        """
+        모든 원본 테이블의 행을 차례로 반환합니다.
+
+        Yields:
+            row()와 같은 형식의 행 딕셔너리
+        """
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def materialize(self) -> ColumnarTable:
+        """
+        뷰의 모든 컬럼을 이어 붙여 실제 ColumnarTable로 만듭니다.
+
+        Returns:
+            병합된 ColumnarTable 객체
+        """
+        columns = {name: self[name] for name in self.headers}
+        return ColumnarTable(self.headers, columns, dict(self.categories), len(self))
+
+
+# ColumnarTable과 ConcatView 모두 받는 함수의 타입 표기용
+AnyTable = Union[ColumnarTable, ConcatView]
@@ -0,0 +1,216 @@
+"""
+Spaceship Titanic 빈도 큐브 모듈
+
+카디널리티가 낮은 차원(HomePlanet, CryoSleep, Destination, VIP, 연령대,
+Transported)의 모든 조합별 인원 수를 하나의 다차원 배열로 미리 계산합니다.
+그래프와 리포트에 필요한 1차원/2차원 집계는 이 배열의 축을 합산하여 얻으며,
+큐브는 입력 파일 해시와 큐브 정의로 만든 키로 디스크에 저장되어 다음 실행에서
+재사용됩니다. 키 계산은 호출하는 쪽에서 공용 빌드 캐시(common.build_cache)로 합니다.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from binning import AGE_BINS, BinDefinition, grouped_counts
+from columnar import AnyTable
+
+CUBE_VERSION = 1
+AGE_DIMENSION = 'AgeGroup'
+CUBE_DIMENSIONS = ('HomePlanet', 'CryoSleep', 'Destination', 'VIP',
+                   AGE_DIMENSION, 'Transported')
+BOOL_LABELS = ['False', 'True']
+
+
+class CountCube:
+    """
+    차원 조합별 빈도를 보관하는 다차원 배열입니다.
+
+    각 축의 0번 칸은 결측치 빈도이고, 1번 칸부터 labels의 범주 순서를 따릅니다.
+    """
+
+    def __init__(self, dimensions: Sequence[str], labels: Dict[str, List[str]],
+                 counts: np.ndarray):
+        self.dimensions = list(dimensions)
+        self.labels = labels
+        self.counts = counts
+
+    def __len__(self):
+        return int(self.counts.sum())
+
+    def marginal(self, *dimensions: str, include_missing: bool = False) -> np.ndarray:
+        """
+        지정한 차원들의 빈도표를 나머지 축을 합산하여 반환합니다.
+
+        Args:
+            *dimensions: 남길 차원 이름들 (반환 배열의 축 순서)
+            include_missing: True면 각 축의 0번 칸에 결측치 빈도를 남김
+
+        Returns:
+            지정한 차원 순서의 빈도 배열
+        """
+        unknown = [name for name in dimensions if name not in self.dimensions]
+        if unknown:
+            raise KeyError(f'큐브에 없는 차원입니다: {unknown}')
+
+        axes = [self.dimensions.index(name) for name in dimensions]
+        other_axes = tuple(i for i in range(len(self.dimensions)) if i not in axes)
+        table = self.counts.sum(axis=other_axes)
+
+        # 합산 후 남은 축은 원래 순서이므로 요청한 순서로 재배치
+        order = sorted(axes)
+        table = np.transpose(table, [order.index(axis) for axis in axes])
+        if include_missing:
+            return table
+        return table[(slice(1, None),) * len(dimensions)]
+
+
+def build_cube(data: AnyTable, bins: BinDefinition = AGE_BINS) -> CountCube:
+    """
+    데이터 테이블로부터 빈도 큐브를 만듭니다.
+
+    Args:
+        data: 데이터 테이블
+        bins: 연령대 구간 정의
+
+    Returns:
+        CountCube 객체
+    """
+    labels = {}
+    for name in CUBE_DIMENSIONS:
+        if name == AGE_DIMENSION:
+            labels[name] = list(bins.labels)
+        elif data.kind(name) == 'bool':
+            labels[name] = list(BOOL_LABELS)
+        else:
+            labels[name] = list(data.categories[name])
+    sizes = [len(labels[name]) for name in CUBE_DIMENSIONS]
+
+    # 큐브는 행 단위로 더할 수 있으므로 원본 테이블별로 집계하여 합산
+    source_columns = ['Age' if name == AGE_DIMENSION else name for name in CUBE_DIMENSIONS]
+    age_axis = CUBE_DIMENSIONS.index(AGE_DIMENSION)
+    counts = 0
+    for arrays in data.chunks(*source_columns):
+        codes = list(arrays)
+        codes[age_axis] = bins.codes(codes[age_axis])
+        counts = counts + grouped_counts(codes, sizes, include_missing=True)
+    return CountCube(CUBE_DIMENSIONS, labels, counts)
+
+
+def cube_definition(bins: BinDefinition = AGE_BINS) -> Dict[str, Any]:
+    """
+    큐브 캐시 키에 넣을 큐브 정의(버전, 차원, 연령대 구간)를 반환합니다.
+
+    Args:
+        bins: 연령대 구간 정의
+
+    Returns:
+        JSON으로 직렬화할 수 있는 딕셔너리
+    """
+    return {
+        'version': CUBE_VERSION,
+        'dimensions': list(CUBE_DIMENSIONS),
+        'age_edges': bins.edges.tolist(),
+        'age_labels': list(bins.labels),
+    }
+
+
+def save_cube(cube: CountCube, path: str) -> None:
+    """
+    큐브를 .npz 파일로 저장합니다.
+
+    Args:
+        cube: 저장할 큐브
+        path: 저장 경로
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    meta = json.dumps({'dimensions': cube.dimensions, 'labels': cube.labels},
+                      ensure_ascii=False)
+    # 다른 프로세스가 읽는 도중 덮어쓰지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = path + '.tmp.npz'
+    np.savez(temp_path, counts=cube.counts, meta=np.array(meta))
+    os.replace(temp_path, path)
+
+
+def load_cube(path: str) -> CountCube:
+    """
+    .npz 파일에서 큐브를 읽습니다.
+
+    Args:
+        path: 큐브 파일 경로
+
+    Returns:
+        CountCube 객체
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        meta = json.loads(str(archive['meta']))
+        counts = archive['counts']
+    return CountCube(meta['dimensions'], meta['labels'], counts)
+
+
+def cube_cache_path(cache_dir: str, key: str) -> str:
+    """
+    캐시 키에 해당하는 큐브 파일 경로를 반환합니다.
+
+    Args:
+        cache_dir: 캐시 디렉터리
+        key: 입력 파일과 큐브 정의로 계산한 키
+
+    Returns:
+        큐브 파일 경로
+    """
+    return os.path.join(cache_dir, f'count_cube_{key[:16]}.npz')
+
+
+def load_cached_cube(cache_dir: str, key: str) -> Optional[CountCube]:
+    """
+    캐시 키에 해당하는 큐브를 읽습니다. 입력 파일을 읽기 전에 호출하여
+    캐시가 있으면 파싱과 병합을 건너뛸 수 있습니다.
+
+    Args:
+        cache_dir: 캐시 디렉터리
+        key: 입력 파일과 큐브 정의로 계산한 키
+
+    Returns:
+        CountCube 객체 또는 None (캐시가 없거나 손상된 경우)
+    """
+    return _try_load(cube_cache_path(cache_dir, key))
+
+
+def build_cached_cube(data: AnyTable, cache_dir: str, key: str,
+                      bins: BinDefinition = AGE_BINS) -> CountCube:
+    """
+    데이터 테이블로부터 큐브를 만들어 캐시 키 경로에 저장합니다.
+
+    Args:
+        data: 데이터 테이블 (또는 병합 뷰)
+        cache_dir: 캐시 디렉터리
+        key: 입력 파일과 큐브 정의로 계산한 키
+        bins: 연령대 구간 정의
+
+    Returns:
+        CountCube 객체
+    """
+    cube = build_cube(data, bins)
+    save_cube(cube, cube_cache_path(cache_dir, key))
+    return cube
+
+
+def _try_load(path: str) -> Optional[CountCube]:
+    """
+    캐시 파일이 있으면 읽고, 없거나 손상되었으면 None을 반환합니다.
+
+    Args:
+        path: 큐브 파일 경로
+
+    Returns:
+        CountCube 객체 또는 None
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        return load_cube(path)
+    except (OSError, ValueError, KeyError):
+        return None
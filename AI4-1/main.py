@@ -4,63 +4,72 @@ Spaceship Titanic 데이터 분석 스크립트
 Kaggle Spaceship Titanic 데이터를 분석하여 Transported 여부와의 관계를 파악합니다.
 """
 
-import csv
+import argparse
 import os
-from collections import defaultdict
+import sys
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 
-def read_csv_file(file_path: str) -> Tuple[List[str], List[Dict[str, str]]]:
+from association import rank_associations
+from binning import (AGE_BINS, BinDefinition, grouped_counts, nonzero_table_to_dict,
+                     table_to_dict)
+from columnar import AnyTable, ColumnarTable, ConcatView, read_csv_columnar
+from cube import AGE_DIMENSION, build_cached_cube, cube_definition, load_cached_cube
+from relevance import categorical_score, rank_columns
+
+# 저장소 최상위의 공용 모듈(common)을 불러올 수 있도록 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.build_cache import ArtifactCache, fingerprint  # noqa: E402
+
+# 그래프 내용에 영향을 주는 코드 파일 (빌드 캐시 키에 포함)
+CHART_CODE_FILES = ('main.py', 'columnar.py', 'binning.py', 'cube.py')
+# 빈도 큐브 내용에 영향을 주는 코드 파일 (파싱, 구간화, 집계; 큐브 캐시 키에 포함)
+CUBE_CODE_FILES = ('columnar.py', 'binning.py', 'cube.py')
+
+
+def read_csv_file(file_path: str) -> Tuple[List[str], ColumnarTable]:
     """
-    CSV 파일을 읽어서 헤더와 데이터를 반환합니다.
+    CSV 파일을 읽어서 헤더와 컬럼형 데이터를 반환합니다.
+    
+    각 컬럼은 읽을 때 한 번만 타입 변환되며, 이후 분석 함수들은
+    문자열을 다시 파싱하지 않고 변환된 배열을 사용합니다.
     
     Args:
         file_path: 읽을 CSV 파일의 경로
         
     Returns:
-        (헤더 리스트, 데이터 딕셔너리 리스트) 튜플
+        (헤더 리스트, ColumnarTable) 튜플
     """
-    headers = []
-    data = []
-    
-    with open(file_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        headers = reader.fieldnames
-        
-        for row in reader:
-            data.append(row)
-    
-    return headers, data
+    table = read_csv_columnar(file_path)
+    return table.headers, table
 
 
-def merge_data(train_data: List[Dict[str, str]], 
-               test_data: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def merge_data(train_data: ColumnarTable, 
+               test_data: ColumnarTable) -> ConcatView:
     """
     train 데이터와 test 데이터를 병합합니다.
     
+    데이터를 복사하지 않고 두 테이블을 이어 붙인 뷰를 반환하며, 원본 테이블은
+    변경되지 않습니다. test 데이터에 없는 Transported 컬럼은 결측치(-1)로 보입니다.
+    
     Args:
-        train_data: train 데이터 리스트
-        test_data: test 데이터 리스트
+        train_data: train 데이터 테이블
+        test_data: test 데이터 테이블
         
     Returns:
-        병합된 데이터 리스트
+        병합된 데이터 뷰
     """
-    merged_data = train_data.copy()
-    
-    # test 데이터에 Transported 컬럼 추가 (None으로 설정)
-    for row in test_data:
-        row['Transported'] = ''
-    
-    merged_data.extend(test_data)
-    return merged_data
+    return ConcatView([train_data, test_data])
 
 
-def get_total_count(data: List[Dict[str, str]]) -> int:
+def get_total_count(data: AnyTable) -> int:
     """
     전체 데이터의 수량을 반환합니다.
     
     Args:
-        data: 데이터 리스트
+        data: 데이터 테이블
         
     Returns:
         전체 데이터 수량
@@ -68,147 +77,87 @@ def get_total_count(data: List[Dict[str, str]]) -> int:
     return len(data)
 
 
-def convert_to_float(value: str) -> Optional[float]:
-    """
-    문자열을 float로 변환합니다. 변환 불가능하면 None을 반환합니다.
-    
-    Args:
-        value: 변환할 문자열
-        
-    Returns:
-        float 값 또는 None
-    """
-    if value == '' or value is None:
-        return None
-    try:
-        return float(value)
-    except ValueError:
-        return None
-
-
-def convert_to_bool(value: str) -> Optional[bool]:
-    """
-    문자열을 bool로 변환합니다.
-    
-    Args:
-        value: 변환할 문자열
-        
-    Returns:
-        bool 값 또는 None
-    """
-    if value == '' or value is None:
-        return None
-    if value.lower() == 'true':
-        return True
-    elif value.lower() == 'false':
-        return False
-    return None
-
-
-def calculate_correlation(data: List[Dict[str, str]], 
+def calculate_correlation(data: ColumnarTable, 
                          column_name: str) -> float:
     """
     Transported와 특정 컬럼 간의 상관관계를 계산합니다.
     
     Args:
-        data: 데이터 리스트
+        data: 데이터 테이블
         column_name: 분석할 컬럼 이름
         
     Returns:
         상관관계 값 (0~1 사이)
     """
-    transported_true = []
-    transported_false = []
-    
-    for row in data:
-        transported = convert_to_bool(row.get('Transported', ''))
-        if transported is None:
-            continue
-        
-        value = row.get(column_name, '')
-        if value == '' or value is None:
-            continue
-        
-        if transported:
-            transported_true.append(value)
-        else:
-            transported_false.append(value)
-    
-    if not transported_true or not transported_false:
+    if 'Transported' not in data or column_name not in data:
         return 0.0
     
-    # 수치형 데이터인 경우 평균 차이로 상관관계 계산
-    try:
-        true_values = [convert_to_float(v) for v in transported_true]
-        false_values = [convert_to_float(v) for v in transported_false]
-        true_values = [v for v in true_values if v is not None]
-        false_values = [v for v in false_values if v is not None]
-        
-        if true_values and false_values:
-            true_avg = sum(true_values) / len(true_values)
-            false_avg = sum(false_values) / len(false_values)
-            diff = abs(true_avg - false_avg)
-            max_val = max(max(true_values), max(false_values))
-            min_val = min(min(true_values), min(false_values))
-            if max_val - min_val > 0:
-                return diff / (max_val - min_val)
-    except (ValueError, TypeError):
-        pass
+    transported = data['Transported']
+    values = data[column_name]
+    kind = data.kind(column_name)
     
-    # 범주형 데이터인 경우 카이제곱 유사도 계산
-    true_counts = defaultdict(int)
-    false_counts = defaultdict(int)
-    
-    for v in transported_true:
-        true_counts[v] += 1
-    for v in transported_false:
-        false_counts[v] += 1
-    
-    all_values = set(list(true_counts.keys()) + list(false_counts.keys()))
-    if not all_values:
-        return 0.0
+    # 결측치가 아닌 값만 사용
+    if kind == 'numeric':
+        present = ~np.isnan(values)
+    elif kind == 'string':
+        present = values != ''
+    else:
+        present = values >= 0
     
-    total_true = sum(true_counts.values())
-    total_false = sum(false_counts.values())
-    total = total_true + total_false
+    transported_true = values[present & (transported == 1)]
+    transported_false = values[present & (transported == 0)]
     
-    if total == 0:
+    if transported_true.size == 0 or transported_false.size == 0:
         return 0.0
     
-    correlation = 0.0
-    for val in all_values:
-        true_ratio = true_counts[val] / total_true if total_true > 0 else 0
-        false_ratio = false_counts[val] / total_false if total_false > 0 else 0
-        correlation += abs(true_ratio - false_ratio)
+    # 수치형 데이터인 경우 평균 차이로 상관관계 계산
+    if kind == 'numeric':
+        diff = abs(transported_true.mean() - transported_false.mean())
+        max_val = max(transported_true.max(), transported_false.max())
+        min_val = min(transported_true.min(), transported_false.min())
+        if max_val - min_val > 0:
+            return float(diff / (max_val - min_val))
     
-    return correlation / len(all_values) if all_values else 0.0
+    # 범주형 데이터인 경우 카이제곱 유사도 계산
+    return categorical_score(transported_true, transported_false)
 
 
-def find_most_correlated_column(data: List[Dict[str, str]], 
+def find_most_correlated_column(data: ColumnarTable, 
                                 headers: List[str]) -> Tuple[str, float]:
     """
     Transported와 가장 관련성이 높은 컬럼을 찾습니다.
     
     Args:
-        data: 데이터 리스트
+        data: 데이터 테이블
         headers: 컬럼 이름 리스트
         
     Returns:
         (컬럼 이름, 상관관계 값) 튜플
     """
-    excluded_columns = {'PassengerId', 'Name', 'Transported', 'Cabin'}
-    target_columns = [h for h in headers if h not in excluded_columns]
+    ranking = rank_correlated_columns(data, headers)
+    if not ranking:
+        return ('', 0.0)
     
-    correlations = {}
-    for column in target_columns:
-        corr = calculate_correlation(data, column)
-        correlations[column] = corr
+    return ranking[0]
+
+
+def rank_correlated_columns(data: ColumnarTable, 
+                            headers: List[str]) -> List[Tuple[str, float]]:
+    """
+    Transported와의 관련성 순으로 전체 컬럼 순위를 계산합니다.
     
-    if not correlations:
-        return ('', 0.0)
+    모든 후보 컬럼의 점수를 컬럼 단위 벡터 연산으로 한 번에 계산합니다.
     
-    most_correlated = max(correlations.items(), key=lambda x: x[1])
-    return most_correlated
+    Args:
+        data: 데이터 테이블
+        headers: 컬럼 이름 리스트
+        
+    Returns:
+        (컬럼 이름, 상관관계 값) 튜플 리스트 (상관관계 내림차순)
+    """
+    excluded_columns = {'PassengerId', 'Name', 'Transported', 'Cabin'}
+    target_columns = [h for h in headers if h not in excluded_columns]
+    return rank_columns(data, target_columns)
 
 
 def get_age_group(age: Optional[float]) -> Optional[str]:
@@ -221,263 +170,277 @@ def get_age_group(age: Optional[float]) -> Optional[str]:
     Returns:
         연령대 문자열 (10대, 20대, ...) 또는 None
     """
-    if age is None:
-        return None
-    
-    age_int = int(age)
-    if age_int < 10:
-        return '10대 미만'
-    elif age_int < 20:
-        return '10대'
-    elif age_int < 30:
-        return '20대'
-    elif age_int < 40:
-        return '30대'
-    elif age_int < 50:
-        return '40대'
-    elif age_int < 60:
-        return '50대'
-    elif age_int < 70:
-        return '60대'
-    elif age_int < 80:
-        return '70대'
-    else:
-        return '70대 이상'
+    return AGE_BINS.label(age)
 
 
-def get_age_group_data(data: List[Dict[str, str]]) -> Dict[str, Dict[str, int]]:
+def count_age_group_tables(data: AnyTable, 
+                           bins: BinDefinition = AGE_BINS
+                           ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
     """
-    연령대별 Transported 여부 데이터를 수집합니다.
+    연령대별 Transported 빈도표와 Destination별 연령대 빈도표를 한 번에 계산합니다.
+    
+    Age 컬럼 전체를 구간 코드로 바꾼 뒤 (연령대, Destination, Transported)
+    결합 키에 대한 bincount 한 번으로 3차원 빈도표를 만들고, 두 빈도표는
+    이 빈도표의 축을 합산하여 얻습니다.
     
     Args:
-        data: 데이터 리스트
+        data: 데이터 테이블
+        bins: 연령대 구간 정의
         
     Returns:
-        연령대별 Transported 통계 딕셔너리
+        ((연령대 × [False, True]) 빈도표, (Destination × 연령대) 빈도표, 
+         Destination 이름 리스트) 튜플
+    """
+    destinations = data.categories['Destination']
+    sizes = [len(bins), len(destinations), 2]
+    
+    # 원본 테이블별로 집계하여 합산 (각 축의 0번 칸은 결측치)
+    counts = 0
+    for ages, destination_codes, transported in data.chunks(
+            'Age', 'Destination', 'Transported'):
+        counts = counts + grouped_counts(
+            [bins.codes(ages), destination_codes, transported], sizes, 
+            include_missing=True)
+    
+    age_transported = counts[1:, :, 1:].sum(axis=1)
+    destination_age = counts[1:, 1:, :].sum(axis=2).T
+    return age_transported, destination_age, destinations
+
+
+def get_age_group_data(data: ColumnarTable) -> Dict[str, Dict[str, int]]:
     """
-    age_group_data = defaultdict(lambda: {'True': 0, 'False': 0})
+    연령대별 Transported 여부 데이터를 수집합니다.
     
-    for row in data:
-        transported = convert_to_bool(row.get('Transported', ''))
-        if transported is None:
-            continue
-        
-        age = convert_to_float(row.get('Age', ''))
-        age_group = get_age_group(age)
+    Args:
+        data: 데이터 테이블
         
-        if age_group:
-            if transported:
-                age_group_data[age_group]['True'] += 1
-            else:
-                age_group_data[age_group]['False'] += 1
-    
-    return dict(age_group_data)
+    Returns:
+        연령대별 Transported 통계 딕셔너리
+    """
+    age_transported, _, _ = count_age_group_tables(data)
+    return table_to_dict(age_transported, AGE_BINS.labels, ['False', 'True'])
 
 
-def get_destination_age_distribution(data: List[Dict[str, str]]) -> Dict[str, Dict[str, int]]:
+def get_destination_age_distribution(data: AnyTable) -> Dict[str, Dict[str, int]]:
     """
     Destination별 연령대 분포를 수집합니다.
     
     Args:
-        data: 데이터 리스트
+        data: 데이터 테이블
         
     Returns:
         Destination별 연령대 분포 딕셔너리
     """
-    destination_age_data = defaultdict(lambda: defaultdict(int))
+    _, destination_age, destinations = count_age_group_tables(data)
+    return nonzero_table_to_dict(destination_age, destinations, AGE_BINS.labels)
+
+
+def draw_age_group_chart(age_groups: List[str], transported_counts: List[int], 
+                         not_transported_counts: List[int]):
+    """
+    연령대별 Transported 여부 막대 그래프를 그립니다.
     
-    for row in data:
-        destination = row.get('Destination', '')
-        if destination == '':
-            continue
-        
-        age = convert_to_float(row.get('Age', ''))
-        age_group = get_age_group(age)
+    Args:
+        age_groups: 연령대 이름 리스트
+        transported_counts: 연령대별 Transported=True 인원 수
+        not_transported_counts: 연령대별 Transported=False 인원 수
         
-        if age_group:
-            destination_age_data[destination][age_group] += 1
+    Returns:
+        matplotlib Figure 객체
+    """
+    import matplotlib.pyplot as plt
+    
+    fig, ax = plt.subplots(figsize=(12, 6))
+    x = range(len(age_groups))
+    width = 0.35
+    
+    ax.bar([i - width/2 for i in x], transported_counts, width, 
+           label='Transported (True)', color='skyblue')
+    ax.bar([i + width/2 for i in x], not_transported_counts, width, 
+           label='Transported (False)', color='lightcoral')
+    
+    ax.set_xlabel('연령대', fontsize=12)
+    ax.set_ylabel('인원 수', fontsize=12)
+    ax.set_title('연령대별 Transported 여부', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(age_groups, rotation=45, ha='right')
+    ax.legend()
+    ax.grid(axis='y', alpha=0.3)
+    
+    fig.tight_layout()
+    return fig
+
+
+def draw_destination_age_chart(destinations: List[str], age_order: List[str], 
+                               destination_counts: List[List[int]]):
+    """
+    Destination별 연령대 분포 막대 그래프를 그립니다.
     
-    return {dest: dict(ages) for dest, ages in destination_age_data.items()}
+    Args:
+        destinations: Destination 이름 리스트
+        age_order: 연령대 이름 리스트
+        destination_counts: Destination별 연령대 인원 수 (Destination × 연령대)
+        
+    Returns:
+        matplotlib Figure 객체
+    """
+    import matplotlib.pyplot as plt
+    
+    fig, ax = plt.subplots(figsize=(14, 8))
+    x = range(len(age_order))
+    width = 0.8 / len(destinations)
+    
+    # 각 Destination별로 막대 그래프 생성
+    for i, (dest, counts) in enumerate(zip(destinations, destination_counts)):
+        offset = (i - len(destinations)/2 + 0.5) * width
+        ax.bar([xi + offset for xi in x], counts, width, 
+               label=dest, alpha=0.8)
+    
+    ax.set_xlabel('연령대', fontsize=12)
+    ax.set_ylabel('인원 수', fontsize=12)
+    ax.set_title('Destination별 연령대 분포', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(age_order, rotation=45, ha='right')
+    ax.legend()
+    ax.grid(axis='y', alpha=0.3)
+    
+    fig.tight_layout()
+    return fig
 
 
-def main():
-    """메인 함수"""
+def main(force: bool = False):
+    """
+    메인 함수
+    
+    Args:
+        force: True면 입력이 바뀌지 않았어도 그래프를 다시 생성
+    """
     # 파일 경로 설정
     base_dir = os.path.dirname(os.path.abspath(__file__))
     train_path = os.path.join(base_dir, 'spaceship-titanic', 'train.csv')
     test_path = os.path.join(base_dir, 'spaceship-titanic', 'test.csv')
     
+    # 입력 파일은 여기서 한 번만 해시하고, 큐브와 그래프 키는 이 값에서 만듦
+    cache_dir = os.path.join(base_dir, '.cache')
+    input_key = fingerprint([train_path, test_path])
+    cube_key = fingerprint([], [os.path.join(base_dir, name) for name in CUBE_CODE_FILES],
+                           {'input': input_key, **cube_definition()})
+    
     # 1. CSV 파일 읽기
+    # 상관관계 분석에는 train 데이터가 항상 필요하고, test 데이터는 빈도 큐브
+    # 캐시가 없을 때만 읽음 (캐시가 있으면 행 수는 큐브 합계로 구함)
     print('CSV 파일 읽는 중...')
     train_headers, train_data = read_csv_file(train_path)
-    test_headers, test_data = read_csv_file(test_path)
+    cube = load_cached_cube(cache_dir, cube_key)
+    test_data = read_csv_file(test_path)[1] if cube is None else None
     print(f'Train 데이터: {len(train_data)}개')
-    print(f'Test 데이터: {len(test_data)}개')
     
     # 2. 데이터 병합
-    print('\n데이터 병합 중...')
-    merged_data = merge_data(train_data, test_data)
-    
     # 3. 전체 데이터 수량 파악
-    total_count = get_total_count(merged_data)
+    if cube is None:
+        print(f'Test 데이터: {len(test_data)}개')
+        print('\n데이터 병합 중...')
+        merged_data = merge_data(train_data, test_data)
+        total_count = get_total_count(merged_data)
+    else:
+        print(f'Test 데이터: {len(cube) - len(train_data)}개')
+        print('\n캐시된 빈도 큐브를 사용하므로 test 데이터 파싱과 병합을 건너뜀')
+        total_count = len(cube)
     print(f'\n전체 데이터 수량: {total_count}개')
     
     # 4. Transported와 가장 관련성이 높은 항목 찾기
     print('\nTransported와 가장 관련성이 높은 항목 분석 중...')
-    most_correlated_column, correlation_value = find_most_correlated_column(
-        train_data, train_headers)
+    ranking = rank_correlated_columns(train_data, train_headers)
+    most_correlated_column, correlation_value = ranking[0] if ranking else ('', 0.0)
     print(f'가장 관련성이 높은 항목: {most_correlated_column} '
           f'(상관관계: {correlation_value:.4f})')
+    print('전체 항목 순위:')
+    for rank, (column, value) in enumerate(ranking, start=1):
+        print(f'  {rank}. {column}: {value:.4f}')
+    
+    print('\n통계적 연관성 순위 (수치형: |점이연 상관계수|, 범주형: 크라메르 V):')
+    associations = rank_associations(train_data, [column for column, _ in ranking])
+    for rank, (column, value) in enumerate(associations, start=1):
+        print(f'  {rank}. {column}: {value:.4f}')
     
     # 5. 연령대별 Transported 여부 데이터 수집
+    # 병합 데이터에서 test 행은 Transported가 결측이므로 연령대별 Transported
+    # 빈도표에는 train 행만 집계됨
     print('\n연령대별 Transported 여부 데이터 수집 중...')
-    age_group_data = get_age_group_data(train_data)
+    if cube is None:
+        cube = build_cached_cube(merged_data, cache_dir, cube_key)
+    age_transported = cube.marginal(AGE_DIMENSION, 'Transported')
     
-    # 6. 그래프 출력을 위한 데이터 준비 및 출력
-    print('\n연령대별 Transported 여부 그래프 생성 중...')
-    try:
-        import pandas as pd
-        import matplotlib.pyplot as plt
-        
-        # 한글 폰트 설정 (macOS)
-        try:
-            plt.rcParams['font.family'] = 'AppleGothic'
-            plt.rcParams['axes.unicode_minus'] = False
-        except:
-            pass
-        
-        # 데이터프레임 생성
-        age_groups = []
-        transported_counts = []
-        not_transported_counts = []
-        
-        age_order = ['10대 미만', '10대', '20대', '30대', '40대', '50대', 
-                     '60대', '70대', '70대 이상']
-        
-        for age_group in age_order:
-            if age_group in age_group_data:
-                age_groups.append(age_group)
-                transported_counts.append(age_group_data[age_group]['True'])
-                not_transported_counts.append(age_group_data[age_group]['False'])
-        
-        df_age = pd.DataFrame({
-            '연령대': age_groups,
-            'Transported (True)': transported_counts,
-            'Transported (False)': not_transported_counts
-        })
-        
-        # 그래프 생성
-        fig, ax = plt.subplots(figsize=(12, 6))
-        x = range(len(age_groups))
-        width = 0.35
-        
-        ax.bar([i - width/2 for i in x], transported_counts, width, 
-               label='Transported (True)', color='skyblue')
-        ax.bar([i + width/2 for i in x], not_transported_counts, width, 
-               label='Transported (False)', color='lightcoral')
-        
-        ax.set_xlabel('연령대', fontsize=12)
-        ax.set_ylabel('인원 수', fontsize=12)
-        ax.set_title('연령대별 Transported 여부', fontsize=14, fontweight='bold')
-        ax.set_xticks(x)
-        ax.set_xticklabels(age_groups, rotation=45, ha='right')
-        ax.legend()
-        ax.grid(axis='y', alpha=0.3)
-        
-        plt.tight_layout()
-        output_path = os.path.join(base_dir, 'age_group_transported.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        print(f'그래프 저장 완료: {output_path}')
-        plt.close()
-        
-    except ImportError:
-        print('Pandas 또는 Matplotlib이 설치되지 않아 그래프를 생성할 수 없습니다.')
-        print('연령대별 데이터:')
-        for age_group, counts in sorted(age_group_data.items()):
-            print(f'  {age_group}: Transported=True {counts["True"]}명, '
-                  f'Transported=False {counts["False"]}명')
+    age_observed = age_transported.sum(axis=1) > 0
+    age_groups = [label for label, observed 
+                  in zip(cube.labels[AGE_DIMENSION], age_observed) if observed]
+    transported_counts = age_transported[age_observed, 1].tolist()
+    not_transported_counts = age_transported[age_observed, 0].tolist()
     
-    # 7. 보너스: Destination별 연령대 분포 시각화
+    # 6. 보너스: Destination별 연령대 분포 데이터 수집
     print('\nDestination별 연령대 분포 분석 중...')
-    destination_age_data = get_destination_age_distribution(merged_data)
+    destination_age = cube.marginal('Destination', AGE_DIMENSION)
+    destinations = cube.labels['Destination']
+    age_order = cube.labels[AGE_DIMENSION]
     
+    # 7. 그래프 생성 (서로 독립적인 그림을 동시에 렌더링)
+    # 입력 파일, 코드, 해상도가 지난 실행과 같으면 해당 그래프는 건너뜀
+    print('\n연령대별 Transported 여부 및 Destination별 연령대 분포 그래프 생성 중...')
     try:
-        import pandas as pd
-        import matplotlib.pyplot as plt
-        
-        # 한글 폰트 설정 (macOS)
-        try:
-            plt.rcParams['font.family'] = 'AppleGothic'
-            plt.rcParams['axes.unicode_minus'] = False
-        except:
-            pass
-        
-        # 데이터 준비
-        destinations = list(destination_age_data.keys())
-        age_order = ['10대 미만', '10대', '20대', '30대', '40대', '50대', 
-                     '60대', '70대', '70대 이상']
+        from common import rendering
+        from common.rendering import RenderJob, render_all
+        
+        jobs = [RenderJob(draw_age_group_chart, 
+                          (age_groups, transported_counts, not_transported_counts),
+                          os.path.join(base_dir, 'age_group_transported.png'))]
+        if destination_age.any():
+            jobs.append(RenderJob(draw_destination_age_chart, 
+                                  (destinations, age_order, destination_age.tolist()),
+                                  os.path.join(base_dir, 'destination_age_distribution.png')))
+        else:
+            print('시각화할 데이터가 없습니다.')
         
-        # 각 Destination별 연령대별 인원 수 수집
-        plot_data = []
-        for dest in destinations:
-            for age_group in age_order:
-                count = destination_age_data[dest].get(age_group, 0)
-                if count > 0:
-                    plot_data.append({
-                        'Destination': dest,
-                        '연령대': age_group,
-                        '인원 수': count
-                    })
+        artifact_cache = ArtifactCache(cache_dir, force=force)
+        code_paths = [os.path.join(base_dir, name) for name in CHART_CODE_FILES]
+        code_paths.append(rendering.__file__)
+        keys = {job.output_path: fingerprint(
+                    [], code_paths, 
+                    {'input': input_key, 
+                     'artifact': os.path.basename(job.output_path), 
+                     'dpi': rendering.resolve_dpi()})
+                for job in jobs}
+        
+        stale_jobs = []
+        for job in jobs:
+            if artifact_cache.is_fresh(job.output_path, keys[job.output_path]):
+                print(f'변경 사항이 없어 건너뜀: {job.output_path}')
+            else:
+                stale_jobs.append(job)
         
-        if plot_data:
-            df_dest = pd.DataFrame(plot_data)
-            
-            # 그래프 생성
-            fig, ax = plt.subplots(figsize=(14, 8))
-            
-            # 각 Destination별로 막대 그래프 생성
-            dest_counts = {}
-            for dest in destinations:
-                counts = [destination_age_data[dest].get(age, 0) 
-                         for age in age_order]
-                dest_counts[dest] = counts
-            
-            x = range(len(age_order))
-            width = 0.8 / len(destinations)
-            
-            for i, dest in enumerate(destinations):
-                counts = dest_counts[dest]
-                offset = (i - len(destinations)/2 + 0.5) * width
-                ax.bar([xi + offset for xi in x], counts, width, 
-                      label=dest, alpha=0.8)
-            
-            ax.set_xlabel('연령대', fontsize=12)
-            ax.set_ylabel('인원 수', fontsize=12)
-            ax.set_title('Destination별 연령대 분포', fontsize=14, fontweight='bold')
-            ax.set_xticks(x)
-            ax.set_xticklabels(age_order, rotation=45, ha='right')
-            ax.legend()
-            ax.grid(axis='y', alpha=0.3)
-            
-            plt.tight_layout()
-            output_path = os.path.join(base_dir, 'destination_age_distribution.png')
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        for output_path in render_all(stale_jobs):
+            artifact_cache.record(output_path, keys[output_path])
             print(f'그래프 저장 완료: {output_path}')
-            plt.close()
-        else:
-            print('시각화할 데이터가 없습니다.')
-            
+        
     except ImportError:
-        print('Pandas 또는 Matplotlib이 설치되지 않아 그래프를 생성할 수 없습니다.')
+        print('Matplotlib이 설치되지 않아 그래프를 생성할 수 없습니다.')
+        print('연령대별 데이터:')
+        for age_group, true_count, false_count in zip(
+                age_groups, transported_counts, not_transported_counts):
+            print(f'  {age_group}: Transported=True {true_count}명, '
+                  f'Transported=False {false_count}명')
         print('Destination별 연령대 분포:')
-        for dest, ages in destination_age_data.items():
+        for dest, counts in zip(destinations, destination_age.tolist()):
             print(f'  {dest}:')
-            for age_group, count in sorted(ages.items()):
-                print(f'    {age_group}: {count}명')
+            for age_group, count in zip(age_order, counts):
+                if count:
+                    print(f'    {age_group}: {count}명')
     
     print('\n작업 완료!')
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Spaceship Titanic 데이터 분석')
+    parser.add_argument('--force', action='store_true', 
+                        help='입력이 바뀌지 않았어도 그래프를 다시 생성')
+    main(force=parser.parse_args().force)
 
@@ -0,0 +1,200 @@
+"""
+Transported 관련성 일괄 계산 모듈
+
+후보 컬럼 전체의 관련성 점수를 컬럼 단위 벡터 연산으로 한 번에 계산합니다.
+수치형 컬럼은 하나의 행렬로 묶어 평균 차이를, 불리언/범주형 컬럼은
+결합 키 하나에 대한 bincount로 분할표를 구하므로 컬럼 수만큼 데이터를
+반복해서 훑지 않습니다.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from columnar import ColumnarTable
+
+
+def categorical_score(true_values: np.ndarray, false_values: np.ndarray) -> float:
+    """
+    범주별 비율 차이의 평균을 계산합니다.
+
+    Args:
+        true_values: Transported가 True인 행의 값 배열
+        false_values: Transported가 False인 행의 값 배열
+
+    Returns:
+        범주별 |True 비율 - False 비율|의 평균
+    """
+    if true_values.size == 0 or false_values.size == 0:
+        return 0.0
+
+    labels, inverse = np.unique(np.concatenate([true_values, false_values]),
+                                return_inverse=True)
+    inverse = inverse.reshape(-1)
+    true_counts = np.bincount(inverse[:len(true_values)], minlength=labels.size)
+    false_counts = np.bincount(inverse[len(true_values):], minlength=labels.size)
+
+    diff = np.abs(true_counts / len(true_values) - false_counts / len(false_values))
+    return float(diff.sum() / labels.size)
+
+
+def _contingency_score(true_counts: np.ndarray, false_counts: np.ndarray) -> float:
+    """
+    범주별 빈도표로부터 비율 차이 평균을 계산합니다.
+
+    Args:
+        true_counts: 범주별 Transported=True 빈도
+        false_counts: 범주별 Transported=False 빈도
+
+    Returns:
+        관찰된 범주들에 대한 |True 비율 - False 비율|의 평균
+    """
+    total_true = true_counts.sum()
+    total_false = false_counts.sum()
+    if total_true == 0 or total_false == 0:
+        return 0.0
+
+    observed = (true_counts + false_counts) > 0
+    diff = np.abs(true_counts[observed] / total_true
+                  - false_counts[observed] / total_false)
+    return float(diff.sum() / observed.sum())
+
+
+def _numeric_scores(data: ColumnarTable, columns: List[str],
+                    transported: np.ndarray) -> Dict[str, float]:
+    """
+    수치형 컬럼들의 평균 차이 점수를 행렬 연산으로 한 번에 계산합니다.
+
+    컬럼들을 (컬럼 수 × 행 수) 행렬로 쌓은 뒤, 최솟값/최댓값은 NaN을 무시하는
+    축 방향 reduce로, 그룹별 합계와 개수는 Transported 가중치 행렬과의
+    곱 한 번으로 구합니다.
+
+    Args:
+        data: 데이터 테이블
+        columns: 수치형 컬럼 이름 리스트
+        transported: Transported 3상태 배열
+
+    Returns:
+        컬럼별 점수 딕셔너리
+    """
+    if not columns:
+        return {}
+
+    # 각 컬럼이 연속된 메모리에 놓이도록 행 방향으로 쌓음
+    matrix = np.vstack([data[name] for name in columns])
+    unknown = transported < 0
+    if unknown.any():
+        matrix[:, unknown] = np.nan
+
+    max_val = np.fmax.reduce(matrix, axis=1)
+    min_val = np.fmin.reduce(matrix, axis=1)
+
+    missing = np.isnan(matrix)
+    np.copyto(matrix, 0.0, where=missing)
+
+    # 0열은 Transported=True, 1열은 False 가중치
+    weights = np.vstack([transported == 1, transported == 0]).astype(np.float64).T
+    sums = matrix @ weights
+    counts = weights.sum(axis=0) - missing.astype(np.float64) @ weights
+
+    scores = {}
+    for j, name in enumerate(columns):
+        true_count, false_count = counts[j]
+        if true_count == 0 or false_count == 0:
+            scores[name] = 0.0
+            continue
+
+        value_range = max_val[j] - min_val[j]
+        if value_range > 0:
+            diff = abs(sums[j, 0] / true_count - sums[j, 1] / false_count)
+            scores[name] = float(diff / value_range)
+        else:
+            # 모든 값이 같으면 범주형으로 취급
+            values = data[name]
+            present = ~np.isnan(values)
+            scores[name] = categorical_score(values[present & (transported == 1)],
+                                             values[present & (transported == 0)])
+    return scores
+
+
+def _coded_scores(data: ColumnarTable, columns: List[str],
+                  transported: np.ndarray) -> Dict[str, float]:
+    """
+    불리언/범주형 컬럼들의 분할표를 하나의 bincount로 계산합니다.
+
+    컬럼 j의 코드 c(-1=결측)와 Transported 값 t(-1=결측)를
+    offset_j + 3(c + 1) + (t + 1) 키로 결합하여 모든 컬럼의
+    (범주 × Transported) 빈도를 한 번에 구합니다. 결측 칸은 별도의
+    빈에 모였다가 점수 계산 시 버려지므로 마스킹이 필요 없습니다.
+
+    Args:
+        data: 데이터 테이블
+        columns: 불리언/범주형 컬럼 이름 리스트
+        transported: Transported 3상태 배열
+
+    Returns:
+        컬럼별 점수 딕셔너리
+    """
+    if not columns:
+        return {}
+
+    sizes = []
+    for name in columns:
+        if data.kind(name) == 'bool':
+            sizes.append(2)
+        else:
+            sizes.append(len(data.categories[name]))
+    widths = (np.array(sizes) + 1) * 3
+    offsets = np.concatenate([[0], np.cumsum(widths)[:-1]])
+
+    keys = np.vstack([data[name] for name in columns]).astype(np.intp)
+    keys += 1
+    keys *= 3
+    keys += transported + 1
+    keys += offsets[:, None]
+    counts = np.bincount(keys.ravel(), minlength=int(widths.sum()))
+
+    scores = {}
+    for j, name in enumerate(columns):
+        # 첫 행(결측 코드)과 첫 열(결측 Transported)을 제외한 분할표
+        table = counts[offsets[j]:offsets[j] + widths[j]].reshape(sizes[j] + 1, 3)[1:]
+        scores[name] = _contingency_score(table[:, 2], table[:, 1])
+    return scores
+
+
+def rank_columns(data: ColumnarTable,
+                 columns: Sequence[str]) -> List[Tuple[str, float]]:
+    """
+    후보 컬럼 전체의 Transported 관련성 점수를 계산하여 순위를 반환합니다.
+
+    점수는 calculate_correlation과 같은 방식(수치형은 정규화된 평균 차이,
+    범주형은 범주별 비율 차이 평균)으로 계산됩니다.
+
+    Args:
+        data: 데이터 테이블
+        columns: 후보 컬럼 이름 리스트
+
+    Returns:
+        (컬럼 이름, 점수) 튜플 리스트 (점수 내림차순, 동점은 입력 순서 유지)
+    """
+    columns = [name for name in columns if name in data]
+    if 'Transported' not in data:
+        return [(name, 0.0) for name in columns]
+
+    transported = data['Transported']
+
+    numeric_columns = [name for name in columns if data.kind(name) == 'numeric']
+    coded_columns = [name for name in columns
+                     if data.kind(name) in ('bool', 'categorical')]
+    string_columns = [name for name in columns if data.kind(name) == 'string']
+
+    scores = _numeric_scores(data, numeric_columns, transported)
+    scores.update(_coded_scores(data, coded_columns, transported))
+    for name in string_columns:
+        values = data[name]
+        present = values != ''
+        scores[name] = categorical_score(values[present & (transported == 1)],
+                                         values[present & (transported == 0)])
+
+    return sorted(((name, scores[name]) for name in columns),
+                  key=lambda item: item[1], reverse=True)
@@ -0,0 +1,172 @@
+"""
+인구 집계 큐브 모듈
+
+(시점, 성별, 연령별) 조합별 가구원 수 합계를 한 번의 groupby로 계산하여
+3차원 배열에 담고, 성별/연령별 통계표와 리포트용 합계는 이 배열을 잘라내고
+더하여 만듭니다. 입력이 커져도 원본 데이터는 한 번만 훑습니다.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+GROUP_COLUMNS = ['시점', '성별', '연령별']
+VALUE_COLUMN = '일반가구원'
+TOTAL_GENDER = '계'
+TOTAL_AGE = '합계'
+GENDERS = ['남자', '여자']
+# 서로 겹치지 않는 연령대 순서 (합계 및 15~64세, 65세이상 같은 묶음 제외)
+# 전체/성별 합계는 이 연령대만 더해야 묶음 행이 두 번 세어지지 않음
+AGE_ORDER = ['15세미만', '15~19세', '20~24세', '25~29세', '30~34세',
+             '35~39세', '40~44세', '45~49세', '50~54세', '55~59세',
+             '60~64세', '65~69세', '70~74세', '75~79세', '80~84세', '85세이상']
+
+
+class PopulationCube:
+    """
+    (시점 × 성별 × 연령별) 합계 배열입니다.
+
+    present는 원본 데이터에 해당 조합의 행이 하나라도 있었는지를 나타내며,
+    행이 없던 조합은 통계표에서 결측치(NA)가 됩니다.
+    """
+
+    def __init__(self, years: Sequence[int], genders: Sequence[str], ages: Sequence[str],
+                 values: np.ndarray, present: np.ndarray):
+        self.years = list(years)
+        self.genders = list(genders)
+        self.ages = list(ages)
+        self.values = values
+        self.present = present
+
+    def _gender_indices(self, genders: Sequence[str]) -> List[int]:
+        """
+        큐브에 있는 성별만 골라 축 위치 리스트로 반환합니다.
+
+        Args:
+            genders: 성별 이름 리스트
+
+        Returns:
+            성별 축 위치 리스트
+        """
+        return [self.genders.index(gender) for gender in genders if gender in self.genders]
+
+    def _age_indices(self, ages: Optional[Sequence[str]] = None) -> List[int]:
+        """
+        연령별 축 위치 리스트를 반환합니다.
+
+        Args:
+            ages: 포함할 연령별 리스트 (None이면 합계 행을 제외한 전부)
+
+        Returns:
+            연령별 축 위치 리스트
+        """
+        if ages is None:
+            return [i for i, age in enumerate(self.ages) if age != TOTAL_AGE]
+        return [self.ages.index(age) for age in ages if age in self.ages]
+
+    def _table(self, values: np.ndarray, present: np.ndarray, columns: Sequence[str],
+               columns_name: str) -> pd.DataFrame:
+        """
+        (시점 × 열) 배열을 시점 인덱스의 nullable 정수 DataFrame으로 변환합니다.
+
+        Args:
+            values: (시점 × 열) 합계 배열
+            present: (시점 × 열) 존재 여부 배열
+            columns: 열 이름 리스트
+            columns_name: 열 축 이름
+
+        Returns:
+            시점별 통계 DataFrame
+        """
+        data = {column: pd.arrays.IntegerArray(values[:, i].copy(), ~present[:, i])
+                for i, column in enumerate(columns)}
+        table = pd.DataFrame(data, index=pd.Index(self.years, name='시점'))
+        table.columns.name = columns_name
+        # 해당 시점의 행이 하나도 없었던 경우는 원본 pivot처럼 제외
+        return table[present.any(axis=1)]
+
+    def gender_year_table(self, genders: Sequence[str] = GENDERS,
+                          ages: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        성별 연도별 합계표(합계 연령 행 제외)를 반환합니다.
+
+        Args:
+            genders: 포함할 성별 리스트
+            ages: 더할 연령별 리스트 (None이면 합계 행을 제외한 전부,
+                묶음 연령대를 빼려면 AGE_ORDER)
+
+        Returns:
+            (시점 × 성별) DataFrame
+        """
+        gender_idx = self._gender_indices(genders)
+        age_idx = self._age_indices(ages)
+        block = np.ix_(range(len(self.years)), gender_idx, age_idx)
+        return self._table(self.values[block].sum(axis=2), self.present[block].any(axis=2),
+                           [self.genders[i] for i in gender_idx], '성별')
+
+    def age_year_table(self, gender: str = TOTAL_GENDER) -> pd.DataFrame:
+        """
+        한 성별의 연령별 연도별 합계표(합계 연령 행 제외)를 반환합니다.
+
+        Args:
+            gender: 성별 이름 (기본값은 전체를 뜻하는 '계')
+
+        Returns:
+            (시점 × 연령별) DataFrame
+        """
+        gender_idx = self._gender_indices([gender])
+        age_idx = self._age_indices()
+        block = np.ix_(range(len(self.years)), gender_idx, age_idx)
+        # 성별이 큐브에 없으면 합계가 0이고 모든 칸이 빈 표가 됨
+        return self._table(self.values[block].sum(axis=1), self.present[block].any(axis=1),
+                           [self.ages[i] for i in age_idx], '연령별')
+
+    def gender_age_frame(self, genders: Sequence[str] = GENDERS) -> pd.DataFrame:
+        """
+        성별, 연령별 연도별 합계를 긴 형식(행 = 조합 하나)으로 반환합니다.
+
+        Args:
+            genders: 포함할 성별 리스트
+
+        Returns:
+            시점, 성별, 연령별, 일반가구원 컬럼의 DataFrame
+        """
+        gender_idx = self._gender_indices(genders)
+        age_idx = self._age_indices()
+        block = np.ix_(range(len(self.years)), gender_idx, age_idx)
+        year_pos, gender_pos, age_pos = np.nonzero(self.present[block])
+
+        return pd.DataFrame({
+            '시점': np.asarray(self.years)[year_pos],
+            '성별': np.asarray([self.genders[i] for i in gender_idx], dtype=object)[gender_pos],
+            '연령별': np.asarray([self.ages[i] for i in age_idx], dtype=object)[age_pos],
+            VALUE_COLUMN: pd.array(self.values[block][year_pos, gender_pos, age_pos],
+                                   dtype='Int64'),
+        })
+
+
+def build_population_cube(df: pd.DataFrame,
+                          value_column: str = VALUE_COLUMN) -> PopulationCube:
+    """
+    한 번의 groupby로 (시점, 성별, 연령별) 합계 큐브를 만듭니다.
+
+    Args:
+        df: 가구원 수 컬럼이 숫자로 변환된 DataFrame
+        value_column: 합계를 낼 컬럼 이름
+
+    Returns:
+        PopulationCube 객체
+    """
+    sums = df.groupby(GROUP_COLUMNS, sort=True, observed=True)[value_column].sum()
+    index = sums.index.remove_unused_levels()
+    year_labels, gender_labels, age_labels = (list(level) for level in index.levels)
+
+    shape = (len(year_labels), len(gender_labels), len(age_labels))
+    values = np.zeros(shape, dtype=np.int64)
+    present = np.zeros(shape, dtype=bool)
+    cells = tuple(np.asarray(codes) for codes in index.codes)
+    values[cells] = sums.to_numpy(dtype=np.int64, na_value=0)
+    present[cells] = True
+
+    return PopulationCube(year_labels, gender_labels, age_labels, values, present)
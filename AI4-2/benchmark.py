@@ -0,0 +1,119 @@
+"""
+인구 데이터 분석 벤치마크 스크립트
+
+population.csv의 가구원 수 문자열을 수백만 행으로 복제하여, 값 하나씩
+변환하는 Series.apply 방식과 parse_counts 일괄 변환의 실행 시간을 비교합니다.
+"""
+
+import os
+import time
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from parsing import parse_count_buffer, parse_counts
+
+TARGET_ROWS = 3_000_000
+REPEAT = 3
+
+
+def convert_count_per_value(value) -> Optional[int]:
+    """
+    값 하나를 숫자로 변환하는 기존 방식입니다. (비교 기준)
+
+    Args:
+        value: 변환할 값
+
+    Returns:
+        숫자 값 또는 None
+    """
+    if value is None or value == '' or value == 'X' or value == '-':
+        return None
+
+    try:
+        if pd.isna(value):
+            return None
+        if isinstance(value, str):
+            value = value.replace('"', '').replace(',', '')
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def measure(func: Callable[[], object], repeat: int = REPEAT) -> float:
+    """
+    함수를 여러 번 실행하여 가장 짧은 실행 시간(초)을 반환합니다.
+
+    Args:
+        func: 측정할 함수
+        repeat: 반복 횟수
+
+    Returns:
+        최소 실행 시간(초)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build_count_column(csv_path: str, rows: int) -> pd.Series:
+    """
+    population.csv의 가구원 수 컬럼 값들을 따옴표와 천 단위 쉼표가 붙은
+    문자열로 바꾸어 rows행으로 복제한 컬럼을 만듭니다.
+
+    Args:
+        csv_path: population.csv 경로
+        rows: 만들 행 수
+
+    Returns:
+        문자열 Series
+    """
+    raw = pd.read_csv(csv_path, dtype=str, keep_default_na=False, encoding='utf-8')
+    samples = raw.iloc[:, 4:].to_numpy().ravel()
+    # 숫자 값은 통계표 원문처럼 '"1,234"' 형태로 바꾸고 'X', '-'는 그대로 둠
+    samples = np.array([f'"{int(value):,}"' if value.isdigit() else value
+                        for value in samples], dtype=object)
+    return pd.Series(np.resize(samples, rows), dtype=object)
+
+
+def benchmark_parse(column: pd.Series) -> None:
+    """
+    Series.apply 변환과 parse_counts, parse_count_buffer를 비교합니다.
+
+    Args:
+        column: 변환할 문자열 Series
+    """
+    expected = column.apply(convert_count_per_value)
+    values, missing = parse_counts(column)
+    if not (np.array_equal(missing, expected.isna().to_numpy())
+            and np.array_equal(values[~missing], expected.dropna().astype(np.int64))):
+        raise AssertionError('parse_counts 결과가 기존 변환과 다릅니다.')
+
+    buffer = '\n'.join(column).encode('utf-8')
+    per_value = measure(lambda: column.apply(convert_count_per_value), repeat=1)
+    bulk = measure(lambda: parse_counts(column))
+    from_buffer = measure(lambda: parse_count_buffer(buffer))
+
+    print(f'[가구원 수 문자열] {len(column):,}행, 결측 {int(missing.sum()):,}개')
+    print(f'  Series.apply(값 단위 변환): {per_value * 1000:.2f} ms')
+    print(f'  parse_counts(컬럼 일괄 변환): {bulk * 1000:.2f} ms '
+          f'({per_value / bulk:.1f}배)')
+    print(f'  parse_count_buffer(바이트 버퍼): {from_buffer * 1000:.2f} ms '
+          f'({per_value / from_buffer:.1f}배)')
+
+
+def main():
+    """메인 함수"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    csv_path = os.path.join(base_dir, 'population.csv')
+
+    print('가구원 수 문자열 변환 벤치마크')
+    benchmark_parse(build_count_column(csv_path, TARGET_ROWS))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,17 +4,58 @@
 2015년 이후 인구 데이터를 분석하여 일반가구원 통계를 파악합니다.
 """
 
+import argparse
 import csv
 import os
+import sys
 from typing import Dict, List, Tuple, Optional
 
+# 저장소 최상위의 공용 모듈(common)을 불러올 수 있도록 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def read_csv_to_dataframe(file_path: str):
+from common.build_cache import ArtifactCache, fingerprint  # noqa: E402
+from report import AGE_ORDER, CHART_GENDERS, format_trend_report  # noqa: E402
+
+# 가구원 수가 아닌 식별 컬럼 (나머지 컬럼은 모두 가구원 수)
+ID_COLUMNS = ['시점', '행정구역별(시군구)', '성별', '연령별']
+
+# 분석에 사용하는 컬럼 (일반가구원과 식별 컬럼)
+GENERAL_POPULATION_COLUMNS = ID_COLUMNS + ['일반가구원']
+
+# 식별 컬럼의 읽기 타입 (반복되는 문자열은 범주형, 연도는 int16)
+ID_COLUMN_DTYPES = {
+    '시점': 'int16',
+    '행정구역별(시군구)': 'category',
+    '성별': 'category',
+    '연령별': 'category',
+}
+
+# 통계청 자료에서 비공개(X) 또는 해당 없음(-)을 나타내는 표기
+MISSING_VALUE_MARKERS = ['X', '-']
+
+# 분석 시작 연도와 CSV를 나누어 읽을 행 수
+START_YEAR = 2015
+CHUNK_SIZE = 100_000
+
+# 그래프와 리포터 내용에 영향을 주는 코드 파일 (빌드 캐시 키에 포함)
+ANALYSIS_CODE_FILES = ('main.py', 'aggregation.py', 'parsing.py', 'report.py', 'trends.py')
+
+
+def read_csv_to_dataframe(file_path: str, columns: Optional[List[str]] = None, 
+                          min_year: Optional[int] = None, chunksize: int = CHUNK_SIZE):
     """
     CSV 파일을 읽어서 pandas DataFrame으로 반환합니다.
     
+    파일을 chunksize 행씩 나누어 읽으면서 각 조각에서 바로 연도 조건을 적용하므로
+    조건에 맞지 않는 행은 메모리에 쌓이지 않습니다. 식별 컬럼은 범주형과 int16으로,
+    가구원 수 컬럼은 nullable 정수로 읽으며 'X'와 '-'는 결측치가 됩니다.
+    원본 파일에서 읽은 전체 행 수는 df.attrs['source_rows']에 기록됩니다.
+    
     Args:
         file_path: 읽을 CSV 파일의 경로
+        columns: 읽을 컬럼 리스트 (None이면 전체 컬럼)
+        min_year: 이 연도 이상의 행만 남김 (None이면 전체 행)
+        chunksize: 한 번에 읽을 행 수
         
     Returns:
         pandas DataFrame 객체
@@ -22,14 +63,83 @@ def read_csv_to_dataframe(file_path: str):
     try:
         import pandas as pd
         
-        # CSV 파일 읽기
-        df = pd.read_csv(file_path, encoding='utf-8')
+        # CSV 파일을 조각으로 읽으며 연도 조건을 먼저 적용
+        chunks = []
+        source_rows = 0
+        reader = pd.read_csv(file_path, encoding='utf-8', 
+                             usecols=(lambda column: column in columns) if columns else None, 
+                             dtype=ID_COLUMN_DTYPES, na_values=MISSING_VALUE_MARKERS, 
+                             thousands=',', chunksize=chunksize)
+        with reader:
+            for chunk in reader:
+                source_rows += len(chunk)
+                if min_year is not None:
+                    chunk = chunk[chunk['시점'] >= min_year]
+                chunks.append(convert_household_columns_to_numeric(chunk))
+        
+        df = concat_chunks(chunks)
+        df.attrs['source_rows'] = source_rows
         return df
     except ImportError:
         print('Pandas가 설치되지 않았습니다.')
         return None
 
 
+def concat_chunks(chunks):
+    """
+    나누어 읽은 DataFrame 조각들을 합칩니다.
+    
+    조각마다 범주 목록이 다를 수 있으므로 범주형 컬럼은 범주 합집합으로 합쳐
+    범주형 타입을 유지합니다.
+    
+    Args:
+        chunks: DataFrame 조각 리스트 (최소 1개)
+        
+    Returns:
+        합쳐진 DataFrame
+    """
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+    
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+    
+    df = pd.concat(chunks, ignore_index=True)
+    for column in chunks[0].columns:
+        if isinstance(chunks[0][column].dtype, pd.CategoricalDtype):
+            df[column] = union_categoricals([chunk[column] for chunk in chunks])
+    return df
+
+
+def convert_household_columns_to_numeric(df):
+    """
+    식별 컬럼을 제외한 가구원 수 컬럼들을 nullable 정수(Int64)로 변환합니다.
+    
+    이미 숫자로 읽힌 컬럼은 타입만 바꾸고, 따옴표나 천 단위 쉼표가 남은 문자열
+    컬럼은 parse_counts로 컬럼 전체를 한 번에 변환합니다.
+    
+    Args:
+        df: pandas DataFrame
+        
+    Returns:
+        가구원 수 컬럼이 Int64로 변환된 DataFrame
+    """
+    import pandas as pd
+    from parsing import parse_counts
+    
+    # 결측치가 섞여 있어도 정수를 유지하도록 nullable 정수 사용
+    converted = {}
+    for column in df.columns:
+        if column in ID_COLUMNS:
+            continue
+        if pd.api.types.is_numeric_dtype(df[column]):
+            converted[column] = df[column].astype('Int64')
+        else:
+            values, missing = parse_counts(df[column])
+            converted[column] = pd.arrays.IntegerArray(values, missing)
+    return df.assign(**converted)
+
+
 def remove_columns_except_general_population(df):
     """
     일반가구원 컬럼을 제외한 나머지 컬럼들을 삭제합니다.
@@ -44,8 +154,10 @@ def remove_columns_except_general_population(df):
         return None
     
     # 일반가구원 컬럼과 필요한 식별 컬럼들만 유지
-    columns_to_keep = ['시점', '행정구역별(시군구)', '성별', '연령별', '일반가구원']
-    existing_columns = [col for col in columns_to_keep if col in df.columns]
+    existing_columns = [col for col in GENERAL_POPULATION_COLUMNS if col in df.columns]
+    if existing_columns == list(df.columns):
+        # 읽을 때 이미 컬럼을 걸러낸 경우 복사하지 않음
+        return df
     
     df_filtered = df[existing_columns].copy()
     return df_filtered
@@ -64,11 +176,18 @@ def filter_data_from_2015(df):
     if df is None:
         return None
     
-    # 시점 컬럼을 숫자로 변환
-    df['시점'] = df['시점'].astype(str).str.replace('"', '').astype(int)
+    import pandas as pd
+    
+    # 시점 컬럼이 숫자로 읽히지 않은 경우에만 변환
+    if not pd.api.types.is_integer_dtype(df['시점']):
+        df['시점'] = df['시점'].astype(str).str.replace('"', '').astype(int)
+    
+    # 2015년 이후 데이터만 필터링 (읽을 때 이미 걸러졌다면 복사하지 않음)
+    mask = df['시점'] >= START_YEAR
+    if mask.all():
+        return df
     
-    # 2015년 이후 데이터만 필터링
-    df_filtered = df[df['시점'] >= 2015].copy()
+    df_filtered = df[mask].copy()
     return df_filtered
 
 
@@ -90,356 +209,356 @@ def get_year_range(df):
     return (min_year, max_year)
 
 
-def convert_general_population_to_numeric(value):
+def get_population_cube(df):
     """
-    일반가구원 값을 숫자로 변환합니다.
+    2015년 이후 데이터로 (시점, 성별, 연령별) 일반가구원 합계 큐브를 만듭니다.
+    
+    아래 통계 함수들과 리포터는 모두 이 큐브를 잘라내고 더하여 계산하므로
+    원본 데이터는 여기서 한 번만 그룹화됩니다.
     
     Args:
-        value: 변환할 값
+        df: 가구원 수 컬럼이 숫자로 변환된 DataFrame (read_csv_to_dataframe 결과)
         
     Returns:
-        숫자 값 또는 None
+        PopulationCube 객체
     """
-    if value is None or value == '' or value == 'X' or value == '-':
+    if df is None:
         return None
     
     try:
-        # pandas의 NaN 체크
-        try:
-            import pandas as pd
-            if pd.isna(value):
-                return None
-        except (ImportError, AttributeError):
-            pass
+        from aggregation import build_population_cube
         
-        # 문자열인 경우 따옴표 제거
-        if isinstance(value, str):
-            value = value.replace('"', '').replace(',', '')
-        return int(float(value))
-    except (ValueError, TypeError):
+        return build_population_cube(df)
+    except Exception as e:
+        print(f'통계 계산 중 오류 발생: {e}')
         return None
 
 
-def get_gender_year_statistics(df):
+def get_gender_year_statistics(cube):
     """
     2015년 이후 남자 및 여자의 연도별 일반가구원 데이터 통계를 계산합니다.
     
     Args:
-        df: pandas DataFrame
+        cube: 일반가구원 합계 큐브 (get_population_cube 결과)
         
     Returns:
         연도별 성별 통계 DataFrame
     """
-    if df is None:
+    if cube is None:
         return None
     
-    try:
-        import pandas as pd
-        
-        # 일반가구원을 숫자로 변환
-        df['일반가구원'] = df['일반가구원'].apply(convert_general_population_to_numeric)
-        
-        # 남자와 여자 데이터만 필터링 (합계 제외)
-        gender_df = df[df['성별'].isin(['남자', '여자'])].copy()
-        
-        # 연도별, 성별별로 그룹화하여 합계 계산
-        # 합계 행 제외 (연령별이 '합계'인 행 제외)
-        gender_df = gender_df[gender_df['연령별'] != '합계']
-        
-        statistics = gender_df.groupby(['시점', '성별'])['일반가구원'].sum().reset_index()
-        statistics_pivot = statistics.pivot(index='시점', columns='성별', values='일반가구원')
-        
-        return statistics_pivot
-    except Exception as e:
-        print(f'통계 계산 중 오류 발생: {e}')
-        return None
+    # 남자와 여자의 연령별 값(합계 행 제외)을 연도별로 더함
+    return cube.gender_year_table()
 
 
-def get_age_statistics(df):
+def get_age_statistics(cube):
     """
     2015년 이후 연령별 일반가구원 데이터 통계를 계산합니다.
     
     Args:
-        df: pandas DataFrame
+        cube: 일반가구원 합계 큐브 (get_population_cube 결과)
         
     Returns:
         연령별 통계 DataFrame
     """
-    if df is None:
+    if cube is None:
         return None
     
-    try:
-        import pandas as pd
-        
-        # 일반가구원을 숫자로 변환
-        df['일반가구원'] = df['일반가구원'].apply(convert_general_population_to_numeric)
-        
-        # 계(전체) 데이터만 사용
-        total_df = df[df['성별'] == '계'].copy()
-        
-        # 합계 행 제외
-        total_df = total_df[total_df['연령별'] != '합계']
-        
-        # 연도별, 연령별로 그룹화하여 합계 계산
-        statistics = total_df.groupby(['시점', '연령별'])['일반가구원'].sum().reset_index()
-        statistics_pivot = statistics.pivot(index='시점', columns='연령별', values='일반가구원')
-        
-        return statistics_pivot
-    except Exception as e:
-        print(f'통계 계산 중 오류 발생: {e}')
-        return None
+    # 계(전체) 데이터의 연령별 값(합계 행 제외)
+    return cube.age_year_table()
 
 
-def get_gender_age_statistics(df):
+def get_gender_age_statistics(cube):
     """
     2015년 이후 남자 및 여자의 연령별 일반가구원 데이터를 계산합니다.
     
     Args:
-        df: pandas DataFrame
+        cube: 일반가구원 합계 큐브 (get_population_cube 결과)
         
     Returns:
         성별, 연령별 통계 DataFrame
     """
-    if df is None:
+    if cube is None:
         return None
     
-    try:
-        import pandas as pd
-        
-        # 일반가구원을 숫자로 변환
-        df['일반가구원'] = df['일반가구원'].apply(convert_general_population_to_numeric)
-        
-        # 남자와 여자 데이터만 필터링
-        gender_df = df[df['성별'].isin(['남자', '여자'])].copy()
-        
-        # 합계 행 제외
-        gender_df = gender_df[gender_df['연령별'] != '합계']
-        
-        # 연도별, 성별, 연령별로 그룹화
-        statistics = gender_df.groupby(['시점', '성별', '연령별'])['일반가구원'].sum().reset_index()
+    return cube.gender_age_frame()
+
+
+def draw_gender_age_panel(ax, age_group: str, male_years: List[int], male_values: List[int],
+                          female_years: List[int], female_values: List[int]):
+    """
+    연령대 하나의 남자/여자 일반가구원 꺽은선 그래프를 축에 그립니다.
+    
+    Args:
+        ax: 그래프를 그릴 matplotlib Axes
+        age_group: 연령대 이름
+        male_years: 남자 데이터의 연도 리스트
+        male_values: 남자 연도별 일반가구원 수
+        female_years: 여자 데이터의 연도 리스트
+        female_values: 여자 연도별 일반가구원 수
+    """
+    if male_years and female_years:
+        ax.plot(male_years, male_values, marker='o', label='남자', linewidth=2)
+        ax.plot(female_years, female_values, marker='s', label='여자', linewidth=2)
+    
+    ax.set_title(f'{age_group}', fontsize=10, fontweight='bold')
+    ax.set_xlabel('연도', fontsize=9)
+    ax.set_ylabel('일반가구원 수', fontsize=9)
+    if male_years and female_years:
+        ax.legend(fontsize=8)
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(labelsize=8)
+
+
+def pivot_gender_age(cube, age_order: List[str], genders: List[str]):
+    """
+    집계 큐브의 (시점 × 성별 × 연령별) 배열에서 필요한 성별과 연령대를 바로 잘라
+    (연령별 × 성별 × 시점) 배열로 만듭니다.
+    
+    Args:
+        cube: 일반가구원 합계 큐브 (get_population_cube 결과)
+        age_order: 배열의 연령별 축 순서
+        genders: 배열의 성별 축 순서
         
-        return statistics
-    except Exception as e:
-        print(f'통계 계산 중 오류 발생: {e}')
-        return None
+    Returns:
+        (시점 배열, float64 값 배열) 튜플 (값이 없는 칸은 NaN)
+    """
+    import numpy as np
+    
+    years = np.asarray(cube.years)
+    values = np.full((len(age_order), len(genders), len(years)), np.nan)
+    
+    # 큐브에 있는 성별과 연령대만 (결과 축 위치, 큐브 축 위치) 쌍으로 골라 한 번에 복사
+    gender_pairs = [(i, cube.genders.index(gender)) for i, gender in enumerate(genders) 
+                    if gender in cube.genders]
+    age_pairs = [(i, cube.ages.index(age)) for i, age in enumerate(age_order) 
+                 if age in cube.ages]
+    if gender_pairs and age_pairs:
+        gender_out, gender_in = zip(*gender_pairs)
+        age_out, age_in = zip(*age_pairs)
+        block = np.ix_(range(len(years)), gender_in, age_in)
+        selected = np.where(cube.present[block], cube.values[block], np.nan)
+        values[np.ix_(age_out, gender_out, range(len(years)))] = selected.transpose(2, 1, 0)
+    
+    # 선택한 성별, 연령대의 값이 하나도 없는 연도는 제외
+    has_data = ~np.isnan(values).all(axis=(0, 1))
+    return years[has_data], values[:, :, has_data]
 
 
-def create_gender_age_line_chart(statistics_df):
+def create_gender_age_line_chart(cube):
     """
     남자 및 여자의 연령별 일반가구원 데이터를 꺽은선 그래프로 표현합니다.
     
+    16개 연령대 패널은 공용 렌더링 모듈이 4×4 Figure 하나에 그립니다. (미리보기
+    모드에서는 패널들을 동시에 그린 뒤 하나의 이미지로 이어 붙입니다.)
+    
     Args:
-        statistics_df: 성별, 연령별 통계 DataFrame
+        cube: 일반가구원 합계 큐브 (get_population_cube 결과)
+        
+    Returns:
+        저장된 파일 경로 (생성하지 못했으면 None)
     """
-    if statistics_df is None or statistics_df.empty:
+    if cube is None or not cube.present.any():
         print('그래프를 생성할 데이터가 없습니다.')
-        return
+        return None
     
     try:
-        import pandas as pd
-        import matplotlib.pyplot as plt
-        
-        # 한글 폰트 설정 (macOS)
-        try:
-            plt.rcParams['font.family'] = 'AppleGothic'
-            plt.rcParams['axes.unicode_minus'] = False
-        except:
-            pass
-        
-        # 연령대 순서 정의
-        age_order = ['15세미만', '15~19세', '20~24세', '25~29세', '30~34세', 
-                     '35~39세', '40~44세', '45~49세', '50~54세', '55~59세',
-                     '60~64세', '65~69세', '70~74세', '75~79세', '80~84세', '85세이상']
-        
-        # 연도별로 데이터 재구성
-        years = sorted(statistics_df['시점'].unique())
-        
-        # 각 연령대별로 그래프 생성
-        fig, axes = plt.subplots(4, 4, figsize=(20, 16))
-        axes = axes.flatten()
-        
-        for idx, age_group in enumerate(age_order):
-            if idx >= len(axes):
-                break
-            
-            ax = axes[idx]
-            
-            # 남자 데이터
-            male_data = statistics_df[
-                (statistics_df['성별'] == '남자') & 
-                (statistics_df['연령별'] == age_group)
-            ].sort_values('시점')
-            
-            # 여자 데이터
-            female_data = statistics_df[
-                (statistics_df['성별'] == '여자') & 
-                (statistics_df['연령별'] == age_group)
-            ].sort_values('시점')
-            
-            if not male_data.empty and not female_data.empty:
-                ax.plot(male_data['시점'], male_data['일반가구원'], 
-                       marker='o', label='남자', linewidth=2)
-                ax.plot(female_data['시점'], female_data['일반가구원'], 
-                       marker='s', label='여자', linewidth=2)
-            
-            ax.set_title(f'{age_group}', fontsize=10, fontweight='bold')
-            ax.set_xlabel('연도', fontsize=9)
-            ax.set_ylabel('일반가구원 수', fontsize=9)
-            ax.legend(fontsize=8)
-            ax.grid(True, alpha=0.3)
-            ax.tick_params(labelsize=8)
-        
-        plt.suptitle('2015년 이후 남자 및 여자의 연령별 일반가구원 변화', 
-                     fontsize=14, fontweight='bold', y=0.995)
-        plt.tight_layout()
+        import numpy as np
+        from common.rendering import render_grid
+        
+        # 큐브를 잘라 (연령별 × 성별 × 시점) 배열을 만든 뒤 패널마다 잘라냄
+        years, values = pivot_gender_age(cube, AGE_ORDER, CHART_GENDERS)
+        present = ~np.isnan(values)
+        
+        # 패널별 인자는 작업 프로세스로 보내기 쉽도록 리스트로 준비
+        panel_args = []
+        for age_index, age_group in enumerate(AGE_ORDER):
+            series = []
+            for gender_index in range(len(CHART_GENDERS)):
+                mask = present[age_index, gender_index]
+                series.append(years[mask].tolist())
+                series.append(values[age_index, gender_index, mask].astype(np.int64).tolist())
+            panel_args.append((age_group, *series))
         
         base_dir = os.path.dirname(os.path.abspath(__file__))
         output_path = os.path.join(base_dir, 'gender_age_line_chart.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        render_grid(draw_gender_age_panel, panel_args, output_path, ncols=4, 
+                    panel_size=(5, 4), 
+                    title='2015년 이후 남자 및 여자의 연령별 일반가구원 변화')
         print(f'그래프 저장 완료: {output_path}')
-        plt.close()
+        return output_path
         
     except ImportError:
         print('Matplotlib이 설치되지 않아 그래프를 생성할 수 없습니다.')
     except Exception as e:
         print(f'그래프 생성 중 오류 발생: {e}')
+    return None
 
 
-def create_trend_report(statistics_df, age_statistics_df):
+def create_trend_report(cube, report_path: Optional[str] = None, year_store=None):
     """
     연령별 그래프의 변화를 보고 인구의 변화 트렌드를 데이터를 기반으로 정리한 리포터를 작성합니다.
     
     Args:
-        statistics_df: 성별, 연령별 통계 DataFrame
-        age_statistics_df: 연령별 통계 DataFrame
+        cube: 일반가구원 합계 큐브 (get_population_cube 결과)
+        report_path: 저장 경로 (None이면 스크립트 폴더의 population_trend_report.txt)
+        year_store: 연도별 요약 저장소 DataFrame (None이면 추세 분석 생략)
+        
+    Returns:
+        저장된 파일 경로 (작성하지 못했으면 None)
     """
-    if statistics_df is None or age_statistics_df is None:
+    if cube is None or not cube.years:
         print('리포터를 작성할 데이터가 없습니다.')
-        return
+        return None
     
     try:
-        import pandas as pd
-        
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        report_path = os.path.join(base_dir, 'population_trend_report.txt')
+        if report_path is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            report_path = os.path.join(base_dir, 'population_trend_report.txt')
         
+        report = format_trend_report(cube, year_store=year_store)
         with open(report_path, 'w', encoding='utf-8') as f:
-            f.write('=' * 80 + '\n')
-            f.write('인구 변화 트렌드 분석 리포터\n')
-            f.write('=' * 80 + '\n\n')
-            
-            # 데이터 기간
-            years = sorted(statistics_df['시점'].unique())
-            f.write(f'분석 기간: {years[0]}년 ~ {years[-1]}년 ({len(years)}년간)\n\n')
-            
-            # 전체 인구 변화
-            f.write('1. 전체 인구 변화\n')
-            f.write('-' * 80 + '\n')
-            
-            total_by_year = age_statistics_df.sum(axis=1)
-            for year in years:
-                if year in total_by_year.index:
-                    f.write(f'{year}년: {int(total_by_year[year]):,}명\n')
-            
-            first_year_total = total_by_year[years[0]]
-            last_year_total = total_by_year[years[-1]]
-            change_rate = ((last_year_total - first_year_total) / first_year_total) * 100
-            f.write(f'\n전체 변화율: {change_rate:.2f}% '
-                   f'({int(first_year_total):,}명 → {int(last_year_total):,}명)\n\n')
-            
-            # 연령대별 변화
-            f.write('2. 연령대별 인구 변화\n')
-            f.write('-' * 80 + '\n')
-            
-            age_order = ['15세미만', '15~19세', '20~24세', '25~29세', '30~34세', 
-                         '35~39세', '40~44세', '45~49세', '50~54세', '55~59세',
-                         '60~64세', '65~69세', '70~74세', '75~79세', '80~84세', '85세이상']
-            
-            for age_group in age_order:
-                if age_group in age_statistics_df.columns:
-                    first_value = age_statistics_df[age_group].iloc[0]
-                    last_value = age_statistics_df[age_group].iloc[-1]
-                    
-                    if pd.notna(first_value) and pd.notna(last_value):
-                        change = last_value - first_value
-                        change_rate = (change / first_value) * 100 if first_value > 0 else 0
-                        f.write(f'{age_group}: {int(first_value):,}명 → {int(last_value):,}명 '
-                               f'({change_rate:+.2f}%)\n')
-            
-            # 성별 변화
-            f.write('\n3. 성별 인구 변화\n')
-            f.write('-' * 80 + '\n')
-            
-            male_data = statistics_df[statistics_df['성별'] == '남자'].groupby('시점')['일반가구원'].sum()
-            female_data = statistics_df[statistics_df['성별'] == '여자'].groupby('시점')['일반가구원'].sum()
-            
-            for year in years:
-                if year in male_data.index and year in female_data.index:
-                    male_count = int(male_data[year])
-                    female_count = int(female_data[year])
-                    total = male_count + female_count
-                    male_ratio = (male_count / total) * 100 if total > 0 else 0
-                    female_ratio = (female_count / total) * 100 if total > 0 else 0
-                    f.write(f'{year}년: 남자 {male_count:,}명 ({male_ratio:.2f}%), '
-                           f'여자 {female_count:,}명 ({female_ratio:.2f}%)\n')
-            
-            # 주요 트렌드 분석
-            f.write('\n4. 주요 트렌드 분석\n')
-            f.write('-' * 80 + '\n')
-            
-            # 고령화 추세
-            old_ages = ['65~69세', '70~74세', '75~79세', '80~84세', '85세이상']
-            old_pop_first = sum([age_statistics_df[age].iloc[0] 
-                                for age in old_ages if age in age_statistics_df.columns 
-                                and pd.notna(age_statistics_df[age].iloc[0])])
-            old_pop_last = sum([age_statistics_df[age].iloc[-1] 
-                               for age in old_ages if age in age_statistics_df.columns 
-                               and pd.notna(age_statistics_df[age].iloc[-1])])
-            
-            if old_pop_first > 0:
-                old_change_rate = ((old_pop_last - old_pop_first) / old_pop_first) * 100
-                f.write(f'고령 인구(65세 이상) 변화: {int(old_pop_first):,}명 → {int(old_pop_last):,}명 '
-                       f'({old_change_rate:+.2f}%)\n')
-            
-            # 청년층 추세
-            young_ages = ['15~19세', '20~24세', '25~29세']
-            young_pop_first = sum([age_statistics_df[age].iloc[0] 
-                                  for age in young_ages if age in age_statistics_df.columns 
-                                  and pd.notna(age_statistics_df[age].iloc[0])])
-            young_pop_last = sum([age_statistics_df[age].iloc[-1] 
-                                 for age in young_ages if age in age_statistics_df.columns 
-                                 and pd.notna(age_statistics_df[age].iloc[-1])])
-            
-            if young_pop_first > 0:
-                young_change_rate = ((young_pop_last - young_pop_first) / young_pop_first) * 100
-                f.write(f'청년층(15~29세) 변화: {int(young_pop_first):,}명 → {int(young_pop_last):,}명 '
-                       f'({young_change_rate:+.2f}%)\n')
-            
-            f.write('\n' + '=' * 80 + '\n')
-            f.write('리포터 작성 완료\n')
-            f.write('=' * 80 + '\n')
+            f.write(report)
         
         print(f'리포터 저장 완료: {report_path}')
+        return report_path
         
     except Exception as e:
         print(f'리포터 작성 중 오류 발생: {e}')
+    return None
+
+
+def get_analysis_code_paths() -> List[str]:
+    """
+    분석 코드 파일들의 절대 경로를 반환합니다.
+    
+    Returns:
+        코드 파일 경로 리스트
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return [os.path.join(base_dir, name) for name in ANALYSIS_CODE_FILES]
+
+
+def get_chart_build_key(csv_path: str) -> Optional[str]:
+    """
+    꺽은선 그래프의 빌드 캐시 키를 계산합니다.
+    
+    입력 파일과 분석 코드, 공용 렌더링 모듈의 내용, 저장 해상도를 키에 포함합니다.
+    
+    Args:
+        csv_path: 입력 CSV 파일 경로
+        
+    Returns:
+        SHA-256 16진수 문자열 (Matplotlib이 없으면 None)
+    """
+    try:
+        from common import rendering
+    except ImportError:
+        return None
+    
+    code_paths = get_analysis_code_paths() + [rendering.__file__]
+    return fingerprint([csv_path], code_paths, 
+                       {'artifact': 'gender_age_line_chart', 'dpi': rendering.resolve_dpi()})
+
+
+def get_report_build_key(csv_path: str, store_path: str) -> str:
+    """
+    트렌드 리포터의 빌드 캐시 키를 계산합니다.
+    
+    리포터의 5~6절은 연도별 요약 저장소로 만들므로 입력 CSV, 분석 코드와 함께
+    저장소 파일(있는 경우)의 내용도 키에 포함합니다.
+    
+    Args:
+        csv_path: 입력 CSV 파일 경로
+        store_path: 연도별 요약 저장소 CSV 경로
+        
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    input_paths = [csv_path] + ([store_path] if os.path.exists(store_path) else [])
+    return fingerprint(input_paths, get_analysis_code_paths(), 
+                       {'artifact': 'population_trend_report'})
+
+
+def get_year_store(df, store_path: str, rebuild: bool = False):
+    """
+    연도별 요약 저장소에 새 연도의 합계를 덧붙이고 저장소를 반환합니다.
+    
+    Args:
+        df: 2015년 이후 DataFrame
+        store_path: 저장소 CSV 경로
+        rebuild: True면 저장소를 새로 만듦
+        
+    Returns:
+        연도별 요약 저장소 DataFrame
+    """
+    if df is None:
+        return None
+    
+    try:
+        from trends import update_year_store
+        
+        store, added_years = update_year_store(store_path, df, rebuild=rebuild)
+        if added_years:
+            print(f'연도별 요약 저장소에 새로 집계한 연도: {added_years} (총 {len(store)}개 연도)')
+        else:
+            print(f'연도별 요약 저장소에 바뀐 연도가 없습니다 (총 {len(store)}개 연도)')
+        return store
+    except Exception as e:
+        print(f'연도별 요약 저장소 갱신 중 오류 발생: {e}')
+        return None
 
 
-def main():
-    """메인 함수"""
+def analyze_all_regions(df, output_dir: str, workers: Optional[int] = None):
+    """
+    시군구별 통계표와 트렌드 리포터를 프로세스 풀에서 만들고 지역별 요약표를 저장합니다.
+    
+    Args:
+        df: 2015년 이후 DataFrame (행정구역별(시군구) 컬럼 포함)
+        output_dir: 결과를 저장할 폴더
+        workers: 프로세스 개수 (None이면 CPU 코어 수)
+        
+    Returns:
+        지역별 요약 DataFrame
+    """
+    if df is None:
+        return None
+    
+    try:
+        from regions import analyze_regions
+        
+        return analyze_regions(df, output_dir, workers=workers)
+    except Exception as e:
+        print(f'지역별 분석 중 오류 발생: {e}')
+        return None
+
+
+def main(force: bool = False, regions: bool = False, workers: Optional[int] = None):
+    """
+    메인 함수
+    
+    Args:
+        force: True면 입력이 바뀌지 않았어도 그래프와 리포터를 다시 생성
+        regions: True면 전체 대신 시군구별로 분석하여 regions 폴더에 저장
+        workers: 시군구별 분석에 사용할 프로세스 개수 (None이면 CPU 코어 수)
+    """
     # 파일 경로 설정
     base_dir = os.path.dirname(os.path.abspath(__file__))
     csv_path = os.path.join(base_dir, 'population.csv')
+    chart_path = os.path.join(base_dir, 'gender_age_line_chart.png')
+    report_path = os.path.join(base_dir, 'population_trend_report.txt')
     
     # 1. CSV 파일을 DataFrame으로 읽기
     print('CSV 파일 읽는 중...')
-    df = read_csv_to_dataframe(csv_path)
+    # 필요한 컬럼과 2015년 이후 행만 읽음
+    df = read_csv_to_dataframe(csv_path, columns=GENERAL_POPULATION_COLUMNS, 
+                               min_year=START_YEAR)
     
     if df is None:
         print('데이터를 읽을 수 없습니다.')
         return
     
-    print(f'원본 데이터: {len(df)}행')
+    print(f'원본 데이터: {df.attrs.get("source_rows", len(df))}행')
     
     # 2. 일반가구원을 제외한 나머지 컬럼 삭제
     print('\n일반가구원 컬럼만 남기고 나머지 삭제 중...')
@@ -454,9 +573,28 @@ def main():
     print(f'데이터 기간: {min_year}년 ~ {max_year}년')
     print(f'필터링된 데이터: {len(df_2015)}행')
     
+    if df_2015.empty:
+        print(f'\n{START_YEAR}년 이후 데이터가 없어 통계, 그래프, 리포터를 만들지 않습니다.')
+        print('\n작업 완료!')
+        return
+    
+    # 시군구별 분석 모드: 지역마다 통계표와 리포터를 만들고 요약표를 출력
+    if regions:
+        print('\n시군구별 일반가구원 통계 및 리포터 작성 중...')
+        output_dir = os.path.join(base_dir, 'regions')
+        summary = analyze_all_regions(df_2015, output_dir, workers)
+        if summary is not None:
+            print(f'\n[시군구별 인구 변화 요약] ({len(summary)}개 지역)')
+            print(summary.to_string(index=False))
+            print(f'\n지역별 결과 저장 완료: {output_dir}')
+        print('\n작업 완료!')
+        return
+    
     # 4. 남자 및 여자의 연도별 일반가구원 데이터 통계 출력
+    # 이후의 모든 통계는 한 번의 그룹화로 만든 집계 큐브에서 계산
     print('\n남자 및 여자의 연도별 일반가구원 데이터 통계 계산 중...')
-    gender_year_stats = get_gender_year_statistics(df_2015)
+    cube = get_population_cube(df_2015)
+    gender_year_stats = get_gender_year_statistics(cube)
     
     if gender_year_stats is not None:
         print('\n[남자 및 여자 연도별 일반가구원 통계]')
@@ -465,28 +603,51 @@ def main():
     
     # 5. 연령별 일반가구원 데이터 통계 출력
     print('\n연령별 일반가구원 데이터 통계 계산 중...')
-    age_stats = get_age_statistics(df_2015)
+    age_stats = get_age_statistics(cube)
     
     if age_stats is not None:
         print('\n[연령별 일반가구원 통계]')
         print(age_stats)
         print()
     
+    # 6~7. 그래프와 리포터는 입력 파일, 코드, 해상도가 지난 실행과 같으면 건너뜀
+    artifact_cache = ArtifactCache(os.path.join(base_dir, '.cache'), force=force)
+    chart_key = get_chart_build_key(csv_path)
+    store_path = os.path.join(base_dir, '.cache', 'population_year_store.csv')
+    report_key = get_report_build_key(csv_path, store_path)
+    chart_fresh = chart_key is not None and artifact_cache.is_fresh(chart_path, chart_key)
+    report_fresh = artifact_cache.is_fresh(report_path, report_key)
+    
     # 6. 남자 및 여자의 연령별 일반가구원 데이터를 꺽은선 그래프로 표현
     print('\n남자 및 여자의 연령별 일반가구원 꺽은선 그래프 생성 중...')
-    gender_age_stats = get_gender_age_statistics(df_2015)
-    
-    if gender_age_stats is not None:
-        create_gender_age_line_chart(gender_age_stats)
+    if chart_fresh:
+        print(f'변경 사항이 없어 건너뜀: {chart_path}')
+    else:
+        if create_gender_age_line_chart(cube) and chart_key is not None:
+            artifact_cache.record(chart_path, chart_key)
     
     # 7. 보너스: 인구 변화 트렌드 리포터 작성
     print('\n인구 변화 트렌드 리포터 작성 중...')
-    if gender_age_stats is not None and age_stats is not None:
-        create_trend_report(gender_age_stats, age_stats)
+    if report_fresh:
+        print(f'변경 사항이 없어 건너뜀: {report_path}')
+    else:
+        # 연도별 요약은 저장소에 없거나 원본이 바뀐 연도만 집계
+        year_store = get_year_store(df_2015, store_path, rebuild=force)
+        if create_trend_report(cube, year_store=year_store):
+            # 저장소가 방금 갱신되었을 수 있으므로 갱신된 내용으로 키를 다시 계산하여 기록
+            artifact_cache.record(report_path, get_report_build_key(csv_path, store_path))
     
     print('\n작업 완료!')
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='인구 데이터 분석')
+    parser.add_argument('--force', action='store_true', 
+                        help='입력이 바뀌지 않았어도 그래프와 리포터를 다시 생성')
+    parser.add_argument('--regions', action='store_true', 
+                        help='시군구별로 통계와 리포터를 만들고 요약표를 저장')
+    parser.add_argument('--workers', type=int, default=None, 
+                        help='시군구별 분석에 사용할 프로세스 개수 (기본값: CPU 코어 수)')
+    args = parser.parse_args()
+    main(force=args.force, regions=args.regions, workers=args.workers)
 
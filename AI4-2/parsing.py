@@ -0,0 +1,180 @@
+"""
+가구원 수 문자열 일괄 변환 모듈
+
+'"1,234"', 'X', '-' 같은 통계표 숫자 문자열을 값 하나씩 변환하지 않고,
+컬럼 전체를 (행 × 글자) 코드 행렬로 바꾼 뒤 글자 위치마다 한 번씩
+NumPy 연산을 적용하여 int64 배열과 결측 마스크로 변환합니다.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# 한 번에 변환하는 행 수 (중간 배열이 CPU 캐시에 들어가는 크기)
+BLOCK_ROWS = 1 << 15
+# int64에 항상 들어가는 최대 자릿수 (이보다 긴 정수부는 넘침 대신 결측 처리)
+MAX_DIGITS = 18
+
+# 문자 코드(0~255)별 분류표: 숫자는 그 값(0~9), 나머지는 아래 분류 번호
+_DOT = 10
+_IGNORED = 11
+_SPACE = 12
+_SIGN = 13
+_INVALID = 14
+_CHAR_CLASS = np.full(256, _INVALID, dtype=np.uint8)
+_CHAR_CLASS[ord('0'):ord('9') + 1] = np.arange(10)
+_CHAR_CLASS[ord('.')] = _DOT
+# 숫자 사이에 있어도 무시하는 글자: 따옴표, 천 단위 구분 쉼표, 문자열 끝 채움
+_CHAR_CLASS[[ord('"'), ord(','), 0]] = _IGNORED
+# 공백은 float()처럼 숫자 앞뒤에만 허용 (' 1 2 '는 결측)
+_CHAR_CLASS[[ord(' '), ord('\t'), ord('\r')]] = _SPACE
+# 부호는 float()처럼 숫자보다 앞에 하나만 허용 ('-5'는 -5, '5-'와 '--5'는 결측)
+_CHAR_CLASS[[ord('-'), ord('+')]] = _SIGN
+
+
+def _parse_positions(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (글자 위치 × 행) uint8 문자 코드 행렬을 정수로 변환합니다.
+
+    문자 분류는 분류표 조회 한 번으로 블록 전체에 적용하고, 값은 왼쪽 글자부터
+    value = value * 10 + 숫자를 모든 행에 동시에 적용하여 만드므로 반복 횟수는
+    행 수가 아니라 가장 긴 문자열의 길이입니다. 중간 배열이 CPU 캐시에 머물도록
+    BLOCK_ROWS 행씩 나누어 처리합니다. 소수점 뒤 숫자는 버리며(int(float(x))와 같음),
+    숫자 앞의 부호 하나('-', '+')는 int(float(x))처럼 반영합니다.
+    숫자가 없거나, 허용되지 않은 글자가 있거나, 숫자 사이에 공백이 있거나,
+    부호가 둘 이상이거나 숫자 뒤에 있거나, 정수부의 유효 자릿수가
+    MAX_DIGITS보다 길면(int64 넘침) 결측입니다.
+
+    Args:
+        codes: (글자 위치 × 행) uint8 문자 코드 행렬 (짧은 문자열은 0으로 채움)
+
+    Returns:
+        (int64 값 배열, 결측이면 True인 bool 배열) 튜플
+    """
+    rows = codes.shape[1]
+    values = np.zeros(rows, dtype=np.int64)
+    missing = np.empty(rows, dtype=bool)
+
+    for start in range(0, rows, BLOCK_ROWS):
+        classes = _CHAR_CLASS[codes[:, start:start + BLOCK_ROWS]]
+        is_digit = classes < _DOT
+        is_dot = classes == _DOT
+        # 소수점 이후의 숫자는 정수부에서 제외
+        is_integer = is_digit & ~np.logical_or.accumulate(is_dot, axis=0)
+        integer_digit = is_integer.view(np.uint8)
+        # 숫자인 칸은 value * 10 + 숫자, 나머지 칸은 value * 1 + 0
+        multipliers = integer_digit * np.uint8(9) + np.uint8(1)
+        digits = classes * integer_digit
+
+        block_values = values[start:start + BLOCK_ROWS]
+        for position in range(classes.shape[0]):
+            block_values *= multipliers[position]
+            block_values += digits[position]
+
+        block_missing = ((classes == _INVALID).any(axis=0) | ~is_digit.any(axis=0)
+                         | (is_dot.sum(axis=0, dtype=np.int64) > 1))
+
+        # 공백 앞뒤에 모두 숫자(또는 소수점, 부호)가 있으면 값 가운데의 공백
+        # (공백이 있는 행만 검사, '- 5'도 결측)
+        is_sign = classes == _SIGN
+        spaced = np.flatnonzero((classes == _SPACE).any(axis=0))
+        if spaced.size:
+            is_number = (is_digit | is_dot | is_sign)[:, spaced]
+            before = np.logical_or.accumulate(is_number, axis=0)
+            after = np.logical_or.accumulate(is_number[::-1], axis=0)[::-1]
+            block_missing[spaced] |= ((classes[:, spaced] == _SPACE) & before & after).any(axis=0)
+
+        # 앞자리 0을 뺀 정수부 자릿수가 MAX_DIGITS보다 길면 넘침 (정수부가 긴 행만 검사)
+        long_rows = np.flatnonzero(integer_digit.sum(axis=0) > MAX_DIGITS)
+        if long_rows.size:
+            integer = is_integer[:, long_rows]
+            leading = np.logical_or.accumulate(integer & (classes[:, long_rows] > 0), axis=0)
+            block_missing[long_rows] |= (integer & leading).sum(axis=0) > MAX_DIGITS
+
+        # 부호는 하나만, 숫자와 소수점보다 앞에 있어야 함 (부호가 있는 행만 검사)
+        signed = np.flatnonzero(is_sign.any(axis=0))
+        if signed.size:
+            sign = is_sign[:, signed]
+            seen_number = np.logical_or.accumulate((is_digit | is_dot)[:, signed], axis=0)
+            block_missing[signed] |= ((sign.sum(axis=0) > 1) | (sign & seen_number).any(axis=0))
+            negative = (codes[:, start:start + BLOCK_ROWS][:, signed] == ord('-')).any(axis=0)
+            block_values[signed[negative]] *= -1
+
+        missing[start:start + BLOCK_ROWS] = block_missing
+        block_values[block_missing] = 0
+    return values, missing
+
+
+def parse_count_buffer(buffer: bytes, separator: bytes = b'\n') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    구분자로 나뉜 바이트 버퍼(예: CSV 한 컬럼)를 한 번에 int64 배열로 변환합니다.
+
+    버퍼를 파이썬 문자열로 나누지 않고, 구분자 위치로부터 각 값의 시작과 길이를
+    구한 뒤 글자 위치마다 한 번씩 모아 (글자 위치 × 행) 행렬을 만듭니다.
+
+    Args:
+        buffer: 값들이 separator로 구분된 바이트 문자열
+        separator: 1바이트 값 구분자
+
+    Returns:
+        (int64 값 배열, 결측이면 True인 bool 배열) 튜플
+    """
+    if len(separator) != 1:
+        raise ValueError('구분자는 1바이트여야 합니다.')
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if data.size and data[-1] == separator[0]:
+        data = data[:-1]
+    if data.size == 0 and not buffer:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+
+    breaks = np.flatnonzero(data == separator[0])
+    starts = np.concatenate(([0], breaks + 1))
+    lengths = np.concatenate((breaks, [data.size])) - starts
+    width = max(int(lengths.max()), 1)
+
+    # 마지막 값 뒤를 0으로 채워 범위를 벗어난 위치도 그대로 모을 수 있게 함
+    padded = np.concatenate((data, np.zeros(width, dtype=np.uint8)))
+    codes = np.empty((width, len(starts)), dtype=np.uint8)
+    for position in range(width):
+        np.multiply(padded[starts + position], position < lengths, out=codes[position])
+    return _parse_positions(codes)
+
+
+def parse_counts(values) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    숫자 문자열 컬럼 전체를 한 번에 int64 배열로 변환합니다.
+
+    값이 모두 줄바꿈 없는 문자열이면 값마다 줄바꿈을 붙여 하나의 바이트 버퍼로
+    이어 붙인 뒤 parse_count_buffer로 변환하고, 숫자나 결측 객체가 섞여 있으면 고정 길이
+    유니코드 배열로 바꾸어 변환합니다.
+
+    Args:
+        values: 문자열(또는 숫자) 시퀀스, NumPy 배열, pandas Series
+            (None, NaN, pd.NA는 결측으로 처리)
+
+    Returns:
+        (int64 값 배열, 결측이면 True인 bool 배열) 튜플
+    """
+    items = np.asarray(values, dtype=object).tolist()
+    if not items:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+
+    try:
+        # 값마다 줄바꿈으로 끝내야 마지막 값이 빈 문자열이어도 행 수가 유지됨
+        # (parse_count_buffer는 버퍼 끝의 구분자 하나를 마지막 값의 끝으로 봄)
+        text = '\n'.join(items) + '\n'
+    except TypeError:
+        text = None
+    if text is not None and text.count('\n') == len(items):
+        values, missing = parse_count_buffer(text.encode('utf-8'))
+        assert len(values) == len(items)
+        return values, missing
+
+    # None, NaN, pd.NA는 'None', 'nan', '<NA>' 문자열이 되어 허용되지 않은 글자로 결측 처리됨
+    unicode_text = np.array(items, dtype=object).astype(np.str_)
+    # 'U' 배열은 글자마다 UCS-4 코드 하나이므로 (행 × 글자) 행렬로 볼 수 있음
+    codes = unicode_text.view(np.uint32).reshape(len(unicode_text), -1)
+    # 255보다 큰 코드(한글 등)는 255로 모아 허용되지 않은 글자로 분류
+    codes = np.ascontiguousarray(np.minimum(codes, 255).astype(np.uint8).T)
+    return _parse_positions(codes)
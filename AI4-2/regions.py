@@ -0,0 +1,236 @@
+"""
+시군구별 인구 분석 모듈
+
+데이터를 행정구역별(시군구) 값으로 나누고, 지역마다 집계 큐브, 통계표,
+트렌드 리포터를 프로세스 풀에서 동시에 만든 뒤 지역별 요약표로 합칩니다.
+"""
+
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from aggregation import AGE_ORDER, GENDERS, build_population_cube
+from report import format_trend_report
+
+REGION_COLUMN = '행정구역별(시군구)'
+SUMMARY_FILE_NAME = 'region_summary.csv'
+OLD_AGES = ['65~69세', '70~74세', '75~79세', '80~84세', '85세이상']
+YOUNG_AGES = ['15~19세', '20~24세', '25~29세']
+
+# 작업 프로세스 하나에 평균적으로 돌아가는 묶음 수 (작을수록 한 묶음이 커짐)
+BATCHES_PER_WORKER = 4
+
+
+def partition_by_region(df: pd.DataFrame) -> List[Tuple[str, pd.DataFrame]]:
+    """
+    데이터를 행정구역별(시군구) 값으로 나눕니다.
+
+    Args:
+        df: 가구원 수 컬럼이 숫자로 변환된 DataFrame
+
+    Returns:
+        (지역 이름, 지역 DataFrame) 리스트 (지역 이름 순)
+    """
+    return [(str(region), group)
+            for region, group in df.groupby(REGION_COLUMN, sort=True, observed=True)]
+
+
+def region_directory_name(region: str) -> str:
+    """
+    지역 이름을 폴더 이름으로 쓸 수 있게 바꿉니다.
+
+    Args:
+        region: 지역 이름
+
+    Returns:
+        경로 구분자 등 특수 문자를 '_'로 바꾼 이름
+    """
+    return re.sub(r'[\\/:*?"<>|\s]+', '_', region.strip()) or '_'
+
+
+def assign_directory_names(regions: Sequence[str]) -> Dict[str, str]:
+    """
+    지역마다 서로 겹치지 않는 폴더 이름을 정합니다.
+
+    region_directory_name으로 바꾼 이름이 같은 지역이 여럿이면('A B'와 'A_B' 등)
+    지역 이름의 해시 앞부분을 붙여 구분합니다. 해시는 지역 이름으로만 정해지므로
+    실행할 때마다 같은 폴더 이름이 나옵니다.
+
+    Args:
+        regions: 지역 이름 리스트
+
+    Returns:
+        {지역 이름: 폴더 이름} 딕셔너리
+    """
+    names = {region: region_directory_name(region) for region in regions}
+    counts: Dict[str, int] = {}
+    for name in names.values():
+        counts[name] = counts.get(name, 0) + 1
+
+    used = {name for name in names.values() if counts[name] == 1}
+    for region in sorted(regions):
+        if counts[names[region]] == 1:
+            continue
+        digest = hashlib.sha256(region.encode('utf-8')).hexdigest()
+        # 해시를 붙인 이름이 다른 지역 이름과 또 겹치면 해시를 더 길게 붙임
+        length = 8
+        while f'{names[region]}_{digest[:length]}' in used:
+            length += 8
+        names[region] = f'{names[region]}_{digest[:length]}'
+        used.add(names[region])
+    return names
+
+
+def _change_rate(first: float, last: float) -> Optional[float]:
+    """
+    첫 값 대비 마지막 값의 변화율(%)을 계산합니다.
+
+    Args:
+        first: 첫 값
+        last: 마지막 값
+
+    Returns:
+        변화율 또는 첫 값이 0 이하이면 None
+    """
+    if first <= 0:
+        return None
+    return (last - first) / first * 100
+
+
+def summarize_region(region: str, cube) -> Dict[str, object]:
+    """
+    지역 하나의 트렌드 요약 지표를 계산합니다.
+
+    시작/종료인구와 성별 비율은 AGE_ORDER의 연령대만 더하여 15~64세,
+    65세이상 같은 묶음 행이 두 번 세어지지 않게 합니다.
+
+    Args:
+        region: 지역 이름
+        cube: 지역의 일반가구원 합계 큐브
+
+    Returns:
+        요약표의 한 행이 될 딕셔너리
+    """
+    age_table = cube.age_year_table()
+    gender_table = cube.gender_year_table(ages=AGE_ORDER).reindex(columns=GENDERS)
+    totals = age_table[[age for age in AGE_ORDER if age in age_table.columns]].sum(axis=1)
+    first_year, last_year = totals.index[0], totals.index[-1]
+
+    def group_total(ages: List[str], position: int) -> int:
+        columns = [age for age in ages if age in age_table.columns]
+        return int(age_table[columns].iloc[position].sum())
+
+    male, female = (gender_table[gender].get(last_year) for gender in GENDERS)
+    known = pd.notna(male) and pd.notna(female) and male + female > 0
+
+    return {
+        '지역': region,
+        '시작연도': int(first_year),
+        '종료연도': int(last_year),
+        '시작인구': int(totals[first_year]),
+        '종료인구': int(totals[last_year]),
+        '전체변화율(%)': _change_rate(totals[first_year], totals[last_year]),
+        '남자비율(%)': male / (male + female) * 100 if known else None,
+        '고령인구변화율(%)': _change_rate(group_total(OLD_AGES, 0), group_total(OLD_AGES, -1)),
+        '청년층변화율(%)': _change_rate(group_total(YOUNG_AGES, 0), group_total(YOUNG_AGES, -1)),
+    }
+
+
+def analyze_region(region: str, df: pd.DataFrame, output_dir: str,
+                   directory_name: Optional[str] = None) -> Dict[str, object]:
+    """
+    지역 하나의 통계표와 트렌드 리포터를 저장하고 요약 지표를 반환합니다.
+
+    프로세스 풀에서 실행되므로 결과를 화면에 출력하지 않습니다.
+
+    Args:
+        region: 지역 이름
+        df: 지역 DataFrame
+        output_dir: 지역별 결과를 저장할 상위 폴더
+        directory_name: 지역 폴더 이름 (None이면 region_directory_name 결과)
+
+    Returns:
+        요약표의 한 행이 될 딕셔너리
+    """
+    cube = build_population_cube(df)
+    region_dir = os.path.join(output_dir, directory_name or region_directory_name(region))
+    os.makedirs(region_dir, exist_ok=True)
+
+    cube.gender_year_table().to_csv(
+        os.path.join(region_dir, 'gender_year_statistics.csv'), encoding='utf-8')
+    cube.age_year_table().to_csv(
+        os.path.join(region_dir, 'age_statistics.csv'), encoding='utf-8')
+    with open(os.path.join(region_dir, 'population_trend_report.txt'), 'w',
+              encoding='utf-8') as file:
+        file.write(format_trend_report(cube, region=region))
+
+    row = summarize_region(region, cube)
+    row['폴더'] = os.path.basename(region_dir)
+    return row
+
+
+def _analyze_batch(batch: List[Tuple[str, pd.DataFrame, str]],
+                   output_dir: str) -> List[Dict[str, object]]:
+    """
+    여러 지역을 차례로 분석합니다. 프로세스 풀에 넘기는 작업 단위입니다.
+
+    Args:
+        batch: (지역 이름, 지역 DataFrame, 폴더 이름) 리스트
+        output_dir: 지역별 결과를 저장할 상위 폴더
+
+    Returns:
+        요약 딕셔너리 리스트
+    """
+    return [analyze_region(region, df, output_dir, directory_name)
+            for region, df, directory_name in batch]
+
+
+def analyze_regions(df: pd.DataFrame, output_dir: str,
+                    workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    모든 지역을 프로세스 풀에서 분석하고 지역별 요약표를 저장합니다.
+
+    지역들을 행 수가 고르게 섞이도록 여러 묶음으로 나누어 작업 프로세스에
+    보내므로, 지역 수가 수백 개여도 작업 전달 비용이 작고 코어 수에 따라
+    실행 시간이 줄어듭니다.
+
+    Args:
+        df: 가구원 수 컬럼이 숫자로 변환된 DataFrame
+        output_dir: 결과를 저장할 폴더
+        workers: 프로세스 개수 (None이면 CPU 코어 수)
+
+    Returns:
+        지역별 요약 DataFrame (지역 이름 순)
+    """
+    partitions = partition_by_region(df)
+    if not partitions:
+        raise ValueError('분석할 지역이 없습니다.')
+
+    # 폴더 이름이 겹치는 지역이 서로의 결과를 덮어쓰지 않도록 미리 정해 둠
+    directory_names = assign_directory_names([region for region, _ in partitions])
+    partitions = [(region, group, directory_names[region]) for region, group in partitions]
+
+    os.makedirs(output_dir, exist_ok=True)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(partitions)))
+
+    if workers == 1:
+        rows = _analyze_batch(partitions, output_dir)
+    else:
+        # 큰 지역부터 돌아가며 배정하여 묶음별 행 수를 비슷하게 맞춤
+        batch_count = min(len(partitions), workers * BATCHES_PER_WORKER)
+        batches = [[] for _ in range(batch_count)]
+        ordered = sorted(partitions, key=lambda item: len(item[1]), reverse=True)
+        for i, partition in enumerate(ordered):
+            batches[i % batch_count].append(partition)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_analyze_batch, batch, output_dir) for batch in batches]
+            rows = [row for future in futures for row in future.result()]
+
+    summary = pd.DataFrame(rows).sort_values('지역', ignore_index=True)
+    summary.to_csv(os.path.join(output_dir, SUMMARY_FILE_NAME), index=False, encoding='utf-8')
+    return summary
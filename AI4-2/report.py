@@ -0,0 +1,186 @@
+"""
+인구 변화 트렌드 리포터 모듈
+
+집계 큐브와 연도별 요약 저장소로부터 리포터 본문을 만듭니다. 전체 분석(main.py)과
+시군구별 분석(regions.py)이 함께 사용합니다.
+"""
+
+import io
+from typing import Optional
+
+# 그래프와 리포터에 표시하는 연령대 순서는 집계 모듈의 정의를 그대로 사용
+from aggregation import AGE_ORDER
+
+# 그래프에 표시하는 성별 순서
+CHART_GENDERS = ['남자', '여자']
+
+
+def format_trend_report(cube, region: Optional[str] = None, year_store=None) -> str:
+    """
+    연령별 그래프의 변화를 보고 인구의 변화 트렌드를 정리한 리포터 본문을 만듭니다.
+    
+    리포터의 연도별, 연령별, 성별 합계는 모두 집계 큐브에서 잘라내어 계산합니다.
+    연도별 요약 저장소가 주어지면 전년 대비 변화, 연평균 성장률, 추세 예측을 덧붙입니다.
+    
+    Args:
+        cube: 일반가구원 합계 큐브 (get_population_cube 결과)
+        region: 리포터에 표시할 지역 이름 (None이면 표시하지 않음)
+        year_store: 연도별 요약 저장소 DataFrame (None이면 추세 분석 생략)
+        
+    Returns:
+        리포터 문자열 (큐브에 연도 데이터가 없으면 ValueError)
+    """
+    import pandas as pd
+    
+    if not cube.years:
+        raise ValueError('리포터를 작성할 연도 데이터가 없습니다.')
+    
+    gender_totals = cube.gender_year_table().reindex(columns=['남자', '여자'])
+    age_statistics_df = cube.age_year_table()
+    
+    f = io.StringIO()
+    f.write('=' * 80 + '\n')
+    f.write('인구 변화 트렌드 분석 리포터\n')
+    f.write('=' * 80 + '\n\n')
+    
+    if region is not None:
+        f.write(f'대상 지역: {region}\n')
+    
+    # 데이터 기간
+    years = list(gender_totals.index)
+    f.write(f'분석 기간: {years[0]}년 ~ {years[-1]}년 ({len(years)}년간)\n\n')
+    
+    # 전체 인구 변화
+    f.write('1. 전체 인구 변화\n')
+    f.write('-' * 80 + '\n')
+    
+    total_by_year = age_statistics_df.sum(axis=1)
+    for year in years:
+        if year in total_by_year.index:
+            f.write(f'{year}년: {int(total_by_year[year]):,}명\n')
+    
+    first_year_total = total_by_year[years[0]]
+    last_year_total = total_by_year[years[-1]]
+    change_rate = ((last_year_total - first_year_total) / first_year_total) * 100
+    f.write(f'\n전체 변화율: {change_rate:.2f}% '
+           f'({int(first_year_total):,}명 → {int(last_year_total):,}명)\n\n')
+    
+    # 연령대별 변화
+    f.write('2. 연령대별 인구 변화\n')
+    f.write('-' * 80 + '\n')
+    
+    for age_group in AGE_ORDER:
+        if age_group in age_statistics_df.columns:
+            first_value = age_statistics_df[age_group].iloc[0]
+            last_value = age_statistics_df[age_group].iloc[-1]
+    
+            if pd.notna(first_value) and pd.notna(last_value):
+                change = last_value - first_value
+                change_rate = (change / first_value) * 100 if first_value > 0 else 0
+                f.write(f'{age_group}: {int(first_value):,}명 → {int(last_value):,}명 '
+                       f'({change_rate:+.2f}%)\n')
+    
+    # 성별 변화
+    f.write('\n3. 성별 인구 변화\n')
+    f.write('-' * 80 + '\n')
+    
+    male_data = gender_totals['남자'].dropna()
+    female_data = gender_totals['여자'].dropna()
+    
+    for year in years:
+        if year in male_data.index and year in female_data.index:
+            male_count = int(male_data[year])
+            female_count = int(female_data[year])
+            total = male_count + female_count
+            male_ratio = (male_count / total) * 100 if total > 0 else 0
+            female_ratio = (female_count / total) * 100 if total > 0 else 0
+            f.write(f'{year}년: 남자 {male_count:,}명 ({male_ratio:.2f}%), '
+                   f'여자 {female_count:,}명 ({female_ratio:.2f}%)\n')
+    
+    # 주요 트렌드 분석
+    f.write('\n4. 주요 트렌드 분석\n')
+    f.write('-' * 80 + '\n')
+    
+    # 고령화 추세
+    old_ages = ['65~69세', '70~74세', '75~79세', '80~84세', '85세이상']
+    old_pop_first = sum([age_statistics_df[age].iloc[0] 
+                        for age in old_ages if age in age_statistics_df.columns 
+                        and pd.notna(age_statistics_df[age].iloc[0])])
+    old_pop_last = sum([age_statistics_df[age].iloc[-1] 
+                       for age in old_ages if age in age_statistics_df.columns 
+                       and pd.notna(age_statistics_df[age].iloc[-1])])
+    
+    if old_pop_first > 0:
+        old_change_rate = ((old_pop_last - old_pop_first) / old_pop_first) * 100
+        f.write(f'고령 인구(65세 이상) 변화: {int(old_pop_first):,}명 → {int(old_pop_last):,}명 '
+               f'({old_change_rate:+.2f}%)\n')
+    
+    # 청년층 추세
+    young_ages = ['15~19세', '20~24세', '25~29세']
+    young_pop_first = sum([age_statistics_df[age].iloc[0] 
+                          for age in young_ages if age in age_statistics_df.columns 
+                          and pd.notna(age_statistics_df[age].iloc[0])])
+    young_pop_last = sum([age_statistics_df[age].iloc[-1] 
+                         for age in young_ages if age in age_statistics_df.columns 
+                         and pd.notna(age_statistics_df[age].iloc[-1])])
+    
+    if young_pop_first > 0:
+        young_change_rate = ((young_pop_last - young_pop_first) / young_pop_first) * 100
+        f.write(f'청년층(15~29세) 변화: {int(young_pop_first):,}명 → {int(young_pop_last):,}명 '
+               f'({young_change_rate:+.2f}%)\n')
+    
+    if year_store is not None and len(year_store) >= 2:
+        f.write(format_year_trends(year_store))
+    
+    f.write('\n' + '=' * 80 + '\n')
+    f.write('리포터 작성 완료\n')
+    f.write('=' * 80 + '\n')
+    
+    return f.getvalue()
+
+
+def format_year_trends(year_store) -> str:
+    """
+    연도별 요약 저장소로부터 전년 대비 변화와 성장률, 추세 예측 절을 만듭니다.
+    
+    Args:
+        year_store: 연도별 요약 저장소 DataFrame (2개 연도 이상)
+        
+    Returns:
+        리포터에 덧붙일 문자열
+    """
+    from trends import TOTAL_COLUMN, compound_annual_growth, forecast, year_over_year
+    
+    f = io.StringIO()
+    columns = [TOTAL_COLUMN] + CHART_GENDERS + [age for age in AGE_ORDER 
+                                                if age in year_store.columns]
+    store = year_store.reindex(columns=columns, fill_value=0)
+    
+    # 전년 대비 변화
+    f.write('\n5. 전년 대비 인구 변화\n')
+    f.write('-' * 80 + '\n')
+    
+    deltas, rates = year_over_year(store)
+    for year in store.index[1:]:
+        parts = [f'{column} {int(deltas.at[year, column]):+,}명 ({rates.at[year, column]:+.2f}%)'
+                 for column in [TOTAL_COLUMN] + CHART_GENDERS 
+                 if rates.at[year, column] == rates.at[year, column]]
+        f.write(f'{year}년: ' + ', '.join(parts) + '\n')
+    
+    # 연평균 성장률과 추세 예측
+    growth = compound_annual_growth(store)
+    linear, exponential = forecast(store)
+    target_year = linear.index[-1]
+    f.write('\n6. 연평균 성장률(CAGR) 및 추세 예측\n')
+    f.write('-' * 80 + '\n')
+    f.write(f'기준: {store.index[0]}년 ~ {store.index[-1]}년, '
+            f'예측: 선형 / 지수 추세 {target_year}년\n')
+    
+    for column in columns:
+        line = f'{column}: CAGR {growth[column]:+.2f}%, 선형 {linear.at[target_year, column]:,.0f}명'
+        exp_value = exponential.at[target_year, column]
+        if exp_value == exp_value:
+            line += f', 지수 {exp_value:,.0f}명'
+        f.write(line + '\n')
+    
+    return f.getvalue()
@@ -0,0 +1,210 @@
+"""
+연도별 인구 요약 저장소 및 추세 분석 모듈
+
+연도별 합계(전체, 성별, 연령별)를 CSV 저장소에 한 행씩 보관하고, 새 연도의
+데이터가 들어오거나 이미 저장된 연도의 원본 행이 바뀌면 그 연도만 다시 집계합니다.
+저장소로부터 전년 대비 증감, 연평균 성장률(CAGR), 선형/지수 추세 예측을 모든
+컬럼에 대해 한 번에 계산합니다.
+"""
+
+import os
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from aggregation import AGE_ORDER, GENDERS, GROUP_COLUMNS, VALUE_COLUMN, build_population_cube
+
+TOTAL_COLUMN = '전체'
+# 저장소에 연도별 원본 행 해시를 기록하는 컬럼 (분석 결과에는 포함하지 않음)
+HASH_COLUMN = '원본해시'
+# 요약 방식이 바뀌면 올려서 예전 방식으로 집계된 저장소 행을 다시 집계하게 함
+# (2: 전체/성별 합계에서 15~64세, 65세이상 묶음 행 제외)
+VERSION_COLUMN = '집계버전'
+SUMMARY_VERSION = 2
+FORECAST_YEARS = 3
+
+
+def load_year_store(path: str) -> pd.DataFrame:
+    """
+    연도별 요약 저장소를 읽습니다. 파일이 없으면 빈 DataFrame을 반환합니다.
+
+    Args:
+        path: 저장소 CSV 경로
+
+    Returns:
+        시점 인덱스의 연도별 합계 DataFrame
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(index=pd.Index([], name='시점', dtype=np.int64))
+    return pd.read_csv(path, index_col='시점', encoding='utf-8').astype(np.int64)
+
+
+def save_year_store(store: pd.DataFrame, path: str) -> None:
+    """
+    연도별 요약 저장소를 CSV로 저장합니다.
+
+    Args:
+        store: 연도별 합계 DataFrame
+        path: 저장 경로
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    # 쓰는 도중 중단되어도 기존 저장소가 깨지지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = path + '.tmp'
+    store.to_csv(temp_path, encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def summarize_years(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    데이터에 있는 연도들의 요약 행을 만듭니다.
+
+    Args:
+        df: 가구원 수 컬럼이 숫자로 변환된 DataFrame
+
+    전체와 성별 합계는 AGE_ORDER의 연령대만 더하므로 15~64세, 65세이상 같은
+    묶음 행이 두 번 세어지지 않습니다.
+
+    Returns:
+        시점 인덱스와 전체, 성별, 연령별 합계 컬럼의 DataFrame
+    """
+    cube = build_population_cube(df)
+    age_table = cube.age_year_table()
+    leaf_ages = [age for age in AGE_ORDER if age in age_table.columns]
+    gender_table = cube.gender_year_table(ages=AGE_ORDER).reindex(columns=GENDERS)
+
+    summary = pd.concat([age_table[leaf_ages].sum(axis=1).rename(TOTAL_COLUMN),
+                         gender_table, age_table], axis=1)
+    summary.columns.name = None
+    return summary.fillna(0).astype(np.int64)
+
+
+def year_source_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    연도별로 원본 행 내용의 해시를 계산합니다.
+
+    행마다 해시를 구해 연도별로 더하므로(2^64로 나눈 나머지) 행 순서와 관계없이
+    같은 행들이면 같은 값이 되고, 값 하나만 바뀌어도 그 연도의 해시가 달라집니다.
+
+    Args:
+        df: 가구원 수 컬럼이 숫자로 변환된 DataFrame
+
+    Returns:
+        시점 인덱스의 int64 해시 Series
+    """
+    columns = [column for column in GROUP_COLUMNS + [VALUE_COLUMN] if column in df.columns]
+    row_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    codes, years = pd.factorize(df['시점'], sort=True)
+    sums = np.zeros(len(years), dtype=np.uint64)
+    np.add.at(sums, codes, row_hashes)
+    return pd.Series(sums.view(np.int64),
+                     index=pd.Index(np.asarray(years, dtype=np.int64), name='시점'))
+
+
+def update_year_store(path: str, df: pd.DataFrame,
+                      rebuild: bool = False) -> Tuple[pd.DataFrame, List[int]]:
+    """
+    저장소에 없거나 원본 행이 바뀐 연도만 다시 집계하여 저장합니다.
+
+    저장소에는 연도마다 그 연도를 집계한 원본 행의 해시가 함께 기록되어 있어,
+    이번 데이터의 해시와 다르면(발표된 과거 연도의 값이 수정된 경우 등) 그 연도를
+    다시 집계합니다. 이번 데이터에 없는 연도는 저장소에 그대로 남습니다.
+    요약 방식 버전(SUMMARY_VERSION)이 다른 행이 있으면 저장소 전체를 다시 집계합니다.
+
+    Args:
+        path: 저장소 CSV 경로
+        df: 가구원 수 컬럼이 숫자로 변환된 DataFrame
+        rebuild: True면 기존 저장소를 버리고 모든 연도를 다시 집계
+
+    Returns:
+        (갱신된 저장소, 새로 집계한 연도 리스트) 튜플 (저장소에는 해시, 버전 컬럼 제외)
+    """
+    store = load_year_store(path)
+    if rebuild:
+        store = store.iloc[0:0]
+
+    if (HASH_COLUMN not in store.columns or VERSION_COLUMN not in store.columns
+            or (store[VERSION_COLUMN] != SUMMARY_VERSION).any()):
+        # 해시 없이 저장되었거나 예전 방식으로 집계된 저장소는 버리고 모든 연도를 다시 집계
+        store = store.iloc[0:0]
+
+    hashes = year_source_hashes(df)
+    stored_hashes = store[HASH_COLUMN] if HASH_COLUMN in store.columns else pd.Series(dtype=np.int64)
+    stale_years = [year for year, value in hashes.items() if stored_hashes.get(year) != value]
+    if not stale_years:
+        return store.drop(columns=[HASH_COLUMN, VERSION_COLUMN], errors='ignore'), []
+
+    additions = summarize_years(df[df['시점'].isin(stale_years)])
+    additions[HASH_COLUMN] = hashes.reindex(additions.index)
+    additions[VERSION_COLUMN] = SUMMARY_VERSION
+    store = store.drop(index=stale_years, errors='ignore')
+    store = pd.concat([store, additions]).sort_index().fillna(0).astype(np.int64)
+    store.index.name = '시점'
+    save_year_store(store, path)
+    return (store.drop(columns=[HASH_COLUMN, VERSION_COLUMN]),
+            [int(year) for year in additions.index])
+
+
+def year_over_year(store: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    전년 대비 증감과 증감률(%)을 계산합니다.
+
+    Args:
+        store: 연도별 합계 DataFrame
+
+    Returns:
+        (증감 DataFrame, 증감률 DataFrame) 튜플 (첫 연도 행은 NaN)
+    """
+    values = store.astype(np.float64)
+    previous = values.shift(1)
+    return values - previous, (values / previous.where(previous > 0) - 1) * 100
+
+
+def compound_annual_growth(store: pd.DataFrame) -> pd.Series:
+    """
+    첫 연도부터 마지막 연도까지의 연평균 성장률(%)을 계산합니다.
+
+    Args:
+        store: 연도별 합계 DataFrame (2개 연도 이상)
+
+    Returns:
+        컬럼별 CAGR Series (첫 값이 0 이하이면 NaN)
+    """
+    first, last = store.iloc[0].astype(np.float64), store.iloc[-1].astype(np.float64)
+    span = store.index[-1] - store.index[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = (last / first.where(first > 0)) ** (1 / span) - 1
+    return growth * 100
+
+
+def forecast(store: pd.DataFrame,
+             years_ahead: int = FORECAST_YEARS) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    모든 컬럼의 선형 추세와 지수 추세를 한 번의 최소제곱 적합으로 구해 예측합니다.
+
+    Args:
+        store: 연도별 합계 DataFrame (2개 연도 이상)
+        years_ahead: 마지막 연도 이후 예측할 연도 수
+
+    Returns:
+        (선형 예측 DataFrame, 지수 예측 DataFrame) 튜플
+        (지수 예측은 0 이하 값이 있는 컬럼에서 NaN)
+    """
+    years = store.index.to_numpy(dtype=np.float64)
+    values = store.to_numpy(dtype=np.float64)
+    future = np.arange(1, years_ahead + 1) + years[-1]
+    # 연도를 중심화하여 적합의 수치 안정성을 높임
+    center = years.mean()
+    design = np.vander(future - center, 2)
+
+    # 모든 컬럼을 (연도 × 컬럼) 행렬 하나로 적합
+    linear = design @ np.polyfit(years - center, values, 1)
+
+    positive = (values > 0).all(axis=0)
+    log_values = np.log(np.where(positive, values, 1.0))
+    exponential = np.exp(design @ np.polyfit(years - center, log_values, 1))
+    exponential[:, ~positive] = np.nan
+
+    index = pd.Index(future.astype(np.int64), name='시점')
+    return (pd.DataFrame(linear, index=index, columns=store.columns),
+            pd.DataFrame(exponential, index=index, columns=store.columns))
@@ -0,0 +1,3 @@
+"""
+분석 스크립트 공용 모듈 패키지
+"""
@@ -0,0 +1,118 @@
+"""
+산출물 빌드 캐시 모듈
+
+입력 파일 내용, 관련 코드 파일, 생성 설정을 해시한 키를 산출물마다 기록해 두고,
+다음 실행에서 키가 같고 산출물 파일이 그대로 있으면 다시 만들지 않도록 합니다.
+키는 캐시 디렉터리의 매니페스트(artifacts.json)에 산출물 경로별로 저장됩니다.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Sequence
+
+MANIFEST_NAME = 'artifacts.json'
+READ_CHUNK_SIZE = 1 << 20
+
+
+def fingerprint(input_paths: Sequence[str], code_paths: Sequence[str] = (),
+                params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    입력 파일, 코드 파일, 설정값으로부터 산출물 키를 계산합니다.
+
+    파일은 경로가 아닌 내용으로 해시하므로 같은 내용이면 위치가 바뀌어도 키가 같습니다.
+
+    Args:
+        input_paths: 입력 데이터 파일 경로 리스트
+        code_paths: 산출물 생성에 관여하는 코드 파일 경로 리스트
+        params: JSON으로 직렬화할 수 있는 생성 설정 (해상도 등)
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    digest = hashlib.sha256()
+    for group in (input_paths, code_paths):
+        for path in group:
+            file_digest = hashlib.sha256()
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(READ_CHUNK_SIZE), b''):
+                    file_digest.update(chunk)
+            digest.update(file_digest.digest())
+        # 입력 파일과 코드 파일의 경계를 구분
+        digest.update(b'\0')
+
+    digest.update(json.dumps(params or {}, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """
+    산출물 경로별 빌드 키를 보관하는 매니페스트입니다.
+
+    force가 True이면 기록된 키와 관계없이 모든 산출물을 오래된 것으로 취급합니다.
+    """
+
+    def __init__(self, cache_dir: str, force: bool = False):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, MANIFEST_NAME)
+        self.force = force
+        self._entries = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        """
+        매니페스트 파일을 읽습니다. 없거나 손상되었으면 빈 딕셔너리를 반환합니다.
+
+        Returns:
+            {산출물 이름: 키} 딕셔너리
+        """
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _name(self, artifact_path: str) -> str:
+        """
+        매니페스트에 쓸 산출물 이름(캐시 디렉터리 기준 상대 경로)을 반환합니다.
+
+        Args:
+            artifact_path: 산출물 경로
+
+        Returns:
+            산출물 이름
+        """
+        return os.path.relpath(os.path.abspath(artifact_path), os.path.abspath(self.cache_dir))
+
+    def is_fresh(self, artifact_path: str, key: str) -> bool:
+        """
+        산출물이 존재하고 기록된 키가 주어진 키와 같은지 확인합니다.
+
+        Args:
+            artifact_path: 산출물 경로
+            key: 현재 입력으로 계산한 키
+
+        Returns:
+            다시 만들 필요가 없으면 True
+        """
+        if self.force or not os.path.exists(artifact_path):
+            return False
+        return self._entries.get(self._name(artifact_path)) == key
+
+    def record(self, artifact_path: str, key: str) -> None:
+        """
+        산출물의 키를 매니페스트에 기록합니다.
+
+        Args:
+            artifact_path: 생성이 끝난 산출물 경로
+            key: 산출물을 만든 입력의 키
+        """
+        # 다른 프로세스가 기록한 항목을 잃지 않도록 최신 매니페스트에 덧붙임
+        self._entries = self._load()
+        self._entries[self._name(artifact_path)] = key
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.manifest_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self._entries, file, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(temp_path, self.manifest_path)
@@ -0,0 +1,348 @@
+"""
+공용 차트 렌더링 모듈
+
+분석 스크립트들이 함께 쓰는 Matplotlib 설정과 병렬 렌더링 기능을 제공합니다.
+
+- 비대화형 Agg 백엔드를 고정하여 화면 없이 렌더링합니다.
+- 한글(CJK) 글꼴은 프로세스마다 한 번만 찾아 캐시합니다.
+- 서로 독립적인 그림들을 프로세스 풀에서 동시에 렌더링합니다.
+- 격자 그래프는 최종 출력이면 그림 하나로 그리고, 미리보기이면 패널들을 동시에
+  렌더링한 뒤 이어 붙입니다.
+- preview 인자나 CHART_PREVIEW 환경 변수로 저해상도 미리보기 모드를 켤 수 있습니다.
+"""
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+import matplotlib
+
+# pyplot을 불러오기 전에 비대화형 백엔드를 고정
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib import font_manager  # noqa: E402
+
+DEFAULT_DPI = 300
+PREVIEW_DPI = 72
+PREVIEW_ENV = 'CHART_PREVIEW'
+
+# 운영체제별로 흔히 설치되어 있는 한글 글꼴 (앞쪽이 우선)
+CJK_FONT_CANDIDATES = (
+    'AppleGothic',
+    'Apple SD Gothic Neo',
+    'Malgun Gothic',
+    'NanumGothic',
+    'Noto Sans CJK KR',
+    'Noto Sans KR',
+    'UnDotum',
+)
+
+
+class RenderJob(NamedTuple):
+    """
+    그림 하나를 렌더링하는 작업입니다.
+
+    draw는 프로세스 풀로 전달되므로 모듈 최상위에 정의된 함수여야 하며,
+    args를 받아 그린 matplotlib Figure를 반환해야 합니다.
+    """
+    draw: Callable[..., Any]
+    args: Tuple
+    output_path: str
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_cjk_font() -> Optional[str]:
+    """
+    설치된 글꼴 중 한글을 표시할 수 있는 글꼴 이름을 찾습니다.
+
+    Returns:
+        글꼴 이름 또는 None
+    """
+    available = {font.name for font in font_manager.fontManager.ttflist}
+    for name in CJK_FONT_CANDIDATES:
+        if name in available:
+            return name
+    return None
+
+
+def configure(font: Optional[str] = None) -> None:
+    """
+    현재 프로세스의 Matplotlib 글꼴 설정을 적용합니다.
+
+    Args:
+        font: 사용할 글꼴 이름 (None이면 resolve_cjk_font 결과 사용)
+    """
+    font = font or resolve_cjk_font()
+    if font:
+        plt.rcParams['font.family'] = font
+    plt.rcParams['axes.unicode_minus'] = False
+
+
+def is_preview(preview: Optional[bool] = None) -> bool:
+    """
+    미리보기 모드 여부를 반환합니다.
+
+    Args:
+        preview: 명시적인 설정 (None이면 CHART_PREVIEW 환경 변수를 따름)
+
+    Returns:
+        미리보기 모드이면 True
+    """
+    if preview is not None:
+        return preview
+    return os.environ.get(PREVIEW_ENV, '').lower() not in ('', '0', 'false', 'no')
+
+
+def resolve_dpi(preview: Optional[bool] = None) -> int:
+    """
+    모드에 맞는 저장 해상도를 반환합니다.
+
+    Args:
+        preview: 미리보기 모드 설정
+
+    Returns:
+        DPI 값
+    """
+    return PREVIEW_DPI if is_preview(preview) else DEFAULT_DPI
+
+
+def _render_job(job: RenderJob, dpi: int) -> str:
+    """
+    작업 하나를 렌더링하여 파일로 저장합니다.
+
+    Args:
+        job: 렌더링 작업
+        dpi: 저장 해상도
+
+    Returns:
+        저장된 파일 경로
+    """
+    fig = job.draw(*job.args)
+    try:
+        fig.savefig(job.output_path, dpi=dpi, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return job.output_path
+
+
+def _render_panel(draw_panel: Callable[..., Any], args: Tuple,
+                  panel_size: Tuple[float, float], dpi: int) -> np.ndarray:
+    """
+    격자 그래프의 패널 하나를 RGBA 배열로 렌더링합니다.
+
+    Args:
+        draw_panel: (ax, *args)를 받아 축에 그리는 함수
+        args: draw_panel에 넘길 인자
+        panel_size: 패널 크기 (인치)
+        dpi: 해상도
+
+    Returns:
+        (높이 × 너비 × 4) uint8 배열
+    """
+    fig, ax = plt.subplots(figsize=panel_size, dpi=dpi)
+    try:
+        draw_panel(ax, *args)
+        fig.tight_layout()
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba()).copy()
+    finally:
+        plt.close(fig)
+
+
+def _render_title(title: str, width: float, dpi: int) -> np.ndarray:
+    """
+    격자 그래프 위에 붙일 제목 띠를 RGBA 배열로 렌더링합니다.
+
+    Args:
+        title: 제목
+        width: 띠 너비 (인치)
+        dpi: 해상도
+
+    Returns:
+        (높이 × 너비 × 4) uint8 배열
+    """
+    fig = plt.figure(figsize=(width, 0.6), dpi=dpi)
+    try:
+        fig.text(0.5, 0.5, title, ha='center', va='center',
+                 fontsize=14, fontweight='bold')
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba()).copy()
+    finally:
+        plt.close(fig)
+
+
+def _fit_width(image: np.ndarray, width: int) -> np.ndarray:
+    """
+    이미지 너비를 흰색 여백 추가 또는 잘라내기로 맞춥니다.
+
+    Args:
+        image: RGBA 배열
+        width: 목표 너비 (픽셀)
+
+    Returns:
+        너비가 맞춰진 RGBA 배열
+    """
+    if image.shape[1] >= width:
+        return image[:, :width]
+    padding = np.full((image.shape[0], width - image.shape[1], 4), 255, dtype=np.uint8)
+    return np.hstack([image, padding])
+
+
+def _resolve_workers(workers: Optional[int], tasks: int) -> int:
+    """
+    실제로 사용할 프로세스 개수를 정합니다.
+
+    Args:
+        workers: 요청한 프로세스 개수 (None이면 CPU 코어 수)
+        tasks: 작업 개수
+
+    Returns:
+        1 이상 작업 개수 이하의 프로세스 개수
+    """
+    workers = workers or os.cpu_count() or 1
+    return max(1, min(workers, tasks))
+
+
+def _run(func: Callable[..., Any], tasks: Sequence[Tuple],
+         workers: Optional[int]) -> List[Any]:
+    """
+    작업들을 프로세스 풀에서 실행하고 입력 순서대로 결과를 반환합니다.
+
+    프로세스가 하나뿐이면 풀을 만들지 않고 현재 프로세스에서 실행합니다.
+
+    Args:
+        func: 실행할 최상위 함수
+        tasks: func에 넘길 인자 튜플 리스트
+        workers: 프로세스 개수
+
+    Returns:
+        결과 리스트
+    """
+    if not tasks:
+        return []
+
+    font = resolve_cjk_font()
+    workers = _resolve_workers(workers, len(tasks))
+    if workers == 1:
+        configure(font)
+        return [func(*task) for task in tasks]
+
+    # 글꼴은 부모 프로세스에서 한 번만 찾아 각 작업 프로세스에 전달
+    with ProcessPoolExecutor(max_workers=workers, initializer=configure,
+                             initargs=(font,)) as executor:
+        futures = [executor.submit(func, *task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+def render_all(jobs: Sequence[RenderJob], workers: Optional[int] = None,
+               preview: Optional[bool] = None) -> List[str]:
+    """
+    서로 독립적인 그림들을 동시에 렌더링하여 저장합니다.
+
+    Args:
+        jobs: 렌더링 작업 리스트
+        workers: 프로세스 개수 (None이면 CPU 코어 수)
+        preview: 미리보기 모드 설정 (None이면 CHART_PREVIEW 환경 변수를 따름)
+
+    Returns:
+        저장된 파일 경로 리스트 (jobs 순서)
+    """
+    dpi = resolve_dpi(preview)
+    return _run(_render_job, [(job, dpi) for job in jobs], workers)
+
+
+def _render_grid_figure(draw_panel: Callable[..., Any], panel_args: Sequence[Tuple],
+                        output_path: str, ncols: int, panel_size: Tuple[float, float],
+                        title: Optional[str], dpi: int) -> str:
+    """
+    격자 그래프를 하나의 Figure에 그려 저장합니다.
+
+    패널 간격, 축 정렬, 제목 위치를 Matplotlib의 tight_layout이 그림 전체 기준으로
+    정하므로 최종 출력은 이 방식으로 만듭니다.
+
+    Args:
+        draw_panel: (ax, *args)를 받아 패널 하나를 그리는 함수
+        panel_args: 패널별 draw_panel 인자 튜플 리스트 (행 우선 순서)
+        output_path: 저장 경로
+        ncols: 한 행의 패널 수
+        panel_size: 패널 하나의 크기 (인치)
+        title: 전체 제목
+        dpi: 저장 해상도
+
+    Returns:
+        저장된 파일 경로
+    """
+    configure()
+    nrows = -(-len(panel_args) // ncols)
+    fig, axes = plt.subplots(nrows, ncols, squeeze=False,
+                             figsize=(panel_size[0] * ncols, panel_size[1] * nrows))
+    try:
+        axes = axes.flatten()
+        for ax, args in zip(axes, panel_args):
+            draw_panel(ax, *args)
+        # 패널이 없는 빈 칸은 숨김
+        for ax in axes[len(panel_args):]:
+            ax.set_visible(False)
+
+        if title:
+            fig.suptitle(title, fontsize=14, fontweight='bold', y=0.995)
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return output_path
+
+
+def render_grid(draw_panel: Callable[..., Any], panel_args: Sequence[Tuple],
+                output_path: str, ncols: int, panel_size: Tuple[float, float],
+                title: Optional[str] = None, workers: Optional[int] = None,
+                preview: Optional[bool] = None) -> str:
+    """
+    격자 그래프를 저장합니다.
+
+    최종 출력은 모든 패널을 하나의 Figure에 그려 기존 배치(간격, 축 정렬, 제목
+    위치)를 그대로 유지합니다. 미리보기 모드에서는 빠르게 확인할 수 있도록 패널들을
+    프로세스 풀에서 동시에 렌더링한 뒤 이어 붙이므로 배치가 조금 다를 수 있습니다.
+
+    Args:
+        draw_panel: (ax, *args)를 받아 패널 하나를 그리는 최상위 함수
+        panel_args: 패널별 draw_panel 인자 튜플 리스트 (행 우선 순서)
+        output_path: 저장 경로
+        ncols: 한 행의 패널 수
+        panel_size: 패널 하나의 크기 (인치)
+        title: 전체 제목
+        workers: 미리보기 렌더링의 프로세스 개수 (None이면 CPU 코어 수)
+        preview: 미리보기 모드 설정 (None이면 CHART_PREVIEW 환경 변수를 따름)
+
+    Returns:
+        저장된 파일 경로
+    """
+    if not panel_args:
+        raise ValueError('렌더링할 패널이 없습니다.')
+
+    dpi = resolve_dpi(preview)
+    if not is_preview(preview):
+        return _render_grid_figure(draw_panel, panel_args, output_path, ncols,
+                                   panel_size, title, dpi)
+
+    panels = _run(_render_panel,
+                  [(draw_panel, args, panel_size, dpi) for args in panel_args],
+                  workers)
+
+    # 빈 칸은 흰색 패널로 채워 직사각형 격자를 만듦
+    blank = np.full_like(panels[0], 255)
+    while len(panels) % ncols:
+        panels.append(blank)
+    rows = [np.hstack(panels[i:i + ncols]) for i in range(0, len(panels), ncols)]
+    image = np.vstack(rows)
+
+    if title:
+        configure()
+        strip = _render_title(title, panel_size[0] * ncols, dpi)
+        image = np.vstack([_fit_width(strip, image.shape[1]), image])
+
+    plt.imsave(output_path, image, dpi=dpi)
+    return output_path
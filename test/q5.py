@@ -1,29 +1,247 @@
+import argparse
+import csv
+import os
+import string
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 CIPHER_TEXT = 'erkekr, DDrker ereeiic efkef'
+SHIFT_COUNT = 26
+# 영어 글자 빈도 (a~z, 합계 1)
+ENGLISH_FREQUENCIES = (
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+)
+_INVERSE_FREQUENCIES = tuple(1 / freq for freq in ENGLISH_FREQUENCIES)
+COMMON_WORDS = frozenset(
+    'the be to of and a in that have i it for not on with he as you do at this but his by '
+    'from they we say her she or an will my one all would there their what so up out if '
+    'about who get which go me when make can like time no just him know take people into '
+    'year your good some could them see other than then now look only come its over think '
+    'also back after use two how our work first well way even new want because any these '
+    'give day most us is are was were has had been hello world password secret key open door'
+    .split())
+# 사전 단어 비율로 다시 순위를 매길 카이제곱 상위 후보 수
+DICTIONARY_CANDIDATES = 3
+# 프로세스 하나에 한 번에 보내는 메시지 수
+CHUNK_SIZE = 500
+
+def _shift_tables(alphabets: tuple[str, ...]) -> tuple[dict[int, int], ...]:
+    # 26개 이동값의 복호화 표 (i칸 이동: 각 글자를 알파벳에서 i칸 앞 글자로)
+    tables = []
+    for i in range(SHIFT_COUNT):
+        source = ''.join(alphabets)
+        target = ''.join(alphabet[-i:] + alphabet[:-i] for alphabet in alphabets)
+        tables.append(str.maketrans(source, target))
+    return tuple(tables)
+
+LOWER_DECODE_TABLES = _shift_tables((string.ascii_lowercase,))
+DECODE_TABLES = _shift_tables((string.ascii_lowercase, string.ascii_uppercase))
 
-def caesar_cipher_decode(target_text: str) -> list[str]:
+def caesar_cipher_decode_matrix(target_text: str, uppercase: bool = True):
+    # 모든 이동값을 (26 × 바이트 수) uint8 행렬로 한 번에 계산
+    if np is None:
+        raise ImportError('numpy가 필요합니다.')
+    data = np.frombuffer(target_text.encode('utf-8'), dtype=np.uint8)
+    shifts = np.arange(SHIFT_COUNT, dtype=np.uint8)[:, None]
+    result = np.repeat(data[None, :], SHIFT_COUNT, axis=0)
+    for first, enabled in ((ord('a'), True), (ord('A'), uppercase)):
+        if not enabled:
+            continue
+        # uint8 뺄셈은 255에서 돌아가므로 알파벳 밖의 글자는 26 이상이 됨
+        offset = data - np.uint8(first)
+        is_letter = offset < SHIFT_COUNT
+        shifted = (offset + np.uint8(SHIFT_COUNT) - shifts) % SHIFT_COUNT + np.uint8(first)
+        np.copyto(result, shifted, where=is_letter)
+    return result
+
+def caesar_cipher_decode(target_text: str, uppercase: bool = True,
+                         use_numpy: bool = False) -> list[str]:
     if not isinstance(target_text, str):
         raise ValueError
     if target_text == '':
         raise ValueError
+    if use_numpy and np is not None:
+        matrix = caesar_cipher_decode_matrix(target_text, uppercase)
+        return [row.tobytes().decode('utf-8') for row in matrix]
+    tables = DECODE_TABLES if uppercase else LOWER_DECODE_TABLES
+    return [target_text.translate(table) for table in tables]
+
+def letter_histogram(target_text: str) -> list[int]:
+    # 대소문자 구분 없이 a~z 글자 수 (26칸)
+    counts = Counter(target_text.lower())
+    return [counts[ch] for ch in string.ascii_lowercase]
+
+def chi_squared_scores(histogram: list[int]) -> list[float]:
+    # i칸 이동으로 복호화하면 암호문 글자 (j + i) % 26이 평문 글자 j가 됨
+    # 따라서 복호화하지 않고 히스토그램을 돌려 보며 26 × 26번 계산
+    # 기대값 E_j = total * f_j 이므로 sum((h - E)^2 / E) = sum(h^2 / f) / total - total
+    total = sum(histogram)
+    if total == 0:
+        return [0.0] * SHIFT_COUNT
+    squares = [count * count for count in histogram]
+    scores = []
+    for i in range(SHIFT_COUNT):
+        weighted = sum(map(mul, squares[i:] + squares[:i], _INVERSE_FREQUENCIES))
+        scores.append(weighted / total - total)
+    return scores
+
+def word_hit_rate(text: str, words) -> float:
+    tokens = [token.strip(string.punctuation).lower() for token in text.split()]
+    tokens = [token for token in tokens if token]
+    if not tokens:
+        return 0.0
+    return sum(token in words for token in tokens) / len(tokens)
+
+def rank_shifts(target_text: str, words=None) -> list[tuple[int, float]]:
+    # (이동값, 카이제곱 점수)를 가능성이 높은 순서로 반환
+    # words(set 등 in을 지원하는 사전)를 주면 상위 후보만 복호화하여 단어 비율로 다시 정렬
+    scores = chi_squared_scores(letter_histogram(target_text))
+    ranked = sorted(range(SHIFT_COUNT), key=lambda i: (scores[i], i))
+    if words is not None:
+        top = ranked[:DICTIONARY_CANDIDATES]
+        rates = {i: word_hit_rate(target_text.translate(DECODE_TABLES[i]), words) for i in top}
+        ranked = sorted(top, key=lambda i: (-rates[i], scores[i], i)) + ranked[DICTIONARY_CANDIDATES:]
+    return [(i, scores[i]) for i in ranked]
+
+def best_shift(target_text: str, words=None) -> tuple[int, float]:
+    return rank_shifts(target_text, words)[0]
+
+def load_words(path: str) -> frozenset[str]:
+    with open(path, encoding='utf-8') as file:
+        return frozenset(line.strip().lower() for line in file if line.strip())
+
+def iter_messages(source: str):
+    # (메시지 id, 암호문)을 하나씩 읽어 옴
+    # 폴더면 파일 하나가 메시지 하나, 파일이나 '-'(표준 입력)이면 줄 하나가 메시지 하나
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            path = os.path.join(source, name)
+            if os.path.isfile(path):
+                with open(path, encoding='utf-8') as file:
+                    text = file.read().strip()
+                if text:
+                    yield name, text
+        return
+    file = sys.stdin if source == '-' else open(source, encoding='utf-8')
+    try:
+        for line_no, line in enumerate(file, 1):
+            text = line.strip()
+            if text:
+                yield str(line_no), text
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+def decrypt_chunk(chunk: list[tuple[str, str]], words=None) -> list[tuple[str, int, float, str]]:
     results = []
-    for i in range(26):
-        decoded = []
-        for ch in target_text:
-            if 'a' <= ch <= 'z':
-                code = ord(ch) - i
-                if code < ord('a'):
-                    code += 26
-                decoded.append(chr(code))
-            else:
-                decoded.append(ch)
-        results.append(''.join(decoded))
+    for message_id, text in chunk:
+        shift, score = best_shift(text, words)
+        results.append((message_id, shift, score, text.translate(DECODE_TABLES[shift])))
     return results
 
-def main() -> None:
+# 작업 프로세스마다 한 번만 받아 두는 사전 (묶음마다 다시 보내지 않음)
+_worker_words = None
+
+def _init_worker(words) -> None:
+    global _worker_words
+    _worker_words = words
+
+def _decrypt_chunk_in_worker(chunk: list[tuple[str, str]]) -> list[tuple[str, int, float, str]]:
+    return decrypt_chunk(chunk, _worker_words)
+
+def _chunks(messages, size: int):
+    messages = iter(messages)
+    while chunk := list(islice(messages, size)):
+        yield chunk
+
+def decrypt_batch(messages, output, workers: int | None = None,
+                  chunk_size: int = CHUNK_SIZE, words=COMMON_WORDS) -> int:
+    # 메시지를 chunk_size개씩 묶어 프로세스 풀에 보내고, 끝난 순서가 아니라
+    # 입력 순서대로 결과를 바로바로 씀 (동시에 처리 중인 묶음 수를 제한하여 메모리 일정)
+    if chunk_size < 1:
+        raise ValueError
+    writer = csv.writer(output, delimiter='\t', lineterminator='\n')
+    writer.writerow(['id', 'shift', 'score', 'plaintext'])
+    workers = max(1, workers or os.cpu_count() or 1)
+    count = 0
+
+    def write(rows):
+        nonlocal count
+        for message_id, shift, score, plaintext in rows:
+            writer.writerow([message_id, shift, f'{score:.2f}', plaintext])
+        count += len(rows)
+        output.flush()
+
+    if workers == 1:
+        for chunk in _chunks(messages, chunk_size):
+            write(decrypt_chunk(chunk, words))
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(words,)) as executor:
+        pending = deque()
+        for chunk in _chunks(messages, chunk_size):
+            pending.append(executor.submit(_decrypt_chunk_in_worker, chunk))
+            if len(pending) >= workers * 2:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    return count
+
+def run_batch(args) -> None:
+    words = load_words(args.words) if args.words else COMMON_WORDS
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8',
+                                                        newline='')
+    start = time.perf_counter()
+    try:
+        count = decrypt_batch(iter_messages(args.batch), output, args.workers,
+                              args.chunk_size, words)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f'{count} messages in {elapsed:.2f}s ({rate:.0f} msgs/s)', file=sys.stderr)
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'1 이상이어야 합니다: {value}')
+    return number
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Caesar cipher decoder')
+    parser.add_argument('--batch', metavar='SOURCE',
+                        help="암호문 폴더, 줄 단위 파일 또는 '-'(표준 입력)")
+    parser.add_argument('--output', default='-', help="결과 TSV 경로 (기본값 '-': 표준 출력)")
+    parser.add_argument('--workers', type=_positive_int, default=None, help='프로세스 개수')
+    parser.add_argument('--chunk-size', type=_positive_int, default=CHUNK_SIZE,
+                        help='한 번에 보낼 메시지 수')
+    parser.add_argument('--words', help='사전 단어 파일 (한 줄에 한 단어)')
+    return parser.parse_args(argv)
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    if args.batch:
+        run_batch(args)
+        return
     try:
         decode_passwords = caesar_cipher_decode(CIPHER_TEXT)
         for m, password in enumerate(decode_passwords):
             print(f"{m}: {password}")
+        shift, score = best_shift(CIPHER_TEXT, COMMON_WORDS)
+        print(f"Best guess: {shift} (chi-squared {score:.2f})")
         raw = input()
         if not isinstance(raw, str):
             raise ValueError
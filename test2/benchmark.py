@@ -0,0 +1,294 @@
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+from q1 import CircularList, ConcurrentCircularList, DoublyLinkedList, LinkedList, RingList
+from q2 import ConcurrentStack, LinkedStack, Stack
+
+N = 1_000_000
+TAIL_DELETES = 1_000
+REPEAT = 3
+TASKS = 20_000
+ROTATIONS = 1_000_000
+THREAD_COUNTS = (1, 2, 4, 8)
+THREAD_OPS = 200_000
+
+
+def measure(func, repeat=REPEAT):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(title, results):
+    print(f'[{title}]')
+    base = results[0][1]
+    for name, seconds in results:
+        print(f'  {name:<18} {seconds * 1000:10.2f} ms ({seconds / base:7.2f}x)')
+
+
+def append_each(make):
+    def run():
+        container = make()
+        for i in range(N):
+            container.append(i)
+    return run
+
+
+def iterate(container):
+    def run():
+        for _ in container:
+            pass
+    return run
+
+
+def delete_near_tail(make, count):
+    def run():
+        container = make()
+        # list, deque는 del, 연결 리스트는 delete로 삭제
+        delete = container.delete if hasattr(container, 'delete') else container.__delitem__
+        for _ in range(TAIL_DELETES):
+            delete(count - 2)
+            container.insert(count - 2, 0)
+    return run
+
+
+def benchmark_linked_list():
+    print(f'N = {N:,}')
+    data = range(N)
+
+    report('append x N', [
+        ('list', measure(append_each(list))),
+        ('deque', measure(append_each(deque))),
+        ('LinkedList', measure(append_each(LinkedList))),
+        ('DoublyLinkedList', measure(append_each(DoublyLinkedList))),
+    ])
+
+    report('extend(range(N))', [
+        ('list', measure(lambda: list(data))),
+        ('deque', measure(lambda: deque(data))),
+        ('LinkedList', measure(lambda: LinkedList.from_iterable(data))),
+        ('DoublyLinkedList', measure(lambda: DoublyLinkedList.from_iterable(data))),
+    ])
+
+    singly = LinkedList.from_iterable(data)
+    doubly = DoublyLinkedList.from_iterable(data)
+    report('iterate', [
+        ('list', measure(iterate(list(data)))),
+        ('deque', measure(iterate(deque(data)))),
+        ('LinkedList', measure(iterate(singly))),
+        ('DoublyLinkedList', measure(iterate(doubly))),
+    ])
+
+    # 끝 근처 삭제/삽입: 단일 연결은 head부터, 이중 연결은 tail부터 찾아감
+    count = 20_000
+    items = list(range(count))
+    report(f'delete/insert near tail x {TAIL_DELETES:,} (size {count:,})', [
+        ('list', measure(delete_near_tail(lambda: items[:], count))),
+        ('deque', measure(delete_near_tail(lambda: deque(items), count))),
+        ('LinkedList', measure(delete_near_tail(
+            lambda: LinkedList.from_iterable(items), count), repeat=1)),
+        ('DoublyLinkedList', measure(delete_near_tail(
+            lambda: DoublyLinkedList.from_iterable(items), count))),
+    ])
+
+
+def build_scheduler(indexed):
+    scheduler = CircularList(indexed=indexed)
+    for task_id in range(TASKS):
+        scheduler.insert(task_id)
+    return scheduler
+
+
+def remove_tasks(indexed):
+    def run():
+        scheduler = build_scheduler(indexed)
+        # 중간쯤에 있는 작업 ID를 하나씩 제거하고 다시 등록
+        for task_id in range(TASKS // 2, TASKS // 2 + TAIL_DELETES):
+            scheduler.delete(task_id)
+            scheduler.insert(task_id)
+    return run
+
+
+def rotate(scheduler):
+    def run():
+        for _ in range(ROTATIONS):
+            scheduler.get_next()
+    return run
+
+
+def benchmark_circular_list():
+    print(f'TASKS = {TASKS:,}')
+    report(f'delete/insert by id x {TAIL_DELETES:,}', [
+        ('scan', measure(remove_tasks(False), repeat=1)),
+        ('indexed', measure(remove_tasks(True))),
+    ])
+    report(f'get_next x {ROTATIONS:,}', [
+        ('scan', measure(rotate(build_scheduler(False)))),
+        ('indexed', measure(rotate(build_scheduler(True)))),
+    ])
+
+
+def allocated(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def fill(make):
+    def run():
+        ring = make()
+        for task_id in range(TASKS):
+            ring.insert(task_id)
+        return ring
+    return run
+
+
+def churn(ring):
+    # 정상 상태: 하나 꺼내고 같은 ID를 다시 넣어 크기가 유지됨
+    def run():
+        for _ in range(TAIL_DELETES):
+            task_id = ring.get_next()
+            ring.delete(task_id)
+            ring.insert(task_id)
+    return run
+
+
+def benchmark_ring_list():
+    print(f'TASKS = {TASKS:,}')
+    report(f'insert x {TASKS:,}', [
+        ('CircularList', measure(fill(CircularList))),
+        ('RingList', measure(fill(RingList))),
+        ('RingList(presized)', measure(fill(lambda: RingList(TASKS)))),
+    ])
+    report(f'get_next x {ROTATIONS:,}', [
+        ('CircularList', measure(rotate(fill(CircularList)()))),
+        ('RingList', measure(rotate(fill(RingList)()))),
+    ])
+    report(f'get_next/delete/insert x {TAIL_DELETES:,}', [
+        ('CircularList', measure(churn(fill(CircularList)()))),
+        ('CircularList(idx)', measure(churn(fill(lambda: CircularList(indexed=True))()))),
+        ('RingList', measure(churn(fill(RingList)()))),
+    ])
+
+    print('[peak bytes allocated during churn]')
+    for name, make in (('CircularList', CircularList), ('RingList', RingList)):
+        ring = fill(make)()
+        print(f'  {name:<18} {allocated(churn(ring)):10,} B')
+
+
+def push_pop(make):
+    def run():
+        stack = make()
+        # list는 append/pop을 그대로 사용
+        push = stack.append if isinstance(stack, list) else stack.push
+        pop = stack.pop
+        for i in range(N):
+            push(i)
+        for _ in range(N):
+            pop()
+    return run
+
+
+def push_pop_many(make, batch=1_000):
+    def run():
+        stack = make()
+        for start in range(0, N, batch):
+            stack.push_many(range(start, start + batch))
+        for _ in range(0, N, batch):
+            stack.pop_many(batch)
+    return run
+
+
+def benchmark_stack():
+    print(f'N = {N:,} (push N, pop N)')
+    results = [
+        ('list', measure(push_pop(list))),
+        ('Stack', measure(push_pop(lambda: Stack(None)))),
+        ('LinkedStack', measure(push_pop(lambda: LinkedStack(None)))),
+        ('Stack(many)', measure(push_pop_many(lambda: Stack(None)))),
+        ('LinkedStack(many)', measure(push_pop_many(lambda: LinkedStack(None)))),
+    ]
+    report('push/pop', results)
+    for name, seconds in results:
+        print(f'  {name:<18} {2 * N / seconds / 1e6:10.2f} M ops/s')
+
+
+def run_threads(count, worker):
+    ops = THREAD_OPS // count
+    threads = [threading.Thread(target=worker, args=(ops,)) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def locked_stack_worker(stack, lock):
+    # 지금까지의 사용 방식: 일반 Stack 호출마다 바깥에서 잠금
+    def work(ops):
+        for i in range(ops):
+            with lock:
+                stack.push(i)
+            with lock:
+                stack.pop()
+    return work
+
+
+def concurrent_stack_worker(stack):
+    def work(ops):
+        for i in range(ops):
+            stack.push(i)
+            stack.pop()
+    return work
+
+
+def scheduler_worker(scheduler, lock=None):
+    def work(ops):
+        if lock is None:
+            for _ in range(ops):
+                scheduler.get_next()
+        else:
+            for _ in range(ops):
+                with lock:
+                    scheduler.get_next()
+    return work
+
+
+def benchmark_concurrency():
+    print(f'{THREAD_OPS:,} ops split across threads')
+    for count in THREAD_COUNTS:
+        # 측정 대상은 스레드 작업뿐이므로 자료구조는 모두 측정 전에 만들어 둠
+        stack, lock = Stack(None), threading.Lock()
+        concurrent_stack = ConcurrentStack(None)
+        scheduler = fill(CircularList)()
+        concurrent_scheduler = fill(ConcurrentCircularList)()
+        report(f'stack, {count} thread(s)', [
+            ('Stack+lock', measure(lambda: run_threads(
+                count, locked_stack_worker(stack, lock)))),
+            ('ConcurrentStack', measure(lambda: run_threads(
+                count, concurrent_stack_worker(concurrent_stack)))),
+        ])
+        report(f'scheduler, {count} thread(s)', [
+            ('Circular+lock', measure(lambda: run_threads(
+                count, scheduler_worker(scheduler, lock)))),
+            ('ConcurrentCircular', measure(lambda: run_threads(
+                count, scheduler_worker(concurrent_scheduler)))),
+        ])
+
+
+def main():
+    benchmark_linked_list()
+    benchmark_circular_list()
+    benchmark_ring_list()
+    benchmark_stack()
+    benchmark_concurrency()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import threading
+
+
 def main():
     pass
 
@@ -12,8 +15,15 @@ class _Node:
 class LinkedList:
     def __init__(self):
         self._head = None
+        self._tail = None
         self._size = 0
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        linked = cls()
+        linked.extend(iterable)
+        return linked
+
     def insert(self, index, value):
         if not isinstance(index, int):
             raise TypeError
@@ -24,6 +34,11 @@ class LinkedList:
         if index == 0:
             new_node.next = self._head
             self._head = new_node
+            if self._tail is None:
+                self._tail = new_node
+        elif index == self._size:
+            self._tail.next = new_node
+            self._tail = new_node
         else:
             prev = self._head
             for _ in range(index - 1):
@@ -35,6 +50,26 @@ class LinkedList:
 
         self._size += 1
 
+    def append(self, value):
+        self.insert(self._size, value)
+
+    def extend(self, iterable):
+        if iterable is self:
+            iterable = self.to_list()
+
+        tail = self._tail
+        count = 0
+        for value in iterable:
+            new_node = _Node(value)
+            if tail is None:
+                self._head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        self._tail = tail
+        self._size += count
+
     def delete(self, index):
         if not isinstance(index, int):
             raise TypeError
@@ -44,6 +79,8 @@ class LinkedList:
         if index == 0:
             deleted = self._head
             self._head = self._head.next
+            if self._head is None:
+                self._tail = None
         else:
             prev = self._head
             for _ in range(index - 1):
@@ -54,61 +91,193 @@ class LinkedList:
                 raise RuntimeError
             deleted = prev.next
             prev.next = deleted.next
+            if deleted is self._tail:
+                self._tail = prev
         self._size -= 1
         return deleted.value
 
     def to_list(self):
-        out = []
+        return list(self)
+
+    def __iter__(self):
         cur = self._head
         while cur is not None:
-            out.append(cur.value)
+            yield cur.value
             cur = cur.next
-        return out
 
     def __len__(self):
         return self._size
 
+
+class _DNode:
+    __slots__ = ('value', 'prev', 'next')
+
+    def __init__(self, value, prv=None, nxt=None):
+        self.value = value
+        self.prev = prv
+        self.next = nxt
+
+
+class DoublyLinkedList(LinkedList):
+    def _node_at(self, index):
+        # 가까운 쪽 끝에서부터 찾아감
+        if index < self._size // 2:
+            cur = self._head
+            for _ in range(index):
+                cur = cur.next
+        else:
+            cur = self._tail
+            for _ in range(self._size - 1 - index):
+                cur = cur.prev
+        return cur
+
+    def insert(self, index, value):
+        if not isinstance(index, int):
+            raise TypeError
+        if index < 0 or index > self._size:
+            raise IndexError
+
+        if index == self._size:
+            new_node = _DNode(value, self._tail, None)
+            if self._tail is None:
+                self._head = new_node
+            else:
+                self._tail.next = new_node
+            self._tail = new_node
+        else:
+            nxt = self._node_at(index)
+            new_node = _DNode(value, nxt.prev, nxt)
+            if nxt.prev is None:
+                self._head = new_node
+            else:
+                nxt.prev.next = new_node
+            nxt.prev = new_node
+
+        self._size += 1
+
+    def extend(self, iterable):
+        if iterable is self:
+            iterable = self.to_list()
+
+        tail = self._tail
+        count = 0
+        for value in iterable:
+            new_node = _DNode(value, tail, None)
+            if tail is None:
+                self._head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        self._tail = tail
+        self._size += count
+
+    def delete(self, index):
+        if not isinstance(index, int):
+            raise TypeError
+        if index < 0 or index >= self._size:
+            raise IndexError
+
+        deleted = self._node_at(index)
+        if deleted.prev is None:
+            self._head = deleted.next
+        else:
+            deleted.prev.next = deleted.next
+        if deleted.next is None:
+            self._tail = deleted.prev
+        else:
+            deleted.next.prev = deleted.prev
+        deleted.prev = deleted.next = None
+
+        self._size -= 1
+        return deleted.value
+
+    def __reversed__(self):
+        cur = self._tail
+        while cur is not None:
+            yield cur.value
+            cur = cur.prev
+
+
 class _CNode:
-    __slots__ = ('value', 'next')
+    __slots__ = ('value', 'prev', 'next')
 
-    def __init__(self, value, nxt=None):
+    def __init__(self, value, prv=None, nxt=None):
         self.value = value
+        self.prev = prv
         self.next = nxt
 
 class CircularList:
-    def __init__(self):
+    def __init__(self, indexed=False):
         self._cursor = None
         self._size = 0
+        # 값 -> 그 값을 가진 노드 리스트 (중복 값은 여러 개)
+        self._index = {} if indexed else None
 
     def insert(self, value):
+        if self._index is not None:
+            # 해시할 수 없는 값은 고리에 연결하기 전에 TypeError가 나도록 먼저 확인
+            hash(value)
+
         new_node = _CNode(value)
         if self._cursor is None:
-            new_node.next = new_node
-            self._cursor = new_node
+            new_node.prev = new_node.next = new_node
         else:
+            new_node.prev = self._cursor
             new_node.next = self._cursor.next
+            self._cursor.next.prev = new_node
             self._cursor.next = new_node
-            self._cursor = new_node
+        self._cursor = new_node
         self._size += 1
+        if self._index is not None:
+            # 연결이 끝난 뒤에 색인에 추가하고, 빈 리스트는 색인에 두지 않음
+            # (잠금 없이 읽는 search가 True인데 count가 0인 순간이 없도록)
+            nodes = self._index.get(value)
+            if nodes is None:
+                self._index[value] = [new_node]
+            else:
+                nodes.append(new_node)
 
-    def delete(self, value):
+    def _scan(self, value):
         if self._cursor is None:
-            return False
-
-        prev = self._cursor
+            return None
         cur = self._cursor.next
         for _ in range(self._size):
             if cur.value == value:
-                if self._size == 1:
-                    self._cursor = None
-                else:
-                    prev.next = cur.next
-                    if self._cursor is cur:
-                        self._cursor = prev
-                self._size -= 1
-                return True
-            prev, cur = cur, cur.next
-        return False
+                return cur
+            cur = cur.next
+        return None
+
+    def _unlink(self, node):
+        if self._size == 1:
+            self._cursor = None
+        else:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+            if self._cursor is node:
+                self._cursor = node.prev
+        node.prev = node.next = None
+        self._size -= 1
+
+    # 같은 값이 여러 개면 scan 모드는 cursor 다음부터 고리 순서로 처음 만나는 노드를,
+    # indexed 모드는 O(1)을 지키기 위해 가장 나중에 넣은 노드를 지움
+    def delete(self, value):
+        if self._index is None:
+            node = self._scan(value)
+            if node is None:
+                return False
+        else:
+            nodes = self._index.get(value)
+            if not nodes:
+                return False
+            # 마지막 하나면 키부터 지워 search와 count가 같은 상태를 보게 함
+            if len(nodes) == 1:
+                node = nodes[0]
+                del self._index[value]
+            else:
+                node = nodes.pop()
+        self._unlink(node)
+        return True
 
     def get_next(self):
         if self._cursor is None:
@@ -117,18 +286,149 @@ class CircularList:
         return self._cursor.value
 
     def search(self, value):
+        if self._index is not None:
+            return value in self._index
+        return self._scan(value) is not None
+
+    def count(self, value):
+        if self._index is not None:
+            return len(self._index.get(value, ()))
         if self._cursor is None:
-            return False
+            return 0
+        total = 0
         cur = self._cursor
         for _ in range(self._size):
-            if cur.value == value:
-                return True
+            total += cur.value == value
             cur = cur.next
-        return False
+        return total
 
     def __len__(self):
         return self._size
 
 
+class ConcurrentCircularList(CircularList):
+    # 여러 스레드가 get_next로 작업을 나눠 가지는 스케줄러
+    # 변경은 잠금 안에서, indexed 모드의 search/count는 dict 조회만 하므로 잠금 없이 읽음
+    # 색인에는 고리에 연결된 뒤에 추가되고 고리에서 끊기 전에 지워지며 빈 리스트는 남지
+    # 않으므로, search가 True면 count는 1 이상. 다만 읽은 직후 다른 스레드가 바꿀 수 있으므로
+    # search 결과에 맞춰 다른 작업을 하려면 잠금을 잡는 메서드를 쓸 것
+    def __init__(self, indexed=False):
+        super().__init__(indexed)
+        self._lock = threading.Lock()
+
+    def insert(self, value):
+        with self._lock:
+            super().insert(value)
+
+    def delete(self, value):
+        with self._lock:
+            return super().delete(value)
+
+    def get_next(self):
+        with self._lock:
+            if self._cursor is None:
+                return None
+            self._cursor = self._cursor.next
+            return self._cursor.value
+
+    def search(self, value):
+        if self._index is not None:
+            return value in self._index
+        with self._lock:
+            return super().search(value)
+
+    def count(self, value):
+        if self._index is not None:
+            return len(self._index.get(value, ()))
+        with self._lock:
+            return super().count(value)
+
+
+# 비어 있는 칸 표시 (삭제된 값 자리)
+_EMPTY = object()
+
+
+class RingList:
+    def __init__(self, capacity=16):
+        capacity = max(1, capacity)
+        self._values = [_EMPTY] * capacity
+        self._prev = [0] * capacity
+        # 빈 칸들은 _next로 이어진 free list를 이룸 (-1이 끝)
+        self._next = list(range(1, capacity)) + [-1]
+        self._free = 0
+        self._cursor = -1
+        self._size = 0
+
+    def _grow(self):
+        old = len(self._values)
+        self._values.extend([_EMPTY] * old)
+        self._prev.extend([0] * old)
+        self._next.extend(range(old + 1, old * 2))
+        self._next.append(-1)
+        self._free = old
+
+    def insert(self, value):
+        if self._free < 0:
+            self._grow()
+        prv, nxt = self._prev, self._next
+        slot = self._free
+        self._free = nxt[slot]
+        self._values[slot] = value
+
+        if self._cursor < 0:
+            prv[slot] = nxt[slot] = slot
+        else:
+            after = nxt[self._cursor]
+            prv[slot] = self._cursor
+            nxt[slot] = after
+            prv[after] = slot
+            nxt[self._cursor] = slot
+        self._cursor = slot
+        self._size += 1
+
+    def _scan(self, value):
+        # CircularList와 같이 cursor 다음 칸부터 고리 순서로 살아 있는 칸만 훑음
+        if self._cursor < 0:
+            return -1
+        values, nxt = self._values, self._next
+        slot = nxt[self._cursor]
+        for _ in range(self._size):
+            if values[slot] == value:
+                return slot
+            slot = nxt[slot]
+        return -1
+
+    def delete(self, value):
+        slot = self._scan(value)
+        if slot < 0:
+            return False
+
+        prv, nxt = self._prev, self._next
+        if self._size == 1:
+            self._cursor = -1
+        else:
+            before, after = prv[slot], nxt[slot]
+            nxt[before] = after
+            prv[after] = before
+            if self._cursor == slot:
+                self._cursor = before
+        self._values[slot] = _EMPTY
+        nxt[slot] = self._free
+        self._free = slot
+        self._size -= 1
+        return True
+
+    def get_next(self):
+        if self._cursor < 0:
+            return None
+        self._cursor = self._next[self._cursor]
+        return self._values[self._cursor]
+
+    def search(self, value):
+        return self._scan(value) >= 0
+
+    def __len__(self):
+        return self._size
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
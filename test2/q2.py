@@ -1,7 +1,12 @@
+import threading
+
+
 def main():
     pass
 
 class Node:
+    __slots__ = ('item', 'next')
+
     def __init__(self, item, next=None):
         self.item = item
         self.next = next
@@ -10,7 +15,87 @@ class Node:
 class Stack:
     MAX_SIZE = 10
 
-    def __init__(self):
+    # max_size=None이면 크기 제한 없음
+    # raise_errors=True이면 가득 참/비어 있음을 예외로, 아니면 False/None으로 알림
+    def __init__(self, max_size=MAX_SIZE, raise_errors=False):
+        self._items = []
+        self._max_size = max_size
+        self._raise_errors = raise_errors
+
+    def _overflow(self):
+        if self._raise_errors:
+            raise OverflowError('Stack is Full!')
+        return False
+
+    def _underflow(self):
+        if self._raise_errors:
+            raise IndexError('Empty Stack!')
+        return None
+
+    def _room(self):
+        if self._max_size is None:
+            return None
+        return self._max_size - len(self)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def size(self):
+        return len(self._items)
+
+    def push(self, item) -> bool:
+        if self._max_size is not None and len(self._items) >= self._max_size:
+            return self._overflow()
+        self._items.append(item)
+        return True
+
+    # 들어갈 수 있는 만큼만 넣고 넣은 개수를 반환 (raise_errors면 하나도 넣지 않고 예외)
+    def push_many(self, items) -> int:
+        items = list(items)
+        room = self._room()
+        if room is not None and room < len(items):
+            self._overflow()
+            items = items[:max(room, 0)]
+        self._items.extend(items)
+        return len(items)
+
+    def pop(self) -> object | None:
+        if not self._items:
+            return self._underflow()
+        return self._items.pop()
+
+    # 위에서부터 최대 count개를 꺼낸 리스트 (raise_errors면 모자랄 때 예외)
+    def pop_many(self, count) -> list:
+        if count > len(self._items):
+            self._underflow()
+            count = len(self._items)
+        if count <= 0:
+            return []
+        popped = self._items[-count:]
+        del self._items[-count:]
+        popped.reverse()
+        return popped
+
+    def peek(self) -> object | None:
+        if not self._items:
+            return self._underflow()
+        return self._items[-1]
+
+    def __len__(self):
+        return self.size()
+
+    # 위(top)에서 아래 순서
+    def __iter__(self):
+        return reversed(self._items)
+
+    def __str__(self):
+        return f'Stack({self._items})'
+
+
+class LinkedStack(Stack):
+    def __init__(self, max_size=Stack.MAX_SIZE, raise_errors=False):
+        super().__init__(max_size, raise_errors)
+        self._items = None
         self._top = None
         self._size = 0
 
@@ -21,38 +106,138 @@ class Stack:
         return self._size
 
     def push(self, item) -> bool:
-        if self.size() >= self.MAX_SIZE:
-            print(f'Stack is Full!')
-            return False
-
-        new_node = Node(item, self._top)
-        self._top = new_node
+        if self._max_size is not None and self._size >= self._max_size:
+            return self._overflow()
+        self._top = Node(item, self._top)
         self._size += 1
         return True
 
-    def pop(self) -> object | None:
-        if self.empty():
-            print('Empty Stack!')
-            return None
+    def push_many(self, items) -> int:
+        items = list(items)
+        room = self._room()
+        if room is not None and room < len(items):
+            self._overflow()
+            items = items[:max(room, 0)]
+        top = self._top
+        for item in items:
+            top = Node(item, top)
+        self._top = top
+        self._size += len(items)
+        return len(items)
 
+    def pop(self) -> object | None:
+        if self._top is None:
+            return self._underflow()
         item = self._top.item
         self._top = self._top.next
         self._size -= 1
         return item
 
+    def pop_many(self, count) -> list:
+        if count > self._size:
+            self._underflow()
+            count = self._size
+        popped = []
+        top = self._top
+        for _ in range(count):
+            popped.append(top.item)
+            top = top.next
+        self._top = top
+        self._size -= len(popped)
+        return popped
+
     def peek(self) -> object | None:
-        if self.empty():
-            print('Empty Stack!')
-            return None
+        if self._top is None:
+            return self._underflow()
         return self._top.item
 
-    def __str__(self):
-        items = []
+    def __iter__(self):
         cur = self._top
-        while cur:
-            items.append(cur.item)
+        while cur is not None:
+            yield cur.item
             cur = cur.next
-        return f'Stack({items[::-1]})'
+
+    def __str__(self):
+        items = list(self)
+        items.reverse()
+        return f'Stack({items})'
+
+
+class ConcurrentStack(Stack):
+    # 여러 스레드가 함께 쓰는 스택: 비어 있으면 pop이, 가득 차면 push가 기다림
+    def __init__(self, max_size=Stack.MAX_SIZE, raise_errors=False):
+        super().__init__(max_size, raise_errors)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # 기다리는 스레드가 있을 때만 notify (notify 자체도 비용이 큼)
+        self._waiting_pops = 0
+        self._waiting_pushes = 0
+
+    def _has_room(self):
+        return self._max_size is None or len(self._items) < self._max_size
+
+    def _wait(self, condition, predicate, timeout, is_pop):
+        if is_pop:
+            self._waiting_pops += 1
+        else:
+            self._waiting_pushes += 1
+        try:
+            return condition.wait_for(predicate, timeout)
+        finally:
+            if is_pop:
+                self._waiting_pops -= 1
+            else:
+                self._waiting_pushes -= 1
+
+    # timeout 동안 자리가 나지 않으면 False (raise_errors면 OverflowError)
+    def push(self, item, block=True, timeout=None) -> bool:
+        with self._lock:
+            if not self._has_room():
+                if not block or not self._wait(self._not_full, self._has_room, timeout, False):
+                    return self._overflow()
+            self._items.append(item)
+            if self._waiting_pops:
+                self._not_empty.notify()
+            return True
+
+    # timeout 동안 값이 들어오지 않으면 None (raise_errors면 IndexError)
+    def pop(self, block=True, timeout=None) -> object | None:
+        with self._lock:
+            if not self._items:
+                if not block or not self._wait(self._not_empty, self.size, timeout, True):
+                    return self._underflow()
+            item = self._items.pop()
+            if self._waiting_pushes:
+                self._not_full.notify()
+            return item
+
+    def push_many(self, items) -> int:
+        items = list(items)
+        with self._lock:
+            pushed = super().push_many(items)
+            if self._waiting_pops:
+                self._not_empty.notify(pushed)
+            return pushed
+
+    def pop_many(self, count) -> list:
+        with self._lock:
+            popped = super().pop_many(count)
+            if self._waiting_pushes:
+                self._not_full.notify(len(popped))
+            return popped
+
+    def peek(self) -> object | None:
+        with self._lock:
+            return super().peek()
+
+    def __iter__(self):
+        with self._lock:
+            return iter(self._items[::-1])
+
+    def __str__(self):
+        with self._lock:
+            return super().__str__()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,7 +1,15 @@
+import hashlib
+import json
+import os
+
+import numpy as np
 import pandas as pd
 
 ATTR_FILE = 'abalone_attributes.txt'
 DATA_FILE = 'abalone.txt'
+CHUNK_SIZE = 100_000
+LABEL_COLUMN = 'Sex'
+CACHE_DIR = '.cache'
 
 
 def load_attributes(path):
@@ -23,6 +31,73 @@ def load_data(path, columns):
     except Exception as e:
         raise ValueError(f'Processing error: {e}')
 
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _cache_key(path, columns):
+    # 데이터 파일 내용에 더해 속성 파일에서 읽은 컬럼 순서와 dtype도 키에 넣음
+    # (속성 파일만 바뀌어도 예전 행렬이 새 컬럼 이름으로 나오지 않도록)
+    layout = json.dumps({'columns': columns, 'label': LABEL_COLUMN, 'features': 'float32'},
+                        ensure_ascii=False)
+    return hashlib.sha256((file_hash(path) + layout).encode('utf-8')).hexdigest()
+
+def _cache_paths(cache_dir, path, key):
+    stem = os.path.join(cache_dir, f'{os.path.basename(path)}-{key[:16]}')
+    return {part: f'{stem}.{part}.npy' for part in ('features', 'codes', 'categories')}
+
+def _save_cache(paths, labels, features):
+    os.makedirs(os.path.dirname(paths['features']), exist_ok=True)
+    arrays = {
+        'features': features,
+        'codes': labels.cat.codes.to_numpy(),
+        'categories': labels.cat.categories.to_numpy(dtype=str),
+    }
+    # 다 쓴 파일만 제자리로 옮겨 중간에 멈춰도 깨진 캐시가 남지 않음
+    for part, array in arrays.items():
+        temp_path = paths[part] + '.tmp'
+        with open(temp_path, 'wb') as f:
+            np.save(f, array)
+        os.replace(temp_path, paths[part])
+
+def _load_cache(paths):
+    if not all(os.path.exists(cache_path) for cache_path in paths.values()):
+        return None
+    # 특징 행렬은 메모리 매핑으로 열어 필요한 부분만 읽음
+    features = np.load(paths['features'], mmap_mode='r')
+    categories = np.load(paths['categories'])
+    labels = pd.Series(pd.Categorical.from_codes(np.load(paths['codes']), categories),
+                       name=LABEL_COLUMN)
+    return labels, features
+
+def load_typed(path, attr_path, cache_dir=None):
+    # (Sex category Series, float32 특징 행렬, 특징 컬럼 이름) 반환
+    columns = load_attributes(attr_path)
+    feature_cols = [col for col in columns if col != LABEL_COLUMN]
+    try:
+        if cache_dir is not None:
+            paths = _cache_paths(cache_dir, path, _cache_key(path, columns))
+            cached = _load_cache(paths)
+            if cached is not None:
+                return (*cached, feature_cols)
+
+        dtypes = {col: np.float32 for col in feature_cols}
+        dtypes[LABEL_COLUMN] = 'category'
+        df = pd.read_csv(path, header=None, names=columns, dtype=dtypes)
+    except FileNotFoundError:
+        raise FileNotFoundError('File open error.')
+    except Exception as e:
+        raise ValueError(f'Processing error: {e}')
+
+    labels = df[LABEL_COLUMN]
+    features = df[feature_cols].to_numpy(dtype=np.float32)
+    if cache_dir is not None:
+        _save_cache(paths, labels, features)
+    return labels, features, feature_cols
+
 
 def minmax_manual_scale(df):
     numeric_cols = df.select_dtypes(include='number').columns
@@ -39,18 +114,86 @@ def minmax_manual_scale(df):
             
     return df
 
+def _scale_block(df, columns, min_vals, max_vals, dtype):
+    values = df[columns].to_numpy(dtype=dtype)
+    range_vals = (max_vals - min_vals).astype(dtype)
+    constant = range_vals == 0
+    # 값이 모두 같은 컬럼은 0으로 나누지 않고 0.0으로 채움
+    scaled = (values - min_vals.astype(dtype)) / np.where(constant, 1, range_vals)
+    scaled[:, constant] = 0
+    return scaled
+
+def _with_columns(df, columns, values):
+    if len(columns) == len(df.columns):
+        return pd.DataFrame(values, index=df.index, columns=columns)
+    result = df.copy(deep=False)
+    result[columns] = values
+    return result
+
+def _bounds(df, columns):
+    # 숫자 컬럼이 없으면 agg가 실패하므로 빈 배열 두 개를 반환
+    if len(columns) == 0:
+        return np.empty((2, 0))
+    return df[columns].agg(['min', 'max']).to_numpy(dtype=np.float64)
+
+def minmax_scale(df, dtype=np.float64):
+    numeric_cols = df.select_dtypes(include='number').columns
+    if len(numeric_cols) == 0:
+        return df
+    # 모든 컬럼의 최소/최대를 한 번에 구하고 숫자 컬럼 전체를 행렬 하나로 변환
+    bounds = _bounds(df, numeric_cols)
+    scaled = _scale_block(df, numeric_cols, bounds[0], bounds[1], dtype)
+    return _with_columns(df, numeric_cols, scaled)
+
+
+class StreamingMinMaxScaler:
+    # 메모리에 다 올릴 수 없는 파일용: 1차로 청크마다 최소/최대를 모으고(fit), 2차로 변환
+    def __init__(self, dtype=np.float64):
+        self.dtype = dtype
+        self.columns = None
+        self.min_ = None
+        self.max_ = None
+
+    def partial_fit(self, df):
+        if self.columns is None:
+            self.columns = df.select_dtypes(include='number').columns
+        bounds = _bounds(df, self.columns)
+        if self.min_ is None:
+            self.min_, self.max_ = bounds[0], bounds[1]
+        else:
+            # fmin/fmax는 한쪽이 NaN(값 없는 청크)이면 다른 쪽 값을 씀
+            self.min_ = np.fmin(self.min_, bounds[0])
+            self.max_ = np.fmax(self.max_, bounds[1])
+        return self
+
+    def transform(self, df):
+        if self.columns is None:
+            raise ValueError('Scaler is not fitted.')
+        if len(self.columns) == 0:
+            return df
+        scaled = _scale_block(df, self.columns, self.min_, self.max_, self.dtype)
+        return _with_columns(df, self.columns, scaled)
+
+    def fit_csv(self, path, columns, chunksize=CHUNK_SIZE):
+        for chunk in pd.read_csv(path, header=None, names=columns, chunksize=chunksize):
+            self.partial_fit(chunk)
+        return self
+
+    def transform_csv(self, path, out_path, columns, chunksize=CHUNK_SIZE):
+        chunks = pd.read_csv(path, header=None, names=columns, chunksize=chunksize)
+        for i, chunk in enumerate(chunks):
+            self.transform(chunk).to_csv(out_path, mode='w' if i == 0 else 'a',
+                                         header=i == 0, index=False)
+        return out_path
+
 def main():
     try:
-        columns = load_attributes(ATTR_FILE)
-        df = load_data(DATA_FILE, columns)
-        print(df.shape)
-
-        df['label'] = df['Sex']
-        df = df.drop(columns=['Sex'])
-        print(df['label'].value_counts().to_dict())
+        labels, features, feature_cols = load_typed(DATA_FILE, ATTR_FILE, CACHE_DIR)
+        print((features.shape[0], features.shape[1] + 1))
+        print(labels.value_counts().to_dict())
 
-        data_to_scale = df.drop(columns=['label'])
-        scaled_data = minmax_manual_scale(data_to_scale)
+        data_to_scale = pd.DataFrame(features, columns=feature_cols, copy=False)
+        scaled_data = minmax_scale(data_to_scale, np.float32)
         print(scaled_data.describe().loc[['min', 'max']].round(6).to_dict())
 
     except (FileNotFoundError, UnicodeError) as e: